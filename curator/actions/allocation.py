@@ -93,7 +93,7 @@ class Allocation:
         )
         self.loggit.info('Updating index setting %s', self.settings)
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
             for lst in index_lists:
                 self.client.indices.put_settings(
                     index=to_csv(lst), settings=self.settings
@@ -52,7 +52,7 @@ class Close:
             self.index_list.indices,
         )
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
             for lst in index_lists:
                 lst_as_csv = to_csv(lst)
                 self.loggit.debug('CSV list of indices to close:  %s', lst_as_csv)
@@ -3,9 +3,11 @@
 import logging
 
 # pylint: disable=import-error
+from curator.exceptions import FailedExecution
 from curator.helpers.getters import get_indices
 from curator.helpers.testers import verify_index_list
 from curator.helpers.utils import chunk_index_list, report_failure, show_dry_run, to_csv
+from curator.pipeline import RequestPipeline
 
 
 class DeleteIndices:
@@ -33,6 +35,14 @@ class DeleteIndices:
         self.client = ilo.client
         #: String value of param ``master_timeout`` + ``s``, for seconds.
         self.master_timeout = str(master_timeout) + 's'
+        #: The :py:class:`~.curator.pipeline.RequestPipeline` which deletes
+        #: :py:attr:`index_list` in chunks, up to its ``max_concurrent_requests``
+        #: chunks at a time
+        self.pipeline = RequestPipeline(
+            self.__chunk_loop,
+            max_in_flight=ilo.max_concurrent_requests,
+            timeout=master_timeout,
+        )
         self.loggit = logging.getLogger('curator.actions.delete_indices')
         self.loggit.debug('master_timeout value: %s', self.master_timeout)
 
@@ -61,6 +71,24 @@ class DeleteIndices:
             retval = True
         return retval
 
+    def _still_present(self, indices):
+        """
+        Check only ``indices``, rather than listing every index in the cluster
+
+        :param indices: The indices just deleted
+        :type indices: list
+
+        :returns: Those of ``indices`` which still exist
+        :rtype: list
+        """
+        response = self.client.indices.get_settings(
+            index=to_csv(indices),
+            name='index.uuid',
+            ignore_unavailable=True,
+            allow_no_indices=True,
+        )
+        return [idx for idx in indices if idx in response]
+
     def __chunk_loop(self, chunk_list):
         """
         Loop through deletes 3 times to ensure they complete
@@ -73,10 +101,19 @@ class DeleteIndices:
         for count in range(1, 4):  # Try 3 times
             for i in working_list:
                 self.loggit.info("---deleting index %s", i)
-            self.client.indices.delete(
-                index=to_csv(working_list), master_timeout=self.master_timeout
+            # A request retried after the cluster rejected it as overloaded may
+            # find that some of its indices were deleted after all
+            response = self.client.indices.delete(
+                index=to_csv(working_list),
+                master_timeout=self.master_timeout,
+                ignore_unavailable=True,
+                allow_no_indices=True,
             )
-            result = [i for i in working_list if i in get_indices(self.client)]
+            if response is not None and response.get('acknowledged') is True:
+                # The master node has removed every index in the request
+                result = []
+            else:
+                result = self._still_present(working_list)
             if self._verify_result(result, count):
                 return
             working_list = result
@@ -100,9 +137,28 @@ class DeleteIndices:
         )
         self.loggit.info(msg)
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
-            for lst in index_lists:
-                self.__chunk_loop(lst)
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
+            self.pipeline.run(index_lists)
+            report = self.pipeline.report()
+            self.loggit.info(
+                'Deleted %s indices in %s requests over %.1fs (%.1f indices/sec). '
+                'Cluster state updates acknowledged in %.2fs on average, %.2fs at '
+                'most. %s requests throttled.',
+                report['indices'],
+                report['requests'],
+                report['seconds'],
+                report['indices_per_second'],
+                report['mean_latency'],
+                report['max_latency'],
+                report['throttled'],
+            )
+            # A single listing of the cluster, once every chunk is done
+            remaining = set(get_indices(self.client))
         # pylint: disable=broad-except
         except Exception as err:
             report_failure(err)
+        leftover = [idx for idx in self.index_list.indices if idx in remaining]
+        if leftover:
+            msg = f'Indices still present after deletion: {leftover}'
+            self.loggit.error(msg)
+            raise FailedExecution(msg)
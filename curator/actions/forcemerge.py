@@ -1,26 +1,44 @@
 """Forcemerge action class"""
 
 import logging
-from time import sleep
+from collections import defaultdict
+from time import monotonic, sleep
 
 # pylint: disable=import-error
-from curator.exceptions import MissingArgument
+from curator.exceptions import ActionTimeout, FailedExecution, MissingArgument
 from curator.helpers.testers import verify_index_list
-from curator.helpers.utils import report_failure, show_dry_run
+from curator.helpers.utils import report_failure, show_dry_run, to_csv
 
 
 class ForceMerge:
     """ForceMerge Action Class"""
 
-    def __init__(self, ilo, max_num_segments=None, delay=0):
+    def __init__(
+        self,
+        ilo,
+        max_num_segments=None,
+        delay=0,
+        max_merges_per_node=None,
+        wait_interval=3,
+        max_wait=-1,
+    ):
         """
         :param ilo: An IndexList Object
         :param max_num_segments: Number of segments per shard to forceMerge
         :param delay: Number of seconds to delay between forceMerge operations
+        :param max_merges_per_node: If set, merge indices in parallel, with at most
+            this many shards merging on any one node at the same time
+        :param wait_interval: Seconds to wait between checks on running merges,
+            if ``max_merges_per_node`` is set
+        :param max_wait: Maximum number of seconds to wait for each merge to
+            complete, if ``max_merges_per_node`` is set. ``-1`` waits indefinitely.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type max_num_segments: int
         :type delay: int
+        :type max_merges_per_node: int
+        :type wait_interval: int
+        :type max_wait: int
         """
         verify_index_list(ilo)
         if not max_num_segments:
@@ -35,6 +53,14 @@ class ForceMerge:
         self.max_num_segments = max_num_segments
         #: Object attribute that gets the value of param ``delay``.
         self.delay = delay
+        #: Object attribute that gets the value of param ``max_merges_per_node``.
+        self.max_merges_per_node = max_merges_per_node
+        #: Object attribute that gets the value of param ``wait_interval``, or
+        #: ``3`` if it is ``None``.
+        self.wait_interval = 3 if wait_interval is None else wait_interval
+        #: Object attribute that gets the value of param ``max_wait``, or ``-1`` if
+        #: it is ``None``.
+        self.max_wait = -1 if max_wait is None else max_wait
         self.loggit = logging.getLogger('curator.actions.forcemerge')
 
     def do_dry_run(self):
@@ -46,6 +72,124 @@ class ForceMerge:
             delay=self.delay,
         )
 
+    def _shard_nodes(self, indices):
+        """
+        :param indices: The indices to merge
+        :type indices: list
+
+        :returns: The number of started shard copies of each index on each node,
+            keyed by index name and then node name
+        :rtype: dict
+        """
+
+        def get_shards(chunk):
+            return self.client.cat.shards(
+                index=to_csv(chunk), h='index,node,state', format='json'
+            )
+
+        loads = {index: defaultdict(int) for index in indices}
+        for shards in self.index_list.chunker.call(indices, get_shards):
+            for shard in shards:
+                if shard['index'] in loads and shard['state'] == 'STARTED':
+                    loads[shard['index']][shard['node']] += 1
+        return loads
+
+    def _fits(self, load, busy):
+        """
+        :param load: The shard copies of an index on each node
+        :param busy: The shard copies being merged on each node
+
+        :type load: dict
+        :type busy: dict
+
+        :returns: ``True`` if merging the index keeps every node within
+            :py:attr:`max_merges_per_node`. An index with more shards on a node
+            than that fits only when nothing else is merging there.
+        :rtype: bool
+        """
+        return all(
+            busy[node] == 0 or busy[node] + count <= self.max_merges_per_node
+            for node, count in load.items()
+        )
+
+    def _merged(self, task_id, index_name, started):
+        """
+        :param task_id: The task of a forceMerge
+        :param index_name: The index being merged
+        :param started: The :py:func:`~time.monotonic` time the forceMerge began
+
+        :type task_id: str
+        :type index_name: str
+        :type started: float
+
+        :returns: ``True`` if the forceMerge has completed, otherwise ``False``
+        :rtype: bool
+        """
+        task_data = self.client.tasks.get(task_id=task_id)
+        if not task_data.get('completed'):
+            elapsed = monotonic() - started
+            if self.max_wait != -1 and elapsed >= self.max_wait:
+                raise ActionTimeout(
+                    f'forceMerge of index {index_name} failed to complete in the '
+                    f'max_wait period of {self.max_wait} seconds'
+                )
+            return False
+        if 'error' in task_data:
+            raise FailedExecution(
+                f'forceMerge of index {index_name} failed: {task_data["error"]}'
+            )
+        self.loggit.info('forceMerge of index %s completed', index_name)
+        return True
+
+    def _scheduled(self):
+        """
+        forceMerge the indices in :py:attr:`index_list` in parallel. Merges are
+        submitted without waiting for completion and tracked through the tasks API,
+        keeping at most :py:attr:`max_merges_per_node` shard copies merging on any
+        one node. Indices whose shards are on different nodes merge at the same
+        time. Indices with no started shards are skipped.
+        """
+        loads = self._shard_nodes(self.index_list.indices)
+        pending = []
+        for index_name in self.index_list.indices:
+            if loads[index_name]:
+                pending.append(index_name)
+            else:
+                self.loggit.warning(
+                    'Index %s has no started shards. Not forceMerging it', index_name
+                )
+        running = {}
+        busy = defaultdict(int)
+        while pending or running:
+            for index_name in list(pending):
+                load = loads[index_name]
+                if not self._fits(load, busy):
+                    continue
+                self.loggit.info(
+                    'forceMerging index %s to %s segments per shard on nodes %s',
+                    index_name,
+                    self.max_num_segments,
+                    sorted(load),
+                )
+                response = self.client.indices.forcemerge(
+                    index=index_name,
+                    max_num_segments=self.max_num_segments,
+                    wait_for_completion=False,
+                )
+                running[response['task']] = (index_name, monotonic())
+                for node, count in load.items():
+                    busy[node] += count
+                pending.remove(index_name)
+            sleep(self.wait_interval)
+            for task_id, (index_name, started) in list(running.items()):
+                if not self._merged(task_id, index_name, started):
+                    continue
+                del running[task_id]
+                for node, count in loads[index_name].items():
+                    busy[node] -= count
+                # The segment count is now out of date
+                self.index_list.invalidate_metadata([index_name])
+
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.IndicesClient.forcemerge` indices in
@@ -60,6 +204,9 @@ class ForceMerge:
         )
         self.loggit.info(msg)
         try:
+            if self.max_merges_per_node:
+                self._scheduled()
+                return
             for index_name in self.index_list.indices:
                 msg = (
                     f'forceMerging index {index_name} to {self.max_num_segments} '
@@ -69,6 +216,8 @@ class ForceMerge:
                 self.client.indices.forcemerge(
                     index=index_name, max_num_segments=self.max_num_segments
                 )
+                # The segment count is now out of date
+                self.index_list.invalidate_metadata([index_name])
                 if self.delay > 0:
                     self.loggit.info(
                         'Pausing for %s seconds before continuing...', self.delay
@@ -138,7 +138,7 @@ class IndexSettings:
         )
         self.loggit.info(msg)
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
             for lst in index_lists:
                 response = self.client.indices.put_settings(
                     index=to_csv(lst),
@@ -39,7 +39,7 @@ class Open:
         )
         self.loggit.info(msg)
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
             for lst in index_lists:
                 self.client.indices.open(index=to_csv(lst))
         # pylint: disable=broad-except
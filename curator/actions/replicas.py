@@ -71,7 +71,7 @@ class Replicas:
         )
         self.loggit.info(msg)
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
             for lst in index_lists:
                 self.client.indices.put_settings(
                     index=to_csv(lst), settings={'number_of_replicas': self.count}
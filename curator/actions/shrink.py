@@ -1,6 +1,9 @@
 """Reindex action class"""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 
 # pylint: disable=broad-except
 from curator.defaults.settings import DATA_NODE_ROLES
@@ -37,6 +40,7 @@ class Shrink:
         wait_for_completion=True,
         wait_interval=9,
         max_wait=-1,
+        max_shrink_nodes=1,
     ):
         """
         :param ilo: An IndexList Object
@@ -65,6 +69,9 @@ class Shrink:
         :param wait_for_completion: Wait for completion before returning.
         :param wait_interval: Seconds to wait between completion checks.
         :param max_wait: Maximum number of seconds to ``wait_for_completion``
+        :param max_shrink_nodes: If ``shrink_node`` is ``DETERMINISTIC``, shrink
+            indices on up to this many nodes at the same time. More than ``1``
+            requires ``wait_for_rebalance`` to be ``False``.
 
         :type ilo: :py:class:`~.curator.indexlist.IndexList`
         :type shrink_node: str
@@ -82,6 +89,7 @@ class Shrink:
         :type wait_for_completion: bool
         :type wait_interval: int
         :type max_wait: int
+        :type max_shrink_nodes: int
         """
         if node_filters is None:
             node_filters = {}
@@ -125,6 +133,19 @@ class Shrink:
         self.number_of_shards = number_of_shards
         #: Object attribute that gets the value of param ``wait_for_active_shards``.
         self.wait_for_active_shards = wait_for_active_shards
+        #: Object attribute that gets the value of param ``max_shrink_nodes``.
+        self.max_shrink_nodes = max_shrink_nodes
+        #: Whether indices are shrunk on several nodes at the same time, which is
+        #: when ``shrink_node`` is ``DETERMINISTIC`` and ``max_shrink_nodes`` is
+        #: greater than ``1``.
+        self.multi_node = shrink_node == 'DETERMINISTIC' and max_shrink_nodes > 1
+        # Several nodes route and shrink at the same time, so the cluster is not
+        # expected to be balanced until every node is done
+        if self.multi_node and wait_for_rebalance:
+            raise ConfigurationError(
+                'wait_for_rebalance must be False when max_shrink_nodes is greater '
+                'than 1'
+            )
 
         #: Object attribute that represents the target node for shrinking.
         self.shrink_node_name = None
@@ -227,15 +248,13 @@ class Shrink:
             'total'
         ]['available_in_bytes']
 
-    def most_available_node(self):
+    def _qualified_nodes(self):
         """
-        Determine which data node name has the most available free space, and meets
-        the other node filters settings.
+        :returns: The ``(node_id, name, available_in_bytes)`` of each data node
+            which meets the node filters settings
+        :rtype: list
         """
-        mvn_avail = 0
-        # mvn_total = 0
-        mvn_name = None
-        mvn_id = None
+        qualified = []
         nodes = self.client.nodes.stats()['nodes']
         for node_id in nodes:
             name = nodes[node_id]['name']
@@ -246,6 +265,19 @@ class Shrink:
                 self.loggit.debug('Node "%s" is not a data node', name)
                 continue
             value = nodes[node_id]['fs']['total']['available_in_bytes']
+            qualified.append((node_id, name, value))
+        return qualified
+
+    def most_available_node(self):
+        """
+        Determine which data node name has the most available free space, and meets
+        the other node filters settings.
+        """
+        mvn_avail = 0
+        # mvn_total = 0
+        mvn_name = None
+        mvn_id = None
+        for node_id, name, value in self._qualified_nodes():
             if value > mvn_avail:
                 mvn_name = name
                 mvn_id = node_id
@@ -292,10 +324,14 @@ class Shrink:
         unblock = {'index.blocks.write': False}
         self.client.indices.put_settings(index=idx, settings=unblock)
 
+    def _padded_size(self, idx):
+        # Room for 2x the primaries of the index
+        size = index_size(self.client, idx, value='primaries')
+        return (size * 2) + (32 * 1024)
+
     def _check_space(self, idx, dry_run=False):
         # Disk watermark calculation is already baked into `available_in_bytes`
-        size = index_size(self.client, idx, value='primaries')
-        padded = (size * 2) + (32 * 1024)
+        padded = self._padded_size(idx)
         if padded < self.shrink_node_avail:
             msg = (
                 f'Sufficient space available for 2x the size of index "{idx}". '
@@ -424,7 +460,13 @@ class Shrink:
         self.index_list.filter_by_shards(number_of_shards=self.number_of_shards)
         self.index_list.empty_list_check()
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
+            if self.multi_node:
+                assigned = self._assign_nodes(self.index_list.indices, dry_run=True)
+                for name, indices in assigned.items():
+                    self.loggit.info(
+                        'DRY-RUN: Shrinking on node "%s": %s', name, indices
+                    )
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
             for lst in index_lists:
                 for idx in lst:  # Shrink can only be done one at a time...
                     target = self._shrink_target(idx)
@@ -476,117 +518,209 @@ class Shrink:
         )
         self.loggit.info(msg)
         try:
-            index_lists = chunk_index_list(self.index_list.indices)
+            if self.multi_node:
+                self._pipelined()
+                return
+            index_lists = chunk_index_list(self.index_list.indices, client=self.client)
             for lst in index_lists:
                 for idx in lst:  # Shrink can only be done one at a time...
-                    target = self._shrink_target(idx)
-                    self.loggit.info(
-                        'Source index: %s -- Target index: %s', idx, target
-                    )
-                    # Pre-check ensures disk space available for each pass of the loop
-                    self.pre_shrink_check(idx)
-                    # Route the index to the shrink node
-                    self.loggit.info(
-                        'Moving shards to shrink node: "%s"', self.shrink_node_name
+                    self._shrink_index(idx)
+        except Exception as err:
+            report_failure(err)
+
+    def _shrink_index(self, idx):
+        """
+        Shrink a single index, from the pre-shrink check through deleting or
+        unrouting the source index
+
+        :param idx: The index to shrink
+        :type idx: str
+        """
+        try:
+            target = self._shrink_target(idx)
+            self.loggit.info('Source index: %s -- Target index: %s', idx, target)
+            # Pre-check ensures disk space available for each pass of the loop
+            self.pre_shrink_check(idx)
+            # Route the index to the shrink node
+            self.loggit.info(
+                'Moving shards to shrink node: "%s"', self.shrink_node_name
+            )
+            self.route_index(idx, 'require', '_name', self.shrink_node_name)
+            # Ensure a copy of each shard is present
+            self._check_all_shards(idx)
+            # Block writes on index
+            self._block_writes(idx)
+            # Do final health check. Other nodes may be relocating the shards of
+            # other indices at the same time, so then check this index only.
+            if self.multi_node:
+                healthy = health_check(self.client, index=idx, status='green')
+                scope = f'Health of index "{idx}"'
+            else:
+                healthy = health_check(self.client, status='green')
+                scope = 'Cluster health'
+            if not healthy:
+                msg = f'Unable to proceed with shrink action. {scope} is not "green"'
+                raise ActionError(msg)
+            # Do the shrink
+            msg = (
+                f'Shrinking index "{idx}" to "{target}" with settings: '
+                f'{self.settings}, wait_for_active_shards='
+                f'{self.wait_for_active_shards}'
+            )
+            self.loggit.info(msg)
+            try:
+                self.client.indices.shrink(
+                    index=idx,
+                    target=target,
+                    settings=self.settings,
+                    wait_for_active_shards=self.wait_for_active_shards,
+                )
+                # Wait for it to complete
+                if self.wfc:
+                    self.loggit.debug(
+                        'Wait for shards to complete allocation for index: %s',
+                        target,
                     )
-                    self.route_index(idx, 'require', '_name', self.shrink_node_name)
-                    # Ensure a copy of each shard is present
-                    self._check_all_shards(idx)
-                    # Block writes on index
-                    self._block_writes(idx)
-                    # Do final health check
-                    if not health_check(self.client, status='green'):
-                        msg = (
-                            'Unable to proceed with shrink action. '
-                            'Cluster health is not "green"'
+                    if self.wait_for_rebalance:
+                        wait_for_it(
+                            self.client,
+                            'shrink',
+                            wait_interval=self.wait_interval,
+                            max_wait=self.max_wait,
                         )
-                        raise ActionError(msg)
-                    # Do the shrink
-                    msg = (
-                        f'Shrinking index "{idx}" to "{target}" with settings: '
-                        f'{self.settings}, wait_for_active_shards='
-                        f'{self.wait_for_active_shards}'
-                    )
-                    self.loggit.info(msg)
-                    try:
-                        self.client.indices.shrink(
-                            index=idx,
-                            target=target,
-                            settings=self.settings,
-                            wait_for_active_shards=self.wait_for_active_shards,
+                    else:
+                        wait_for_it(
+                            self.client,
+                            'relocate',
+                            index=target,
+                            wait_interval=self.wait_interval,
+                            max_wait=self.max_wait,
                         )
-                        # Wait for it to complete
-                        if self.wfc:
-                            self.loggit.debug(
-                                'Wait for shards to complete allocation for index: %s',
-                                target,
-                            )
-                            if self.wait_for_rebalance:
-                                wait_for_it(
-                                    self.client,
-                                    'shrink',
-                                    wait_interval=self.wait_interval,
-                                    max_wait=self.max_wait,
-                                )
-                            else:
-                                wait_for_it(
-                                    self.client,
-                                    'relocate',
-                                    index=target,
-                                    wait_interval=self.wait_interval,
-                                    max_wait=self.max_wait,
-                                )
-                    except Exception as exc:
-                        if self.client.indices.exists(index=target):
-                            msg = (
-                                f'Deleting target index "{target}" due to failure '
-                                f'to complete shrink'
-                            )
-                            self.loggit.error(msg)
-                            self.client.indices.delete(index=target)
-                        raise ActionError(
-                            f'Unable to shrink index "{idx}" -- Error: {exc}'
-                        ) from exc
-                    self.loggit.info(
-                        'Index "%s" successfully shrunk to "%s"', idx, target
+            except Exception as exc:
+                if self.client.indices.exists(index=target):
+                    msg = (
+                        f'Deleting target index "{target}" due to failure '
+                        f'to complete shrink'
                     )
-                    # Do post-shrink steps
-                    # Unblock writes on index (just in case)
-                    self._unblock_writes(idx)
-                    # Post-allocation, if enabled
-                    if self.post_allocation:
-                        submsg = (
-                            f"index.routing.allocation."
-                            f"{self.post_allocation['allocation_type']}."
-                            f"{self.post_allocation['key']}:"
-                            f"{self.post_allocation['value']}"
-                        )
-                        msg = (
-                            f'Applying post-shrink allocation rule "{submsg}" '
-                            f'to index "{target}"'
-                        )
-                        self.loggit.info(msg)
-                        self.route_index(
-                            target,
-                            self.post_allocation['allocation_type'],
-                            self.post_allocation['key'],
-                            self.post_allocation['value'],
-                        )
-                    # Copy aliases, if flagged
-                    if self.copy_aliases:
-                        self.loggit.info('Copy source index aliases "%s"', idx)
-                        self.do_copy_aliases(idx, target)
-                    # Delete, if flagged
-                    if self.delete_after:
-                        self.loggit.info('Deleting source index "%s"', idx)
-                        self.client.indices.delete(index=idx)
-                    else:  # Let's unset the routing we applied here.
-                        self.loggit.info(
-                            'Unassigning routing for source index: "%s"', idx
-                        )
-                        self.route_index(idx, 'require', '_name', '')
-
-        except Exception as err:
+                    self.loggit.error(msg)
+                    self.client.indices.delete(index=target)
+                raise ActionError(
+                    f'Unable to shrink index "{idx}" -- Error: {exc}'
+                ) from exc
+            self.loggit.info('Index "%s" successfully shrunk to "%s"', idx, target)
+            # Do post-shrink steps
+            # Unblock writes on index (just in case)
+            self._unblock_writes(idx)
+            # Post-allocation, if enabled
+            if self.post_allocation:
+                submsg = (
+                    f"index.routing.allocation."
+                    f"{self.post_allocation['allocation_type']}."
+                    f"{self.post_allocation['key']}:"
+                    f"{self.post_allocation['value']}"
+                )
+                msg = (
+                    f'Applying post-shrink allocation rule "{submsg}" '
+                    f'to index "{target}"'
+                )
+                self.loggit.info(msg)
+                self.route_index(
+                    target,
+                    self.post_allocation['allocation_type'],
+                    self.post_allocation['key'],
+                    self.post_allocation['value'],
+                )
+            # Copy aliases, if flagged
+            if self.copy_aliases:
+                self.loggit.info('Copy source index aliases "%s"', idx)
+                self.do_copy_aliases(idx, target)
+            # Delete, if flagged
+            if self.delete_after:
+                self.loggit.info('Deleting source index "%s"', idx)
+                self.client.indices.delete(index=idx)
+            else:  # Let's unset the routing we applied here.
+                self.loggit.info('Unassigning routing for source index: "%s"', idx)
+                self.route_index(idx, 'require', '_name', '')
+        except Exception:
             # Just in case it fails after attempting to meet this condition
             self._unblock_writes(idx)
-            report_failure(err)
+            raise
+
+    def _assign_nodes(self, indices, dry_run=False):
+        """
+        Assign ``indices`` to the :py:attr:`max_shrink_nodes` qualified nodes with
+        the most available space. The largest indices are assigned first, each to
+        the node with the most space left after those already assigned to it, among
+        the nodes with room left for 2x the size of the index.
+
+        :param indices: The indices to shrink
+        :param dry_run: Only log an index with no room on any node
+
+        :type indices: list
+        :type dry_run: bool
+
+        :returns: The indices to shrink on each node, keyed by node name
+        :rtype: dict
+        """
+        nodes = sorted(self._qualified_nodes(), key=lambda node: node[2], reverse=True)
+        free = {name: value for _, name, value in nodes[: self.max_shrink_nodes]}
+        sizes = {idx: self._padded_size(idx) for idx in indices}
+        assigned = {name: [] for name in free}
+        for idx in sorted(indices, key=lambda idx: sizes[idx], reverse=True):
+            fits = [name for name in free if sizes[idx] < free[name]]
+            if not fits:
+                self.__log_action(
+                    f'Insufficient space available for 2x the size of index "{idx}" '
+                    f'on any shrink node. Required: {sizes[idx]}, available: {free}',
+                    dry_run,
+                )
+                continue
+            name = max(fits, key=lambda name: free[name])
+            assigned[name].append(idx)
+            free[name] -= sizes[idx]
+        return {name: idxs for name, idxs in assigned.items() if idxs}
+
+    def _shrink_on_node(self, name, indices, failed):
+        """
+        Shrink ``indices`` one at a time on node ``name``, stopping early if
+        ``failed`` is set by another node
+
+        :param name: The shrink node name
+        :param indices: The indices assigned to the node
+        :param failed: Set when shrinking fails on any node
+
+        :type name: str
+        :type indices: list
+        :type failed: :py:class:`~.threading.Event`
+        """
+        worker = copy(self)
+        worker.shrink_node = name
+        for idx in indices:
+            if failed.is_set():
+                self.loggit.info('Not shrinking index "%s" after a failure', idx)
+                continue
+            # Qualify the node again, to refresh its available space
+            worker.shrink_node_name = None
+            try:
+                worker._shrink_index(idx)
+            except Exception:
+                failed.set()
+                raise
+
+    def _pipelined(self):
+        """
+        Shrink the indices in :py:attr:`index_list` on up to
+        :py:attr:`max_shrink_nodes` nodes at the same time, as assigned by
+        :py:meth:`_assign_nodes`. Each node shrinks one index at a time.
+        """
+        assigned = self._assign_nodes(self.index_list.indices)
+        for name, indices in assigned.items():
+            self.loggit.info('Shrinking on node "%s": %s', name, indices)
+        failed = threading.Event()
+        with ThreadPoolExecutor(max_workers=max(1, len(assigned))) as executor:
+            futures = [
+                executor.submit(self._shrink_on_node, name, indices, failed)
+                for name, indices in assigned.items()
+            ]
+        for future in futures:
+            future.result()
@@ -2,9 +2,13 @@
 
 import logging
 import re
+from time import sleep
+from elasticsearch8.exceptions import ApiError, TransportError
 from es_client.helpers.utils import ensure_list
+from curator.chunker import RequestChunker
+from curator.defaults.settings import SNAPSHOT_DELETE_BATCH
 from curator.helpers.date_ops import parse_datemath, parse_date_pattern
-from curator.helpers.getters import get_indices
+from curator.helpers.getters import get_indices, get_repository
 from curator.helpers.testers import (
     repository_exists,
     snapshot_running,
@@ -232,6 +236,52 @@ class DeleteSnapshots:
         self.repository = slo.repository
         self.loggit = logging.getLogger('curator.actions.delete_snapshots')
 
+    def _batch_size(self):
+        """
+        :returns: The most snapshots to delete in one request, by the type of
+            :py:attr:`repository`, from
+            :py:data:`~.curator.defaults.settings.SNAPSHOT_DELETE_BATCH`
+        :rtype: int
+        """
+        try:
+            repo = get_repository(self.client, self.repository)[self.repository]
+            repo_type = repo['type']
+        except (CuratorException, KeyError, TypeError):
+            repo_type = 'default'
+        self.loggit.debug('Repository %s is of type %s', self.repository, repo_type)
+        return SNAPSHOT_DELETE_BATCH.get(repo_type, SNAPSHOT_DELETE_BATCH['default'])
+
+    def _delete_batch(self, snapshots):
+        """
+        Delete ``snapshots`` in a single request. If another snapshot operation
+        blocks the delete, retry up to :py:attr:`retry_count` times, pausing
+        :py:attr:`retry_interval` seconds between retries.
+
+        :param snapshots: The snapshot names
+        :type snapshots: list
+        """
+        for attempt in range(self.retry_count + 1):
+            self.loggit.info('Deleting snapshots %s...', snapshots)
+            try:
+                self.client.snapshot.delete(
+                    repository=self.repository, snapshot=to_csv(snapshots)
+                )
+                return
+            except (ApiError, TransportError) as err:
+                text = f'{err} {getattr(err, "body", "")}'
+                if 'concurrent_snapshot_execution_exception' not in text:
+                    raise
+                if attempt >= self.retry_count:
+                    raise
+                self.loggit.warning(
+                    'Another snapshot operation is in progress. Retrying in %s '
+                    'seconds (retry %s of %s)',
+                    self.retry_interval,
+                    attempt + 1,
+                    self.retry_count,
+                )
+                sleep(self.retry_interval)
+
     def do_dry_run(self):
         """Log what the output would be, but take no action."""
         self.loggit.info('DRY-RUN MODE.  No changes will be made.')
@@ -248,8 +298,10 @@ class DeleteSnapshots:
     def do_action(self):
         """
         :py:meth:`~.elasticsearch.client.SnapshotClient.delete` snapshots in
-        :py:attr:`snapshot_list`. Retry up to :py:attr:`retry_count` times, pausing
-        :py:attr:`retry_interval` seconds between retries.
+        :py:attr:`snapshot_list`, many in each request. Requests are limited to
+        :py:meth:`_batch_size` snapshots, and to the length of a request URL. Retry
+        up to :py:attr:`retry_count` times, pausing :py:attr:`retry_interval`
+        seconds between retries.
         """
         self.snapshot_list.empty_list_check()
         msg = (
@@ -258,9 +310,13 @@ class DeleteSnapshots:
         )
         self.loggit.info(msg)
         try:
-            for snap in self.snapshot_list.snapshots:
-                self.loggit.info('Deleting snapshot %s...', snap)
-                self.client.snapshot.delete(repository=self.repository, snapshot=snap)
+            snapshots = self.snapshot_list.snapshots
+            size = self._batch_size()
+            chunker = RequestChunker.for_client(self.client)
+            for start in range(0, len(snapshots), size):
+                # Split further by URL length, retrying with smaller requests
+                # if the cluster rejects one as too long
+                chunker.call(snapshots[start : start + size], self._delete_batch)
         # pylint: disable=broad-except
         except Exception as err:
             report_failure(err)
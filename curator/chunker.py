@@ -0,0 +1,210 @@
+"""Request chunking by encoded size
+
+Requests that name many indices, such as ``GET /<index,index,...>/_stats``, are
+split so that each request stays within the HTTP limits of the cluster. Elasticsearch
+rejects a request line longer than ``http.max_initial_line_length`` (``4kb`` by
+default) with a ``too_long_http_line_exception``, and a proxy in front of the cluster
+may reject one with a ``413``.
+
+A :py:class:`RequestChunker` measures each index name as it is encoded in the URL.
+When a request is rejected for its size, the chunker lowers its limit below the
+size of the rejected request, splits that request and retries it. The lowered
+limit is remembered for the cluster, so later requests on the same connection are
+sized correctly from the start.
+"""
+
+import logging
+import weakref
+from urllib.parse import quote
+
+from elasticsearch8.exceptions import ApiError, TransportError
+
+#: The default number of encoded bytes of index names per request. This leaves
+#: room in the default ``4kb`` request line for the method, the API path, query
+#: parameters and protocol version.
+DEFAULT_MAX_BYTES = 3840
+
+#: Never lower the limit below this many bytes. A single index name longer than
+#: the limit is still sent on its own.
+MIN_MAX_BYTES = 256
+
+# The learned limits, keyed by the transport of the client, which every copy of a
+# client made by ``client.options()`` shares
+_LEARNED = weakref.WeakKeyDictionary()
+
+
+def encoded_size(name):
+    """
+    :param name: An index name
+    :type name: str
+
+    :returns: The number of bytes ``name`` takes up in a request URL
+    :rtype: int
+    """
+    # The same quoting the client applies to path parts
+    return len(quote(name, ',*'))
+
+
+def too_long(err):
+    """
+    :param err: An exception raised by a client request
+    :type err: :py:exc:`Exception`
+
+    :returns: ``True`` if the request was rejected for being too long
+    :rtype: bool
+    """
+    if getattr(err, 'status_code', None) == 413:
+        return True
+    text = str(err)
+    if 'too_long_http_line' in text or 'too_long_frame' in text:
+        return True
+    # Errors raised by the transport, rather than returned by Elasticsearch
+    return '413' in str(getattr(err, 'errors', ''))
+
+
+class RequestChunker:
+    """
+    Split index name lists into requests of at most :py:attr:`max_bytes` encoded
+    bytes each
+
+    :param max_bytes: The starting limit, in encoded bytes of index names per
+        request
+    :param transport: The transport of the client, under which a lowered limit
+        is remembered. Use :py:meth:`for_client` rather than passing this.
+
+    :type max_bytes: int
+    :type transport: :py:class:`~.elastic_transport.Transport`
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, transport=None):
+        self.loggit = logging.getLogger('curator.chunker')
+        #: The most encoded bytes of index names per request.
+        #: **Type:** :py:class:`int`
+        self.max_bytes = max_bytes
+        self._transport = transport
+
+    @classmethod
+    def for_client(cls, client):
+        """
+        :param client: A client connection object
+        :type client: :py:class:`~.elasticsearch.Elasticsearch`
+
+        :returns: A chunker that starts from, and updates, the limit learned for
+            the cluster ``client`` is connected to
+        :rtype: :py:class:`RequestChunker`
+        """
+        transport = getattr(client, 'transport', None)
+        try:
+            learned = _LEARNED.get(transport, DEFAULT_MAX_BYTES)
+        except TypeError:
+            # Not weakly referenceable, so nothing can be remembered
+            transport, learned = None, DEFAULT_MAX_BYTES
+        return cls(max_bytes=learned, transport=transport)
+
+    def chunks(self, indices):
+        """
+        :param indices: The index names
+        :type indices: list
+
+        :returns: ``indices`` in order, split into lists which each fit in
+            :py:attr:`max_bytes` when joined with commas. Empty if ``indices`` is
+            empty.
+        :rtype: list
+        """
+        chunks = []
+        chunk = []
+        size = 0
+        for index in indices:
+            # The separating comma counts too
+            needed = encoded_size(index) + (1 if chunk else 0)
+            if chunk and size + needed > self.max_bytes:
+                chunks.append(chunk)
+                chunk = []
+                size = 0
+                needed -= 1
+            chunk.append(index)
+            size += needed
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def rejected(self, indices):
+        """
+        Lower :py:attr:`max_bytes` below the size of a rejected request, and
+        remember it for the cluster
+
+        :param indices: The index names of the rejected request
+        :type indices: list
+
+        :returns: ``True`` if the request can be split further, otherwise ``False``
+        :rtype: bool
+        """
+        if len(indices) < 2:
+            return False
+        size = sum(encoded_size(index) for index in indices) + len(indices) - 1
+        limit = max(MIN_MAX_BYTES, min(self.max_bytes, size) // 2)
+        if limit < self.max_bytes:
+            self.loggit.debug(
+                'Request for %s bytes of index names rejected. Limit lowered from '
+                '%s to %s bytes',
+                size,
+                self.max_bytes,
+                limit,
+            )
+            self.max_bytes = limit
+            if self._transport is not None:
+                _LEARNED[self._transport] = limit
+        return True
+
+    def split(self, indices):
+        """
+        Split the index names of a request rejected for its size, lowering
+        :py:attr:`max_bytes` with :py:meth:`rejected`
+
+        :param indices: The index names of the rejected request
+        :type indices: list
+
+        :returns: ``indices`` in at least two chunks, or an empty list if a single
+            index cannot be split
+        :rtype: list
+        """
+        if not self.rejected(indices):
+            return []
+        parts = self.chunks(indices)
+        if len(parts) < 2:
+            # The limit is already at its floor, so split down the middle
+            half = len(indices) // 2
+            parts = [indices[:half], indices[half:]]
+        return parts
+
+    def call(self, indices, func, rejected=False):
+        """
+        Call ``func`` with each chunk of ``indices``. A chunk rejected for its size
+        is split with the lowered limit and retried.
+
+        :param indices: The index names
+        :param func: The function to call with each list of index names
+        :param rejected: Whether a single request for all of ``indices`` has
+            already been rejected for its size
+
+        :type indices: list
+        :type func: function
+        :type rejected: bool
+
+        :returns: The return value of ``func`` for each chunk it accepted
+        :rtype: list
+        """
+        results = []
+        pending = self.split(indices) if rejected else self.chunks(indices)
+        while pending:
+            chunk = pending.pop(0)
+            try:
+                results.append(func(chunk))
+            except (ApiError, TransportError) as err:
+                if not too_long(err):
+                    raise
+                split = self.split(chunk)
+                if not split:
+                    raise
+                pending[:0] = split
+        return results
@@ -2,6 +2,7 @@
 
 import sys
 import logging
+from copy import deepcopy
 import click
 from es_client.defaults import OPTION_DEFAULTS
 from es_client.helpers.config import (
@@ -26,6 +27,8 @@ from curator.defaults.settings import (
 )
 from curator.exceptions import NoIndices, NoSnapshots
 from curator.helpers.testers import ilm_policy_check
+from curator.metadata_cache import MetadataCache
+from curator.session import MODIFYING_ACTIONS, MetadataSession
 from curator._version import __version__
 
 ONOFF = {'on': '', 'off': 'no-'}
@@ -103,16 +106,26 @@ def exception_handler(action_def, err):
             sys.exit(1)
 
 
-def process_action(client, action_def, dry_run=False):
+def process_action(
+    client, action_def, dry_run=False, session=None, metadata_cache=None
+):
     """
     Do the ``action`` in ``action_def.action``, using the associated options and
     any ``kwargs``.
 
     :param client: A client connection object
     :param action_def: The ``action`` object
+    :param dry_run: Only log what would have been done
+    :param session: Index metadata shared with the other actions in the action file
+    :param metadata_cache: The on-disk metadata cache of the cluster, shared with
+        the other actions in the action file. Only used if the action enables
+        ``metadata_cache``, and built from ``client`` if not given.
 
     :type client: :py:class:`~.elasticsearch.Elasticsearch`
     :type action_def: :py:class:`~.curator.classdef.ActionDef`
+    :type dry_run: bool
+    :type session: :py:class:`~.curator.session.MetadataSession`
+    :type metadata_cache: :py:class:`~.curator.metadata_cache.MetadataCache`
     :rtype: None
     """
     logger = logging.getLogger(__name__)
@@ -130,6 +143,20 @@ def process_action(client, action_def, dry_run=False):
     # Pop out the search_pattern option, if present.
     ptrn = mykwargs.pop('search_pattern', '*')
     hidn = mykwargs.pop('include_hidden', False)
+    mcr = mykwargs.pop('max_concurrent_requests', 1)
+    use_cache = mykwargs.pop('metadata_cache', False)
+    cache_ttl = mykwargs.pop('metadata_cache_ttl', None)
+    listkw = {
+        'search_pattern': ptrn,
+        'include_hidden': hidn,
+        'max_concurrent_requests': mcr,
+        'metadata_cache': None,
+        'session': session,
+    }
+    if use_cache and action_def.action not in snapshot_actions():
+        if metadata_cache is None:
+            metadata_cache = MetadataCache.from_client(client)
+        listkw['metadata_cache'] = metadata_cache.with_ttl(cache_ttl)
 
     logger.debug('Action kwargs: %s', mykwargs)
     logger.debug('Post search_pattern & include_hidden Action kwargs: %s', mykwargs)
@@ -139,12 +166,8 @@ def process_action(client, action_def, dry_run=False):
     if action_def.action == 'alias':
         # Special behavior for this action, as it has 2 index lists
         action_def.instantiate('action_cls', **mykwargs)
-        action_def.instantiate(
-            'alias_adds', client, search_pattern=ptrn, include_hidden=hidn
-        )
-        action_def.instantiate(
-            'alias_removes', client, search_pattern=ptrn, include_hidden=hidn
-        )
+        action_def.instantiate('alias_adds', client, **listkw)
+        action_def.instantiate('alias_removes', client, **listkw)
         if 'remove' in action_def.action_dict:
             logger.debug('Removing indices from alias "%s"', action_def.options['name'])
             action_def.alias_removes.iterate_filters(action_def.action_dict['remove'])
@@ -168,9 +191,7 @@ def process_action(client, action_def, dry_run=False):
                 'list_obj', client, repository=action_def.options['repository']
             )
         else:
-            action_def.instantiate(
-                'list_obj', client, search_pattern=ptrn, include_hidden=hidn
-            )
+            action_def.instantiate('list_obj', client, **listkw)
         action_def.list_obj.iterate_filters({'filters': action_def.filters})
         logger.debug('Pre Instantiation Action kwargs: %s', mykwargs)
         action_def.instantiate('action_cls', action_def.list_obj, **mykwargs)
@@ -179,7 +200,45 @@ def process_action(client, action_def, dry_run=False):
         action_def.action_cls.do_dry_run()
     else:
         logger.debug('Doing the action here.')
-        action_def.action_cls.do_action()
+        try:
+            action_def.action_cls.do_action()
+        except Exception:
+            invalidate_touched(action_def)
+            if session:
+                session.action_done(action_def.action, failed=True)
+            raise
+        invalidate_touched(action_def)
+        if session:
+            session.action_done(action_def.action, touched_indices(action_def))
+
+
+def invalidate_touched(action_def):
+    """
+    Forget the metadata the action may have changed about the indices it acted
+    on, both in its index list and in the on-disk metadata cache, which was saved
+    before the action ran
+
+    :param action_def: The ``action`` object, after the action is done or failed
+    :type action_def: :py:class:`~.curator.classdef.ActionDef`
+    """
+    if action_def.action in MODIFYING_ACTIONS:
+        action_def.list_obj.invalidate_metadata(touched_indices(action_def))
+
+
+def touched_indices(action_def):
+    """
+    :param action_def: The ``action`` object, after the action is done
+    :type action_def: :py:class:`~.curator.classdef.ActionDef`
+
+    :returns: The indices the action acted on
+    :rtype: list
+    """
+    if action_def.action == 'alias':
+        return action_def.alias_adds.indices + action_def.alias_removes.indices
+    no_list = ['cluster_routing', 'create_index', 'rollover', *snapshot_actions()]
+    if action_def.action in no_list:
+        return []
+    return list(action_def.list_obj.indices)
 
 
 def run(ctx: click.Context) -> None:
@@ -193,6 +252,12 @@ def run(ctx: click.Context) -> None:
     logger = logging.getLogger(__name__)
     logger.debug('action_file: %s', ctx.params['action_file'])
     all_actions = ActionsFile(ctx.params['action_file'])
+    # Index metadata collected by one action is reused by the actions that follow
+    session = MetadataSession()
+    client = None
+    client_settings = None
+    # Built on first use, and only rebuilt along with the client
+    metadata_cache = None
     for idx in sorted(list(all_actions.actions.keys())):
         action_def = all_actions.actions[idx]
         # Skip to next action if 'disabled'
@@ -206,33 +271,45 @@ def run(ctx: click.Context) -> None:
             continue
         logger.info('Preparing Action ID: %s, "%s"', idx, action_def.action)
 
-        # Override the timeout, if specified, otherwise use the default.
-        if action_def.timeout_override:
-            ctx.obj['configdict']['elasticsearch']['client'][
-                'request_timeout'
-            ] = action_def.timeout_override
-
-        # Create a client object for each action...
-        logger.info('Creating client object and testing connection')
+        # One client, and its connection pool, serves every action. It is only
+        # rebuilt if the connection settings have changed since it was built.
+        settings = deepcopy(ctx.obj['configdict'])
+        if client is None or settings != client_settings:
+            logger.info('Creating client object and testing connection')
+            try:
+                client = get_client(
+                    configdict=ctx.obj['configdict'],
+                    version_max=VERSION_MAX,
+                    version_min=VERSION_MIN,
+                )
+                client_settings = settings
+                metadata_cache = None
+            except ClientException as exc:
+                # No matter where logging is set to go, make sure we dump these
+                # messages to the CLI
+                click.echo('Unable to establish client connection to Elasticsearch!')
+                click.echo(f'Exception: {exc}')
+                sys.exit(1)
+            except Exception as other:
+                logger.debug('Fatal exception encountered: %s', other)
+        else:
+            logger.debug('Reusing the existing client connection')
 
-        try:
-            client = get_client(
-                configdict=ctx.obj['configdict'],
-                version_max=VERSION_MAX,
-                version_min=VERSION_MIN,
-            )
-        except ClientException as exc:
-            # No matter where logging is set to go, make sure we dump these messages to
-            # the CLI
-            click.echo('Unable to establish client connection to Elasticsearch!')
-            click.echo(f'Exception: {exc}')
-            sys.exit(1)
-        except Exception as other:
-            logger.debug('Fatal exception encountered: %s', other)
+        # Override the timeout of each request in this action, if specified,
+        # otherwise use the default. The connection pool is shared.
+        action_client = client
+        if action_def.timeout_override:
+            action_client = client.options(request_timeout=action_def.timeout_override)
 
         # Filter ILM indices unless expressly permitted
-        if ilm_action_skip(client, action_def):
+        if ilm_action_skip(action_client, action_def):
             continue
+        if (
+            metadata_cache is None
+            and action_def.options.get('metadata_cache')
+            and action_def.action not in snapshot_actions()
+        ):
+            metadata_cache = MetadataCache.from_client(client)
         #
         # Process the action
         #
@@ -241,7 +318,13 @@ def run(ctx: click.Context) -> None:
         )
         try:
             logger.info(msg)
-            process_action(client, action_def, dry_run=ctx.params['dry_run'])
+            process_action(
+                action_client,
+                action_def,
+                dry_run=ctx.params['dry_run'],
+                session=session,
+                metadata_cache=metadata_cache,
+            )
         except Exception as err:
             exception_handler(action_def, err)
         logger.info('Action ID: %s, "%s" completed.', idx, action_def.action)
@@ -20,6 +20,26 @@ from curator.cli_singletons.utils import validate_filter_json
     type=float,
     help='Time in seconds to delay between operations. Default 0. Maximum 3600',
 )
+@click.option(
+    '--max_merges_per_node',
+    type=int,
+    help='Merge indices in parallel, with at most this many shards merging on any '
+    'one node. Minimum 1, maximum 32',
+)
+@click.option(
+    '--wait_interval',
+    default=3,
+    type=int,
+    help='Seconds to wait between checks on running merges.',
+    show_default=True,
+)
+@click.option(
+    '--max_wait',
+    default=-1,
+    type=int,
+    help='Maximum number of seconds to wait for each merge to complete',
+    show_default=True,
+)
 @click.option(
     '--ignore_empty_list',
     is_flag=True,
@@ -49,6 +69,9 @@ def forcemerge(
     search_pattern,
     max_num_segments,
     delay,
+    max_merges_per_node,
+    wait_interval,
+    max_wait,
     ignore_empty_list,
     allow_ilm_indices,
     include_hidden,
@@ -61,6 +84,9 @@ def forcemerge(
         'search_pattern': search_pattern,
         'max_num_segments': max_num_segments,
         'delay': delay,
+        'max_merges_per_node': max_merges_per_node,
+        'wait_interval': wait_interval,
+        'max_wait': max_wait,
         'allow_ilm_indices': allow_ilm_indices,
         'include_hidden': include_hidden,
     }
@@ -29,6 +29,7 @@ from curator.actions import (
 from curator.defaults.settings import VERSION_MAX, VERSION_MIN, snapshot_actions
 from curator.exceptions import ConfigurationError, NoIndices, NoSnapshots
 from curator.helpers.testers import validate_filters
+from curator.metadata_cache import MetadataCache
 from curator.validators import options
 from curator.validators.filter_functions import validfilters
 
@@ -101,6 +102,9 @@ class CLIAction:
 
         self.search_pattern = self.options.pop('search_pattern', '*')
         self.include_hidden = self.options.pop('include_hidden', False)
+        self.max_concurrent_requests = self.options.pop('max_concurrent_requests', 1)
+        self.metadata_cache = self.options.pop('metadata_cache', False)
+        self.metadata_cache_ttl = self.options.pop('metadata_cache_ttl', None)
 
         # Extract allow_ilm_indices so it can be handled separately.
         if 'allow_ilm_indices' in self.options:
@@ -214,10 +218,17 @@ class CLIAction:
         if self.action in snapshot_actions() or self.action == 'show_snapshots':
             self.list_object = SnapshotList(self.client, repository=self.repository)
         else:
+            cache = None
+            if self.metadata_cache:
+                cache = MetadataCache.from_client(
+                    self.client, ttl=self.metadata_cache_ttl
+                )
             self.list_object = IndexList(
                 self.client,
                 search_pattern=self.search_pattern,
                 include_hidden=self.include_hidden,
+                max_concurrent_requests=self.max_concurrent_requests,
+                metadata_cache=cache,
             )
 
     def get_alias_obj(self):
@@ -17,6 +17,14 @@ from curator.cli_singletons.utils import json_to_dict, validate_filter_json
     help='Named node, or DETERMINISTIC',
     show_default=True,
 )
+@click.option(
+    '--max_shrink_nodes',
+    default=1,
+    type=int,
+    help='With DETERMINISTIC, shrink on up to this many nodes at the same time. '
+    'More than 1 requires --no-wait_for_rebalance',
+    show_default=True,
+)
 @click.option(
     '--node_filters',
     help='JSON version of node_filters (see documentation)',
@@ -120,6 +128,7 @@ def shrink(
     ctx,
     search_pattern,
     shrink_node,
+    max_shrink_nodes,
     node_filters,
     number_of_shards,
     number_of_replicas,
@@ -145,6 +154,7 @@ def shrink(
     manual_options = {
         'search_pattern': search_pattern,
         'shrink_node': shrink_node,
+        'max_shrink_nodes': max_shrink_nodes,
         'node_filters': node_filters,
         'number_of_shards': number_of_shards,
         'number_of_replicas': number_of_replicas,
@@ -324,6 +324,21 @@ def threshold_behavior(**kwargs):
     }
 
 
+def time_series_bounds(**kwargs):
+    """
+    This setting is only used with the ``field_stats`` source, i.e. indices only.
+
+    :returns: {Optional('time_series_bounds', default=False):
+        Any(bool, All(Any(str), Boolean()))}
+    """
+    # pylint: disable=no-value-for-parameter
+    return {
+        Optional('time_series_bounds', default=False): Any(
+            bool, All(Any(str), Boolean())
+        )
+    }
+
+
 def unit(**kwargs):
     """
     This setting is only used with the ``age`` filtertype, or with the ``space``
@@ -0,0 +1,82 @@
+"""Response filters for metadata API calls
+
+Each call site that reads only a few keys of an API response is registered in
+:py:data:`FILTER_PATHS` with the ``filter_path`` it needs, so that Elasticsearch
+sends only those keys. This matters most with many indices, shards or snapshots,
+where the full responses run to many megabytes.
+
+To request full responses instead, e.g. to see everything Elasticsearch returns in
+debug logs, set the ``CURATOR_FULL_RESPONSES`` environment variable to any
+non-empty value, or set :py:data:`ENABLED` to ``False``.
+"""
+
+import os
+
+#: Whether registered calls send their ``filter_path``. ``False`` if the
+#: ``CURATOR_FULL_RESPONSES`` environment variable is set.
+ENABLED = not os.environ.get('CURATOR_FULL_RESPONSES')
+
+#: The ``filter_path`` of each registered call site. Values in braces are filled
+#: in by :py:func:`filter_path`.
+FILTER_PATHS = {
+    # IndexList: index settings, for ages, shard counts, routing and ILM
+    'index_settings': ','.join(
+        f'*.settings.index.{setting}'
+        for setting in [
+            'creation_date',
+            'number_of_replicas',
+            'number_of_shards',
+            'routing',
+            'lifecycle.name',
+        ]
+    ),
+    # IndexList: index sizes and doc counts
+    'index_stats': (
+        'indices.*.total.store.size_in_bytes,'
+        'indices.*.primaries.docs.count,'
+        'indices.*.primaries.store.size_in_bytes'
+    ),
+    # IndexList: segment counts
+    'index_segments': 'indices.*.total.segments.count',
+    # SnapshotList: the snapshots in a repository
+    'snapshot_list': ','.join(
+        f'snapshots.{key}'
+        for key in [
+            'snapshot',
+            'uuid',
+            'state',
+            'indices',
+            'start_time_in_millis',
+            'end_time_in_millis',
+        ]
+    ),
+    # get_data_tiers: node roles
+    'data_tiers': 'nodes.*.roles',
+    # health_check: the health keys to compare
+    'health_check': '{keys}',
+    # relocate_check: the state of each shard copy of an index
+    'relocate_check': 'routing_table.indices.{index}.shards.*.state',
+    # restore_check: the recovery stage of each shard
+    'restore_check': '*.shards.stage',
+    # snapshot_check: the state of a snapshot
+    'snapshot_check': 'snapshots.state',
+}
+
+
+def filter_path(call, **kwargs):
+    """
+    :param call: A call site registered in :py:data:`FILTER_PATHS`
+    :param kwargs: The values to fill in to the ``filter_path`` of ``call``.
+        Index names must have their dots escaped with
+        :py:func:`~.curator.helpers.getters.escape_dots`.
+
+    :type call: str
+    :type kwargs: str
+
+    :returns: The ``filter_path`` for ``call``, or ``None`` for the full response
+        if :py:data:`ENABLED` is ``False``
+    :rtype: str
+    """
+    if not ENABLED:
+        return None
+    return FILTER_PATHS[call].format(**kwargs)
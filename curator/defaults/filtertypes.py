@@ -32,6 +32,7 @@ def _age_elements(action, config):
     retval.append(filter_elements.source(action=action, required=is_req))
     if action in settings.index_actions():
         retval.append(filter_elements.stats_result())
+        retval.append(filter_elements.time_series_bounds())
     # This is a silly thing here, because the absence of 'source' will
     # show up in the actual schema check, but it keeps code from breaking here
     ts_req = False
@@ -250,6 +250,32 @@ def key():
     return {Required('key'): Any(str)}
 
 
+def max_concurrent_requests():
+    """
+    :returns:
+        {Optional('max_concurrent_requests', default=1):
+            All(Coerce(int), Range(min=1, max=32))}
+    """
+    return {
+        Optional('max_concurrent_requests', default=1): All(
+            Coerce(int), Range(min=1, max=32)
+        )
+    }
+
+
+def max_merges_per_node():
+    """
+    :returns:
+        {Optional('max_merges_per_node', default=None):
+            Any(None, All(Coerce(int), Range(min=1, max=32)))}
+    """
+    return {
+        Optional('max_merges_per_node', default=None): Any(
+            None, All(Coerce(int), Range(min=1, max=32))
+        )
+    }
+
+
 def max_num_segments():
     """
     :returns:
@@ -259,6 +285,17 @@ def max_num_segments():
     return {Required('max_num_segments'): All(Coerce(int), Range(min=1, max=32768))}
 
 
+def max_shrink_nodes():
+    """
+    :returns:
+        {Optional('max_shrink_nodes', default=1):
+            All(Coerce(int), Range(min=1, max=32))}
+    """
+    return {
+        Optional('max_shrink_nodes', default=1): All(Coerce(int), Range(min=1, max=32))
+    }
+
+
 # pylint: disable=unused-argument
 def max_wait(action):
     """
@@ -273,6 +310,31 @@ def max_wait(action):
     return {Optional('max_wait', default=defval): Any(-1, Coerce(int), None)}
 
 
+def metadata_cache():
+    """
+    :returns:
+        {Optional('metadata_cache', default=False):
+            Any(bool, All(Any(str), Boolean()))}
+    """
+    return {
+        Optional('metadata_cache', default=False): Any(bool, All(Any(str), Boolean()))
+    }
+
+
+def metadata_cache_ttl():
+    """
+    :returns:
+        {Optional('metadata_cache_ttl', default=None): Any(None, {Any('immutable',
+        'settings', 'segments', 'state', 'stats'): Any(None, Coerce(int))})}
+    """
+    classes = Any('immutable', 'settings', 'segments', 'state', 'stats')
+    return {
+        Optional('metadata_cache_ttl', default=None): Any(
+            None, {classes: Any(None, Coerce(int))}
+        )
+    }
+
+
 def migration_prefix():
     """
     :returns: {Optional('migration_prefix', default=''): Any(None, str)}
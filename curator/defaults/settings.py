@@ -15,6 +15,18 @@ EXCLUDE_SYSTEM = (
     '-.kibana*,-.security*,-.watch*,-.triggered_watch*,'
     '-.ml*,-.geoip_databases*,-.logstash*,-.tasks*'
 )
+#: The most snapshots deleted by one request, by repository type. Each request
+#: rewrites the repository metadata once, but deletes from blob stores take longer
+#: per snapshot, so their requests are kept smaller.
+SNAPSHOT_DELETE_BATCH = {
+    'default': 100,
+    'fs': 500,
+    'source': 500,
+    'hdfs': 250,
+    's3': 100,
+    'gcs': 100,
+    'azure': 100,
+}
 VERSION_MIN = (7, 14, 0)
 VERSION_MAX = (8, 99, 99)
 
@@ -54,6 +66,29 @@ def default_config_file():
         return default
 
 
+# Default metadata cache location
+def default_cache_dir():
+    """
+    :returns: The default metadata cache directory:
+        path.join(path.expanduser('~'), '.curator', 'cache')
+    """
+    return path.join(path.expanduser('~'), '.curator', 'cache')
+
+
+def metadata_cache_ttl():
+    """
+    :returns: The default number of seconds that each class of cached index
+        metadata stays fresh. ``None`` means the values never expire.
+    """
+    return {
+        'immutable': None,
+        'settings': 3600,
+        'segments': 900,
+        'state': 60,
+        'stats': 60,
+    }
+
+
 # Default filter patterns (regular expressions)
 def regex_map():
     """
@@ -246,6 +281,7 @@ def structural_filter_elements():
         Optional('stats_result'): Any(None, str),
         Optional('timestring'): Any(None, str),
         Optional('threshold_behavior'): Any(str),
+        Optional('time_series_bounds'): Any(None, bool, int, str),
         Optional('unit'): Any(str),
         Optional('unit_count'): Coerce(int),
         Optional('unit_count_pattern'): Any(str),
@@ -5,11 +5,29 @@ import random
 import re
 import string
 import time
+from bisect import bisect_left, bisect_right
 from datetime import timedelta, datetime, timezone
+from functools import lru_cache
 from elasticsearch8.exceptions import NotFoundError
 from curator.exceptions import ConfigurationError
 from curator.defaults.settings import date_regex
 
+#: The most distinct date strings :py:func:`timestring_epoch` remembers
+TIMESTRING_CACHE_SIZE = 8192
+
+# The width of each strftime directive the fast path of timestring_epoch reads
+FAST_DIRECTIVES = {
+    'Y': 4,
+    'G': 4,
+    'y': 2,
+    'm': 2,
+    'V': 2,
+    'd': 2,
+    'H': 2,
+    'M': 2,
+    'S': 2,
+}
+
 
 class TimestringSearch:
     """
@@ -43,12 +61,89 @@ class TimestringSearch:
         match = self.pattern.search(searchme)
         if match:
             if match.group("date"):
-                timestamp = match.group("date")
-                return datetime_to_epoch(get_datetime(timestamp, self.timestring))
+                return timestring_epoch(match.group("date"), self.timestring)
             return None
         return None
 
 
+class EpochIndex:
+    """
+    Names sorted by their epoch timestamp, so that threshold and range lookups are
+    bisections rather than a comparison per name.
+
+    :param ages: The epoch timestamp of each name
+    :type ages: dict
+    """
+
+    def __init__(self, ages):
+        #: Object attribute preserving param ``ages``
+        self.ages = dict(ages)
+        # Names of the same age are ordered by name to keep ordering consistent
+        self._pairs = sorted((age, name) for name, age in self.ages.items())
+        self._epochs = [age for age, _ in self._pairs]
+
+    def __contains__(self, name):
+        return name in self.ages
+
+    def __len__(self):
+        return len(self._pairs)
+
+    def _names(self, start, stop):
+        return {name for _, name in self._pairs[start:stop]}
+
+    def older(self, epoch):
+        """
+        :param epoch: An epoch timestamp
+        :type epoch: int
+
+        :returns: The names with a timestamp before ``epoch``
+        :rtype: set
+        """
+        return self._names(0, bisect_left(self._epochs, epoch))
+
+    def younger(self, epoch):
+        """
+        :param epoch: An epoch timestamp
+        :type epoch: int
+
+        :returns: The names with a timestamp after ``epoch``
+        :rtype: set
+        """
+        return self._names(bisect_right(self._epochs, epoch), None)
+
+    def between(self, start, end):
+        """
+        :param start: The earliest epoch timestamp in range
+        :param end: The latest epoch timestamp in range
+
+        :type start: int
+        :type end: int
+
+        :returns: The names with a timestamp from ``start`` to ``end``, inclusive
+        :rtype: set
+        """
+        return self._names(
+            bisect_left(self._epochs, start), bisect_right(self._epochs, end)
+        )
+
+    def ordered(self, names=None, reverse=False):
+        """
+        :param names: Only return these names. All names if not provided.
+        :param reverse: Youngest first, rather than oldest first
+
+        :type names: list or set
+        :type reverse: bool
+
+        :returns: The names, ordered by timestamp and then by name
+        :rtype: list
+        """
+        pairs = reversed(self._pairs) if reverse else self._pairs
+        if names is None:
+            return [name for _, name in pairs]
+        names = set(names)
+        return [name for _, name in pairs if name in names]
+
+
 def absolute_date_range(
     unit, date_from, date_to, date_from_format=None, date_to_format=None
 ):
@@ -328,6 +423,27 @@ def epoch2iso(epoch: int) -> str:
     return f'{parts[0]}+{parts[1]}'  # Fallback publishes the +TZ, whatever that was
 
 
+def iso2epoch(value: str) -> int:
+    """
+    Return the epoch timestamp of an ISO8601 value, or of epoch milliseconds, as
+    Elasticsearch returns date settings
+
+    :param value: An ISO8601 timestamp, or epoch milliseconds
+    :type value: str
+
+    :returns: An epoch timestamp
+    :rtype: int
+    """
+    value = str(value)
+    if value.isdecimal():
+        return fix_epoch(int(value))
+    # Before Python 3.11, fromisoformat does not read the Z for Zulu/UTC time
+    mydate = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if mydate.tzinfo is None:
+        mydate = mydate.replace(tzinfo=timezone.utc)
+    return int(mydate.timestamp())
+
+
 def fix_epoch(epoch):
     """
     Fix value of ``epoch`` to be the count since the epoch in seconds only, which
@@ -681,3 +797,100 @@ def parse_datemath(client, value):
         ) from exc
 
     return f'{prefix}{get_datemath(client, datemath)}{suffix}'
+
+
+@lru_cache(maxsize=TIMESTRING_CACHE_SIZE)
+def timestring_epoch(index_timestamp, timestring):
+    """
+    Many indices share the same date string, so the result for each distinct
+    ``index_timestamp`` and ``timestring`` is remembered, up to
+    :py:data:`TIMESTRING_CACHE_SIZE` of them.
+
+    Timestrings made up only of ``%Y``, ``%y``, ``%m``, ``%d``, ``%H``, ``%M`` and
+    ``%S``, or of ``%G`` and ``%V``, plus literal separators, are read directly
+    rather than with :py:meth:`~.datetime.datetime.strptime`. Any other timestring,
+    or a date string that doesn't fit it, falls back to :py:func:`get_datetime`.
+
+    :param index_timestamp: The index timestamp
+    :param timestring: An ``strftime`` pattern
+
+    :type index_timestamp: str
+    :type timestring: :py:func:`~.time.strftime`
+
+    :returns: The epoch timestamp of ``index_timestamp``
+    :rtype: int
+    """
+    plan = _timestring_plan(timestring)
+    if plan:
+        mydate = _read_timestamp(index_timestamp, *plan)
+        if mydate:
+            return datetime_to_epoch(mydate)
+    return datetime_to_epoch(get_datetime(index_timestamp, timestring))
+
+
+@lru_cache(maxsize=256)
+def _timestring_plan(timestring):
+    """
+    :returns: The position of each directive and literal character in a date
+        string matching ``timestring``, and its length, or ``None`` if
+        ``timestring`` can't use the fast path of :py:func:`timestring_epoch`
+    """
+    fields = {}
+    literals = []
+    pos = idx = 0
+    while idx < len(timestring):
+        if timestring[idx] == '%':
+            key = timestring[idx + 1 : idx + 2]
+            if key not in FAST_DIRECTIVES or key in fields:
+                return None
+            fields[key] = (pos, pos + FAST_DIRECTIVES[key])
+            pos += FAST_DIRECTIVES[key]
+            idx += 2
+        else:
+            literals.append((pos, timestring[idx]))
+            pos += 1
+            idx += 1
+    iso = {'G', 'V'} & set(fields)
+    if iso:
+        if iso != {'G', 'V'} or {'Y', 'y', 'm', 'd'} & set(fields):
+            return None
+    elif len({'Y', 'y'} & set(fields)) != 1:
+        return None
+    return fields, tuple(literals), pos
+
+
+def _read_timestamp(index_timestamp, fields, literals, length):
+    """
+    :returns: The datetime of ``index_timestamp``, read as planned by
+        :py:func:`_timestring_plan`, or ``None`` if it doesn't fit the plan
+    """
+    if len(index_timestamp) != length:
+        return None
+    if any(index_timestamp[pos] != char for pos, char in literals):
+        return None
+    values = {}
+    for key, (start, end) in fields.items():
+        digits = index_timestamp[start:end]
+        if not digits.isdecimal():
+            return None
+        values[key] = int(digits)
+    try:
+        if 'G' in values:
+            # The Monday of the ISO week, as get_datetime reads it
+            return datetime.fromisocalendar(values['G'], values['V'], 1)
+        if 'y' in values:
+            # The same pivot strptime uses for two digit years
+            year = values['y'] + (1900 if values['y'] >= 69 else 2000)
+        else:
+            year = values['Y']
+        return datetime(
+            year,
+            values.get('m', 1),
+            values.get('d', 1),
+            values.get('H', 0),
+            values.get('M', 0),
+            values.get('S', 0),
+        )
+    except ValueError:
+        # Let strptime decide what to make of it
+        return None
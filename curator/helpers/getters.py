@@ -2,6 +2,7 @@
 
 import logging
 from elasticsearch8 import exceptions as es8exc
+from curator.defaults.filter_paths import filter_path
 from curator.defaults.settings import EXCLUDE_SYSTEM
 from curator.exceptions import (
     ConfigurationError,
@@ -85,7 +86,7 @@ def get_data_tiers(client):
             return True
         return False
 
-    info = client.nodes.info()['nodes']
+    info = client.nodes.info(filter_path=filter_path('data_tiers'))['nodes']
     retval = {
         'data_hot': False,
         'data_warm': False,
@@ -216,7 +217,11 @@ def get_snapshot_data(client, repository=None):
     if not repository:
         raise MissingArgument('No value for "repository" provided')
     try:
-        return client.snapshot.get(repository=repository, snapshot="*")['snapshots']
+        return client.snapshot.get(
+            repository=repository,
+            snapshot="*",
+            filter_path=filter_path('snapshot_list'),
+        ).get('snapshots', [])
     except (es8exc.TransportError, es8exc.NotFoundError) as err:
         msg = (
             f'Unable to get snapshot information from repository: '
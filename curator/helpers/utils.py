@@ -5,38 +5,34 @@ The kind that don't fit in testers, getters, date_ops, or converters
 
 import re
 import logging
+from functools import lru_cache
 from es_client.helpers.utils import ensure_list
+from curator.chunker import RequestChunker
 from curator.exceptions import FailedExecution
 
 logger = logging.getLogger(__name__)
 
 
-def chunk_index_list(indices):
+def chunk_index_list(indices, client=None):
     """
-    This utility chunks very large index lists into 3KB chunks.
-    It measures the size as a csv string, then converts back into a list for the
-    return value.
+    This utility chunks very large index lists into pieces that each fit in a
+    single request URL. The size is measured as the encoded bytes of the
+    comma-separated index names, by :py:class:`~.curator.chunker.RequestChunker`.
 
     :param indices: The list of indices
+    :param client: A client connection object. If passed, any smaller limit
+        already learned for its cluster is used.
 
     :type indices: list
+    :type client: :py:class:`~.elasticsearch.Elasticsearch`
 
-    :returns: A list of lists (each a piece of the original ``indices``)
+    :returns: A list of lists (each a piece of the original ``indices``). An
+        empty ``indices`` returns ``[['']]``.
     :rtype: list
     """
-    chunks = []
-    chunk = ""
-    for index in indices:
-        if len(chunk) < 3072:
-            if not chunk:
-                chunk = index
-            else:
-                chunk += "," + index
-        else:
-            chunks.append(chunk.split(','))
-            chunk = index
-    chunks.append(chunk.split(','))
-    return chunks
+    chunker = RequestChunker.for_client(client) if client else RequestChunker()
+    # An empty list has always come back as a single chunk with an empty name
+    return chunker.chunks(indices) or [['']]
 
 
 def report_failure(exception):
@@ -162,55 +158,71 @@ def regex_loop(matchstr: str, indices: list) -> list:
     return retval
 
 
-def multitarget_match(pattern: str, index_list: list) -> list:
+@lru_cache(maxsize=128)
+def multitarget_regex(pattern: str) -> tuple:
     """
-    Convert Elasticsearch multi-target syntax ``pattern`` into Python regex
-    patterns. Match against ``index_list`` and return the list of matches while
-    excluding any negative matches.
+    Convert Elasticsearch multi-target syntax ``pattern`` into two compiled Python
+    regular expressions, one matching any of the include elements and one matching
+    any of the exclude elements. Each element matches from the start of an index
+    name, as in :py:func:`regex_loop`. Compiled patterns are cached, so repeat
+    calls with the same ``pattern`` are free.
 
     :param pattern: The Elasticsearch multi-target syntax pattern
-    :param index_list: The list of indices to match against
     :type pattern: str
-    :type index_list: list
 
-    :returns: The final resulting list of indices
-    :rtype: list
+    :returns: The include and exclude regular expressions. The exclude regular
+        expression is ``None`` if there are no exclude elements.
+    :rtype: tuple
     """
-    retval = []
-    excluded = []
     includes = []
     excludes = []
-    logger.debug('Multi-target syntax pattern: %s', pattern)
     elements = multitarget_fix(pattern).split(',')
     logger.debug('Individual elements of pattern: %s', elements)
     for element in elements:
         # Exclude elements are prefixed with '-'
         exclude = element.startswith('-')
+        if exclude:
+            element = element[1:]
         # Any index prepended with a . is probably a hidden index, but
         # we need to escape the . for regex to treat it as a literal
         matchstr = element.replace('.', '\\.')
         # Replace Elasticsearch wildcard * with .* for Python regex
         matchstr = matchstr.replace('*', '.*')
-        # logger.debug('matchstr: %s', matchstr)
-        # If it is not an exclude, add the output of regex_loop to `includes`
-        if not exclude:
-            includes += regex_loop(matchstr, index_list)
-        # If it is an exclude pattern, add the output of regex_loop to `excludes`
-        # Remove the `-` from the matchstr ([1:]) before sending.
-        if exclude:
-            excludes += regex_loop(matchstr[1:], index_list)
-    # Create a unique list of indices to loop through
-    for idx in list(set(includes)):
-        # If idx is not in the unique list of excludes, add it to retval
-        if idx not in list(set(excludes)):
-            retval.append(idx)
+        (excludes if exclude else includes).append(f'(?:{matchstr})')
+    include_re = re.compile('|'.join(includes))
+    exclude_re = re.compile('|'.join(excludes)) if excludes else None
+    return include_re, exclude_re
+
+
+def multitarget_match(pattern: str, index_list: list) -> list:
+    """
+    Convert Elasticsearch multi-target syntax ``pattern`` into Python regex
+    patterns. Match against ``index_list`` and return the list of matches while
+    excluding any negative matches. The patterns come from
+    :py:func:`multitarget_regex`, and ``index_list`` is read in a single pass.
+
+    :param pattern: The Elasticsearch multi-target syntax pattern
+    :param index_list: The list of indices to match against
+    :type pattern: str
+    :type index_list: list
+
+    :returns: The final resulting list of indices
+    :rtype: list
+    """
+    logger.debug('Multi-target syntax pattern: %s', pattern)
+    include_re, exclude_re = multitarget_regex(pattern)
+    retval = set()
+    excluded = set()
+    for idx in index_list:
+        if not include_re.match(idx):
+            continue
+        if exclude_re and exclude_re.match(idx):
+            excluded.add(idx)
         else:
-            # Otherwise, add it to the excludes
-            excluded.append(idx)
+            retval.add(idx)
     # Sort the lists alphabetically
-    retval.sort()
-    excluded.sort()
+    retval = sorted(retval)
     # Log the results
     logger.debug('Included indices: %s', retval)
-    logger.debug('Excluded indices: %s', excluded)
+    logger.debug('Excluded indices: %s', sorted(excluded))
     return retval
@@ -0,0 +1,71 @@
+"""Vectorized numeric comparisons
+
+Numeric filters compare one value per index against a threshold. These helpers make
+that comparison for a whole list of values at once. If `NumPy <https://numpy.org>`_
+is installed, each comparison is a single array operation. Otherwise, an equivalent
+pure Python comparison is used, with the operator chosen once rather than per value.
+"""
+
+import operator
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+#: Whether NumPy is available to vectorize comparisons
+HAS_NUMPY = np is not None
+
+#: The comparison for each threshold behavior
+BEHAVIORS = {
+    'greater_than': operator.gt,
+    'greater_than_or_equal': operator.ge,
+    'less_than': operator.lt,
+    'less_than_or_equal': operator.le,
+    'equal': operator.eq,
+}
+
+
+def compare(values, behavior, threshold):
+    """
+    :param values: The value of each index
+    :param behavior: One of ``greater_than``, ``greater_than_or_equal``,
+        ``less_than``, ``less_than_or_equal`` or ``equal``
+    :param threshold: The value to compare against, or a list with one value to
+        compare against for each of ``values``
+
+    :type values: list
+    :type behavior: str
+    :type threshold: int, float or list
+
+    :returns: Whether each of ``values`` compares to ``threshold`` as ``behavior``
+        says
+    :rtype: list
+    """
+    if behavior not in BEHAVIORS:
+        raise ValueError(f'Invalid comparison behavior: {behavior}')
+    oper = BEHAVIORS[behavior]
+    if HAS_NUMPY:
+        return oper(_array(values), _array(threshold)).tolist()
+    if isinstance(threshold, list):
+        return [oper(val, thr) for val, thr in zip(values, threshold)]
+    return [oper(val, threshold) for val in values]
+
+
+def running_total(values):
+    """
+    :param values: The value of each index
+    :type values: list
+
+    :returns: The sum of each value and all of the values before it
+    :rtype: list
+    """
+    if HAS_NUMPY:
+        return _array(values).cumsum().tolist()
+    return list(accumulate(values))
+
+
+def _array(values):
+    # float64 holds every epoch timestamp and byte count exactly
+    return np.asarray(values, dtype=np.float64)
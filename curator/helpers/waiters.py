@@ -15,10 +15,12 @@ from curator.exceptions import (
     FailedReindex,
     MissingArgument,
 )
+from curator.defaults.filter_paths import filter_path
+from curator.helpers.getters import escape_dots
 from curator.helpers.utils import chunk_index_list
 
 
-def health_check(client, **kwargs):
+def health_check(client, index=None, **kwargs):
     """
     This function calls `client.cluster.`
     :py:meth:`~.elasticsearch.client.ClusterClient.health` and, based on the params
@@ -28,8 +30,11 @@ def health_check(client, **kwargs):
     If multiple keys are provided, all must match for a ``True`` response.
 
     :param client: A client connection object
+    :param index: If set, check the health of only this index, rather than the
+        whole cluster
 
     :type client: :py:class:`~.elasticsearch.Elasticsearch`
+    :type index: str
 
     :rtype: bool
     """
@@ -38,7 +43,9 @@ def health_check(client, **kwargs):
     klist = list(kwargs.keys())
     if not klist:
         raise MissingArgument('Must provide at least one keyword argument')
-    hc_data = client.cluster.health()
+    hc_data = client.cluster.health(
+        index=index, filter_path=filter_path('health_check', keys=','.join(klist))
+    )
     response = True
 
     for k in klist:
@@ -78,9 +85,11 @@ def relocate_check(client, index):
     :rtype: bool
     """
     logger = logging.getLogger(__name__)
-    shard_state_data = client.cluster.state(index=index)['routing_table']['indices'][
-        index
-    ]['shards']
+    shard_state_data = client.cluster.state(
+        metric='routing_table',
+        index=index,
+        filter_path=filter_path('relocate_check', index=escape_dots(index)),
+    )['routing_table']['indices'][index]['shards']
     finished_state = all(
         all(shard['state'] == "STARTED" for shard in shards)
         for shards in shard_state_data.values()
@@ -112,9 +121,11 @@ def restore_check(client, index_list):
     logger = logging.getLogger(__name__)
     response = {}
 
-    for chunk in chunk_index_list(index_list):
+    for chunk in chunk_index_list(index_list, client=client):
         try:
-            chunk_response = client.indices.recovery(index=chunk, human=True)
+            chunk_response = client.indices.recovery(
+                index=chunk, human=True, filter_path=filter_path('restore_check')
+            )
         except Exception as err:
             msg = (
                 f'Unable to obtain recovery information for specified indices. '
@@ -163,7 +174,11 @@ def snapshot_check(client, snapshot=None, repository=None):
     logger.debug('SNAPSHOT: %s', snapshot)
     logger.debug('REPOSITORY: %s', repository)
     try:
-        result = client.snapshot.get(repository=repository, snapshot=snapshot)
+        result = client.snapshot.get(
+            repository=repository,
+            snapshot=snapshot,
+            filter_path=filter_path('snapshot_check'),
+        )
         logger.debug('RESULT: %s', result)
     except Exception as err:
         raise CuratorException(
@@ -0,0 +1,305 @@
+"""Index metadata and actionable list storage for :py:class:`~.curator.indexlist.IndexList`
+
+Each index gets a single :py:class:`IndexInfo` record with fixed ``__slots__``,
+rather than a pair of nested dictionaries. Unpopulated values are stored as ``None``,
+which is an explicit "not yet populated" marker, rather than a zero value that is
+indistinguishable from real data (e.g. an index with no documents).
+
+Both :py:class:`IndexInfo` and :py:class:`IndexAge` can still be read and written
+like the dictionaries they replace, so ``index_info[index]['docs']`` and
+``index_info[index]['age']['creation_date']`` continue to work.
+
+:py:class:`ActionableList` is the ``indices`` list, with constant time membership
+tests.
+"""
+
+from collections import Counter
+from collections.abc import MutableMapping
+
+#: The value returned for an unpopulated field of :py:class:`IndexInfo`, for
+#: compatibility with the zero values of the original ``index_info`` dictionaries.
+ZERO_VALUES = {
+    'docs': 0,
+    'number_of_replicas': 0,
+    'number_of_shards': 0,
+    'primary_size_in_bytes': 0,
+    'routing': {},
+    'segments': 0,
+    'size_in_bytes': 0,
+    'state': '',
+    'uuid': '',
+}
+
+#: The fields of :py:class:`IndexInfo` which cannot change during the life of an
+#: index. ``creation_date`` is the one field of ``age`` among them.
+IMMUTABLE_FIELDS = ('creation_date', 'number_of_shards', 'uuid')
+
+
+class IndexAge(MutableMapping):
+    """
+    The age values of a single index. Unpopulated values raise :py:exc:`KeyError`
+    when read, exactly as missing keys in the original ``age`` dictionary did.
+    """
+
+    __slots__ = ('creation_date', 'max_value', 'min_value', 'name')
+
+    def __init__(self):
+        self.creation_date = None
+        self.name = None
+        self.min_value = None
+        self.max_value = None
+
+    def __getitem__(self, key):
+        if key not in self.__slots__ or getattr(self, key) is None:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        setattr(self, key, None)
+
+    def __iter__(self):
+        return (key for key in self.__slots__ if getattr(self, key) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class IndexInfo(MutableMapping):
+    """
+    The metadata of a single index. Unpopulated values read as their zero value
+    from :py:data:`ZERO_VALUES`. Use :py:meth:`populated` to tell an unpopulated
+    value apart from a zero value.
+    """
+
+    __slots__ = (
+        'age',
+        'docs',
+        'number_of_replicas',
+        'number_of_shards',
+        'primary_size_in_bytes',
+        'routing',
+        'segments',
+        'size_in_bytes',
+        'state',
+        'uuid',
+    )
+
+    def __init__(self, data=None):
+        #: The age values of the index. **Type:** :py:class:`IndexAge`
+        self.age = IndexAge()
+        for key in ZERO_VALUES:
+            setattr(self, key, None)
+        if data:
+            for key, value in data.items():
+                if key == 'age':
+                    self.age.update(value)
+                else:
+                    self[key] = value
+
+    def populated(self, key):
+        """
+        :param key: The field name. The ``age`` field counts as populated when
+            ``creation_date`` is populated.
+        :type key: str
+
+        :returns: ``True`` if ``key`` has been populated, otherwise ``False``
+        :rtype: bool
+        """
+        if key == 'age':
+            return self.age.creation_date is not None
+        return getattr(self, key) is not None
+
+    def forget_mutable(self):
+        """
+        Mark every value which can change during the life of an index as not
+        populated. Only ``creation_date``, ``number_of_shards`` and ``uuid`` are
+        kept.
+        """
+        creation_date = self.age.creation_date
+        self.age = IndexAge()
+        self.age.creation_date = creation_date
+        for key in ZERO_VALUES:
+            if key not in IMMUTABLE_FIELDS:
+                setattr(self, key, None)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        if key == 'age':
+            return self.age
+        value = getattr(self, key)
+        if value is None:
+            # Hand out a new dict for routing so the shared zero value is never mutated
+            return {} if key == 'routing' else ZERO_VALUES[key]
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        if key == 'age':
+            self.age = IndexAge()
+            self.age.update(value)
+        else:
+            setattr(self, key, value)
+
+    def __delitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        if key == 'age':
+            self.age = IndexAge()
+        else:
+            setattr(self, key, None)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class IndexInfoStore(MutableMapping):
+    """
+    The ``index_info`` container of :py:class:`~.curator.indexlist.IndexList`,
+    mapping index names to :py:class:`IndexInfo` records. Plain dictionaries
+    assigned to an index name are converted to :py:class:`IndexInfo` records.
+    """
+
+    __slots__ = ('_records', 'cached')
+
+    def __init__(self):
+        self._records = {}
+        #: The fields of each index UUID already looked up in the on-disk metadata
+        #: cache whose values were loaded from, or saved to, that cache, and so
+        #: were not fetched from Elasticsearch since. Kept here rather than on
+        #: each :py:class:`~.curator.indexlist.IndexList`, as the records may be
+        #: shared by several. **Type:** :py:class:`dict` of :py:class:`set`
+        self.cached = {}
+
+    def add(self, index):
+        """
+        Ensure that ``index`` has an :py:class:`IndexInfo` record
+
+        :param index: The index name
+        :type index: str
+
+        :returns: The record for ``index``
+        :rtype: :py:class:`IndexInfo`
+        """
+        if index not in self._records:
+            self._records[index] = IndexInfo()
+        return self._records[index]
+
+    def populated(self, index, key):
+        """
+        :param index: The index name
+        :param key: The field name
+
+        :type index: str
+        :type key: str
+
+        :returns: ``True`` if ``index`` has a record and ``key`` is populated in it
+        :rtype: bool
+        """
+        return index in self._records and self._records[index].populated(key)
+
+    def forget_mutable(self, index):
+        """
+        Call :py:meth:`IndexInfo.forget_mutable` on the record for ``index``, and
+        forget that its mutable values came from the metadata cache
+
+        :param index: The index name
+        :type index: str
+        """
+        sii = self._records[index]
+        sii.forget_mutable()
+        if sii.populated('uuid') and sii['uuid'] in self.cached:
+            self.cached[sii['uuid']].intersection_update(IMMUTABLE_FIELDS)
+
+    def __getitem__(self, index):
+        return self._records[index]
+
+    def __setitem__(self, index, value):
+        if not isinstance(value, IndexInfo):
+            value = IndexInfo(value)
+        self._records[index] = value
+
+    def __delitem__(self, index):
+        del self._records[index]
+
+    def __contains__(self, index):
+        return index in self._records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __repr__(self):
+        return repr(self._records)
+
+
+class ActionableList(list):
+    """
+    A :py:class:`list` of index names that also tracks its members in a
+    :py:class:`~collections.Counter`, so ``in`` is a constant time lookup rather
+    than a scan of the whole list. Insertion order is preserved.
+    """
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._members = Counter(self)
+
+    def __contains__(self, item):
+        return self._members[item] > 0
+
+    def append(self, item):
+        super().append(item)
+        self._members[item] += 1
+
+    def extend(self, iterable):
+        iterable = list(iterable)
+        super().extend(iterable)
+        self._members.update(iterable)
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._members[item] += 1
+
+    def remove(self, item):
+        super().remove(item)
+        self._members[item] -= 1
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._members[item] -= 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self._members.clear()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._members = Counter(self)
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._members = Counter(self)
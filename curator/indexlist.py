@@ -1,12 +1,17 @@
 """Index List Class"""
 
 import re
+import heapq
 import itertools
 import logging
-from elasticsearch8.exceptions import NotFoundError, TransportError
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from elasticsearch8.exceptions import ApiError, NotFoundError, TransportError
 from es_client.helpers.schemacheck import SchemaCheck
 from es_client.helpers.utils import ensure_list
+from curator.chunker import RequestChunker, too_long
 from curator.defaults import settings
+from curator.defaults.filter_paths import filter_path
 from curator.exceptions import (
     ActionError,
     ConfigurationError,
@@ -14,49 +19,145 @@ from curator.exceptions import (
     NoIndices,
 )
 from curator.helpers.date_ops import (
+    EpochIndex,
     absolute_date_range,
     date_range,
     fix_epoch,
     get_date_regex,
     get_point_of_reference,
     get_unit_count_from_name,
+    iso2epoch,
     TimestringSearch,
 )
 from curator.helpers.getters import byte_size, get_indices
 from curator.helpers.testers import verify_client_object
-from curator.helpers.utils import chunk_index_list, report_failure, to_csv
+from curator.helpers.utils import report_failure, to_csv
+from curator.helpers.vectors import compare, running_total
+from curator.indexinfo import ActionableList, IndexInfoStore
+from curator.metadata_cache import FIELD_CLASSES
 from curator.validators.filter_functions import filterstructure
 
+#: Pattern filter values that mean the same as a regular expression and as part of
+#: a wildcard expression
+PLAIN_VALUE = re.compile(r'^[a-z0-9_-]+$')
+
+#: The most indices to search for ``field_stats`` ages in one multi-search request
+MSEARCH_BATCH_SIZE = 100
+
 
 class IndexList:
     """IndexList class"""
 
-    def __init__(self, client, search_pattern='*', include_hidden=False):
+    def __init__(
+        self,
+        client,
+        search_pattern='*',
+        include_hidden=False,
+        max_concurrent_requests=1,
+        metadata_cache=None,
+        session=None,
+    ):
         verify_client_object(client)
         self.loggit = logging.getLogger('curator.indexlist')
         #: An :py:class:`~.elasticsearch.Elasticsearch` client object passed from
         #: param ``client``
         self.client = client
+        #: The most chunks of indices to request metadata for at the same time.
+        #: **Type:** :py:class:`int`
+        self.max_concurrent_requests = max(1, int(max_concurrent_requests))
+        #: Splits index lists into requests sized for the cluster.
+        #: **Type:** :py:class:`~.curator.chunker.RequestChunker`
+        self.chunker = RequestChunker.for_client(client)
+        # Guards the shared structures when chunks are fetched concurrently
+        self._lock = threading.RLock()
+        #: An optional on-disk cache of index metadata shared between runs.
+        #: **Type:** :py:class:`~.curator.metadata_cache.MetadataCache`
+        self.metadata_cache = metadata_cache
+        #: An optional snapshot of index metadata shared with the other actions in
+        #: the same action file. **Type:** :py:class:`~.curator.session.MetadataSession`
+        self.session = session
         #: Information extracted from indices, such as segment count, age, etc.
-        #: Populated at instance creation time by private helper methods.
-        #: **Type:** :py:class:`dict`
-        self.index_info = {}
-        #: The running list of indices which will be used by one of the
-        #: :py:mod:`~.curator.actions` classes. Populated at instance creation
-        #: time by private helper methods. **Type:** :py:class:`list`
-        self.indices = []
-        #: All indices in the cluster at instance creation time.
-        #: **Type:** :py:class:`list`
-        self.all_indices = []
-        self.__get_indices(search_pattern, include_hidden)
+        #: Populated on demand by the ``get_`` methods, and read like a
+        #: :py:class:`dict` of :py:class:`dict`. Shared with ``session``, if set.
+        #: **Type:** :py:class:`~.curator.indexinfo.IndexInfoStore`
+        self.index_info = session.index_info if session else IndexInfoStore()
+        self._indices = ActionableList()
+        self._excluded = set()
+        # The listing is deferred until first use, so that iterate_filters can
+        # narrow the search pattern first
+        self._search_pattern = search_pattern
+        self._include_hidden = include_hidden
+        self._all_indices = None
         self.age_keyfield = None
+        # What the ages under age_keyfield were calculated from, and the sorted
+        # epoch index of each, shared by the filters in a chain
+        self._age_source = None
+        self._epoch_indices = {}
+        #: The metadata plan for the most recent call to :py:meth:`iterate_filters`,
+        #: as returned by :py:meth:`plan_metadata`. **Type:** :py:class:`dict`
+        self.metadata_plan = {}
+        self._state_is_fresh = False
+        self._alias_map = None
+
+    @property
+    def all_indices(self):
+        """
+        All indices in the cluster matching the search pattern, listed on first
+        use. **Type:** :py:class:`list`
+        """
+        with self._lock:
+            if self._all_indices is None:
+                self.__get_indices(self._search_pattern, self._include_hidden)
+            return self._all_indices
+
+    @all_indices.setter
+    def all_indices(self, value):
+        with self._lock:
+            self._all_indices = value
+
+    @property
+    def indices(self):
+        """
+        The running list of indices which will be used by one of the
+        :py:mod:`~.curator.actions` classes. Populated on first use by private
+        helper methods. Any removals made by filters since the last read are
+        applied here in a single pass. A list assigned to it is copied into an
+        :py:class:`~.curator.indexinfo.ActionableList`, unless it is one already,
+        so that membership tests stay constant time.
+        **Type:** :py:class:`~.curator.indexinfo.ActionableList`
+        """
+        with self._lock:
+            if self._all_indices is None:
+                self.__get_indices(self._search_pattern, self._include_hidden)
+            if self._excluded:
+                # Rebuild in place so that any reference to the list stays valid
+                excluded = self._excluded
+                self._indices[:] = [idx for idx in self._indices if idx not in excluded]
+                self._excluded = set()
+            return self._indices
+
+    @indices.setter
+    def indices(self, value):
+        # Keep an ActionableList as-is, so the caller's reference stays valid
+        with self._lock:
+            if self._all_indices is None:
+                self.__get_indices(self._search_pattern, self._include_hidden)
+            if not isinstance(value, ActionableList):
+                value = ActionableList(value)
+            self._indices = value
+            self._excluded = set()
+
+    def __exclude(self, idx):
+        """Queue ``idx`` for removal from ``indices`` on the next read"""
+        with self._lock:
+            self._excluded.add(idx)
 
     def __actionable(self, idx):
         self.loggit.debug('Index %s is actionable and remains in the list.', idx)
 
     def __not_actionable(self, idx):
         self.loggit.debug('Index %s is not actionable, removing from list.', idx)
-        self.indices.remove(idx)
+        self.__exclude(idx)
 
     def __excludify(self, condition, exclude, index, msg=None):
         if condition is True:
@@ -76,16 +177,40 @@ class IndexList:
         if msg:
             self.loggit.debug('%s: %s', text, msg)
 
+    def __excludify_all(self, indices, conditions, exclude, reason=None):
+        """
+        :py:meth:`__excludify` each of ``indices`` with the matching value of
+        ``conditions``. ``reason`` is called with the position of an index to get
+        its log message, but only if debug logging is enabled.
+        """
+        if self.loggit.isEnabledFor(logging.DEBUG):
+            for pos, index in enumerate(indices):
+                msg = reason(pos) if reason else None
+                self.__excludify(conditions[pos], exclude, index, msg)
+            return
+        with self._lock:
+            self._excluded.update(
+                index
+                for index, condition in zip(indices, conditions)
+                if (condition is True) == bool(exclude)
+            )
+
     def __get_indices(self, pattern, include_hidden):
         """
         Pull all indices into ``all_indices``, then populate ``indices`` and
         ``index_info``
         """
         self.loggit.debug('Getting indices matching search_pattern: "%s"', pattern)
-        self.all_indices = get_indices(
-            self.client, search_pattern=pattern, include_hidden=include_hidden
-        )
-        self.indices = self.all_indices[:]
+        if self.session:
+            self._all_indices = self.session.get_indices(
+                self.client, search_pattern=pattern, include_hidden=include_hidden
+            )
+        else:
+            self._all_indices = get_indices(
+                self.client, search_pattern=pattern, include_hidden=include_hidden
+            )
+        self._indices = ActionableList(self._all_indices)
+        self._excluded = set()
         # if self.indices:
         #     for index in self.indices:
         #         self.__build_index_info(index)
@@ -96,8 +221,8 @@ class IndexList:
         sub-dictionary structure under that key.
         """
         self.loggit.debug('Building preliminary index metadata for %s', index)
-        if index not in self.index_info:
-            self.index_info[index] = self.__zero_values()
+        with self._lock:
+            self.index_info.add(index)
 
     def __map_method(self, ftype):
         methods = {
@@ -120,6 +245,41 @@ class IndexList:
         }
         return methods[ftype]
 
+    def __metadata_needs(self, fil):
+        """
+        Return the metadata groups and any additional API calls the filter
+        described by ``fil`` will need
+        """
+        needs = {
+            'age': ['settings'],
+            'allocated': [],
+            'closed': ['state'],
+            'count': ['state', 'settings'],
+            'empty': ['state', 'stats'],
+            'forcemerged': ['state', 'settings', 'segments'],
+            'opened': ['state'],
+            'period': ['settings'],
+            'space': ['state', 'stats', 'settings'],
+            'shards': ['settings'],
+            'size': ['state', 'stats'],
+        }
+        extra_calls = {
+            'alias': ['indices.get_alias'],
+            'allocated': ['indices.get_settings'],
+            'ilm': ['indices.get_settings'],
+        }
+        ftype = fil.get('filtertype')
+        groups = list(needs.get(ftype, []))
+        calls = list(extra_calls.get(ftype, []))
+        uses_age = ftype in ['age', 'period'] or fil.get('use_age', False)
+        if uses_age and fil.get('source') == 'field_stats':
+            # field_stats omits closed and empty indices before searching
+            groups += ['state', 'stats']
+            if fil.get('time_series_bounds', False):
+                calls.append('indices.get_settings')
+            calls.append('msearch')
+        return groups, calls
+
     def __remove_missing(self, err):
         """
         Remove missing index found in ``err`` from self.indices and return that name
@@ -127,51 +287,95 @@ class IndexList:
         missing = err.info['error']['index']
         self.loggit.warning('Index was initiallly present, but now is not: %s', missing)
         self.loggit.debug('Removing %s from active IndexList', missing)
-        self.indices.remove(missing)
+        self.__exclude(missing)
         return missing
 
-    def __zero_values(self):
-        """The default values for index metadata"""
-        return {
-            'age': {'creation_date': 0, 'name': 0},
-            'docs': 0,
-            'number_of_replicas': 0,
-            'number_of_shards': 0,
-            'primary_size_in_bytes': 0,
-            'routing': {},
-            'segments': 0,
-            'size_in_bytes': 0,
-            'state': '',
-        }
+    def _get_cat_metadata(self, data):
+        """
+        Get state, doc counts, sizes, shard counts and creation date for every
+        index in ``data`` from a single :py:meth:`~.elasticsearch.client.CatClient.indices`
+        call. Sizes are requested in bytes.
+        """
+        return self.client.cat.indices(
+            index=to_csv(data),
+            format='json',
+            bytes='b',
+            h=(
+                'index,uuid,status,pri,rep,docs.count,store.size,pri.store.size,'
+                'creation.date'
+            ),
+        )
+
+    def _get_indices_cat(self, data):
+        """
+        :py:meth:`_get_cat_metadata` keyed by index name, for use as the
+        ``exec_func`` of :py:meth:`indices_exist`
+        """
+        return {entry['index']: entry for entry in self._get_cat_metadata(data)}
 
     def _get_indices_segments(self, data):
-        return self.client.indices.segments(index=to_csv(data))['indices'].copy()
+        # Only the segment count of each index, rather than the details of every
+        # segment of every shard
+        return self.client.indices.stats(
+            index=to_csv(data),
+            metric='segments',
+            filter_path=filter_path('index_segments'),
+        ).get('indices', {})
 
     def _get_indices_settings(self, data):
-        return self.client.indices.get_settings(index=to_csv(data))
+        return self.client.indices.get_settings(
+            index=to_csv(data), filter_path=filter_path('index_settings')
+        )
+
+    def _get_indices_time_series(self, data):
+        return self.client.indices.get_settings(
+            index=to_csv(data), name='index.time_series.*'
+        )
 
     def _get_indices_stats(self, data):
-        return self.client.indices.stats(index=to_csv(data), metric='store,docs')[
-            'indices'
-        ]
+        return self.client.indices.stats(
+            index=to_csv(data),
+            metric='store,docs',
+            filter_path=filter_path('index_stats'),
+        ).get('indices', {})
 
-    def _bulk_queries(self, data, exec_func):
-        slice_number = 10
+    def _chunked_query(self, data, exec_func, rejected=False):
+        """
+        Merge the results of ``exec_func`` for ``data``, split by :py:attr:`chunker`
+        into as many requests as the cluster accepts. If ``rejected``, a single
+        request for all of ``data`` was already rejected for its size.
+        """
         query_result = {}
-        loop_number = (
-            round(len(data) / slice_number)
-            if round(len(data) / slice_number) > 0
-            else 1
-        )
-        self.loggit.debug("Bulk Queries - number requests created: %s", loop_number)
-        for num in range(0, loop_number):
-            if num == (loop_number - 1):
-                data_sliced = data[num * slice_number :]
-            else:
-                data_sliced = data[num * slice_number : (num + 1) * slice_number]
-            query_result.update(exec_func(data_sliced))
+        for result in self.chunker.call(data, exec_func, rejected=rejected):
+            query_result.update(result)
         return query_result
 
+    def _chunk_map(self, func, chunks):
+        """
+        Call ``func`` for each chunk in ``chunks``, with up to
+        :py:attr:`max_concurrent_requests` calls in flight at the same time.
+
+        Only the requests are made concurrently. The results are returned in
+        ``chunks`` order, so the caller merges them into ``index_info`` from a
+        single thread.
+
+        :param func: The function to call with each chunk of index names
+        :param chunks: A list of lists of index names, as returned by
+            :py:meth:`~.curator.chunker.RequestChunker.chunks`
+
+        :type func: function
+        :type chunks: list
+
+        :returns: The return value of ``func`` for each chunk
+        :rtype: list
+        """
+        workers = min(self.max_concurrent_requests, len(chunks))
+        if workers < 2:
+            return [func(chunk) for chunk in chunks]
+        self.loggit.debug('Fetching %s chunks with %s workers', len(chunks), workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, chunks))
+
     def mitigate_alias(self, index):
         """
         Mitigate when an alias is detected instead of an index name
@@ -187,45 +391,73 @@ class IndexList:
         self.loggit.debug(
             'Correcting an instance where an alias name points to index "%s"', index
         )
-        data = self.client.indices.get(index=index)
-        aliases = list(data[index]['aliases'])
-        if aliases:
+        aliases = [
+            alias
+            for alias, indices in self._get_alias_map().items()
+            if index in indices
+        ]
+        # Concurrent chunk fetches may find the same alias at the same time
+        with self._lock:
             for alias in aliases:
                 if alias in self.indices:
                     self.loggit.warning(
                         'Removing alias "%s" from IndexList.indices', alias
                     )
-                    self.indices.remove(alias)
-                if alias in list(self.index_info):
+                    self.__exclude(alias)
+                if alias in self.index_info:
                     self.loggit.warning(
                         'Removing alias "%s" from IndexList.index_info', alias
                     )
                     del self.index_info[alias]
-        self.loggit.debug('Adding "%s" to IndexList.indices', index)
-        self.indices.append(index)
-        self.loggit.debug(
-            'Adding preliminary metadata for "%s" to IndexList.index_info', index
-        )
-        self.__build_index_info(index)
+            if index not in self.indices:
+                self.loggit.debug('Adding "%s" to IndexList.indices', index)
+                self.indices.append(index)
+            self.loggit.debug(
+                'Adding preliminary metadata for "%s" to IndexList.index_info', index
+            )
+            self.__build_index_info(index)
         self.loggit.debug('END mitigate_alias')
 
+    def _get_alias_map(self):
+        """
+        Map every alias in the cluster to the indices it points to, from a single
+        :py:meth:`~.elasticsearch.client.CatClient.aliases` call. The map is
+        collected once and cached for the life of this object, or of ``session``,
+        if set.
+
+        :returns: A dictionary of alias names, each with a list of index names
+        :rtype: dict
+        """
+        with self._lock:
+            if self._alias_map is None and self.session:
+                self._alias_map = self.session.alias_map
+            if self._alias_map is None:
+                self.loggit.debug('Getting all aliases in the cluster')
+                alias_map = {}
+                for entry in self.client.cat.aliases(format='json', h='alias,index'):
+                    alias_map.setdefault(entry['alias'], []).append(entry['index'])
+                self._alias_map = alias_map
+                if self.session:
+                    self.session.alias_map = alias_map
+            return self._alias_map
+
     def alias_index_check(self, data):
         """
         Check each index in data to see if it's an alias.
         """
         # self.loggit.debug('BEGIN alias_index_check')
-        working_list = data[:]
+        alias_map = self._get_alias_map()
+        working_list = [entry for entry in data if entry in alias_map]
         for entry in working_list:
-            if self.client.indices.exists_alias(name=entry):
-                index = list(self.client.indices.get_alias(name=entry).keys())[0]
-                self.loggit.warning(
-                    '"%s" is actually an alias for index "%s"', entry, index
-                )
-                self.mitigate_alias(index)
-                # The mitigate_alias step ensures that the class ivars are handled
-                # properly. The following ensure that we pass back a modified list
-                data.remove(entry)
-                data.append(index)
+            index = alias_map[entry][0]
+            self.loggit.warning(
+                '"%s" is actually an alias for index "%s"', entry, index
+            )
+            self.mitigate_alias(index)
+            # The mitigate_alias step ensures that the class ivars are handled
+            # properly. The following ensure that we pass back a modified list
+            data.remove(entry)
+            data.append(index)
         # self.loggit.debug('END alias_index_check')
         return data
 
@@ -241,14 +473,23 @@ class IndexList:
             except NotFoundError as err:
                 data.remove(self.__remove_missing(err))
                 continue
-            except TransportError as err:
-                if '413' in err.errors:
-                    msg = (
-                        'Huge Payload 413 Err - Trying to get information via '
-                        'multiple requests'
-                    )
-                    self.loggit.debug(msg)
-                    working_list.update(self._bulk_queries(verified_data, exec_func))
+            except (ApiError, TransportError) as err:
+                if not too_long(err):
+                    if isinstance(err, ApiError):
+                        raise
+                    # Transport errors other than a rejected payload are not fatal
+                    self.loggit.debug('Transport error: %s', err)
+                    checking = False
+                    continue
+                self.loggit.debug(
+                    'Request too long for the cluster. Trying to get information '
+                    'via multiple requests'
+                )
+                if len(verified_data) < 2:
+                    raise
+                working_list.update(
+                    self._chunked_query(verified_data, exec_func, rejected=True)
+                )
             checking = False
         # self.loggit.debug('END indices_exist')
         return working_list
@@ -276,7 +517,7 @@ class IndexList:
                         sii = self.index_info[index]
                         working_list = {}
                         try:
-                            working_list.update(self._bulk_queries(data, exec_func))
+                            working_list.update(self._chunked_query(data, exec_func))
                         except NotFoundError as err:
                             data.remove(self.__remove_missing(err))
                             continue
@@ -286,25 +527,56 @@ class IndexList:
 
     def population_check(self, index, key):
         """Verify that key is in self.index_info[index], and that it is populated"""
-        retval = True
-        # self.loggit.debug('BEGIN population_check')
-        # self.loggit.debug('population_check: %s, %s', index, key)
         if index not in self.index_info:
             # This is just in case the index was somehow not populated
             self.__build_index_info(index)
-        if key not in self.index_info[index]:
-            self.index_info[index][key] = self.__zero_values()[key]
-        if self.index_info[index][key] == self.__zero_values()[key]:
-            retval = False
-        # self.loggit.debug('END population_check')
-        return retval
+        return self.index_info.populated(index, key)
+
+    def _populate_from_cat(self, entry):
+        """
+        Populate ``index_info`` for the index in ``entry``, a single row of
+        :py:meth:`_get_cat_metadata` output. Columns which are missing or ``None``,
+        e.g. doc counts and sizes for closed indices, are left untouched so that
+        the settings or stats APIs can fill them in later.
+
+        :param entry: A single row of ``_cat/indices`` output in JSON format
+        :type entry: dict
+        """
+        index = entry['index']
+        if index not in self.index_info:
+            self.loggit.warning(
+                'Index %s was not present at IndexList initialization, '
+                'and may be behind an alias',
+                index,
+            )
+            self.mitigate_alias(index)
+        sii = self.index_info[index]
+        sii['state'] = entry['status']
+        if entry.get('uuid') is not None:
+            sii['uuid'] = entry['uuid']
+        if entry.get('pri') is not None:
+            sii['number_of_shards'] = entry['pri']
+        if entry.get('rep') is not None:
+            sii['number_of_replicas'] = entry['rep']
+        if entry.get('creation.date') is not None:
+            sii['age']['creation_date'] = fix_epoch(entry['creation.date'])
+        if entry.get('docs.count') is not None:
+            sii['docs'] = int(entry['docs.count'])
+        if entry.get('store.size') is not None:
+            sii['size_in_bytes'] = int(entry['store.size'])
+        if entry.get('pri.store.size') is not None:
+            sii['primary_size_in_bytes'] = int(entry['pri.store.size'])
 
     def needs_data(self, indices, fields):
-        """Check for data population in self.index_info"""
+        """
+        Check for data population in self.index_info
+
+        This is a local check only. Whichever call then collects the data for the
+        needful indices also discovers any that no longer exist.
+        """
         self.loggit.debug('Indices: %s, Fields: %s', indices, fields)
         needful = []
-        working_list = self.indices_exist(indices, self._get_indices_settings)
-        for idx in working_list:
+        for idx in indices:
             count = 0
             for field in fields:
                 # If the return value is True for this field, it means it's populated
@@ -315,7 +587,7 @@ class IndexList:
                 needful.append(idx)
         if fields == ['state']:
             self.loggit.debug('Always check open/close for all passed indices')
-            needful = list(working_list.keys())
+            needful = list(indices)
         self.loggit.debug('These indices need data in index_info: %s', needful)
         return needful
 
@@ -326,67 +598,133 @@ class IndexList:
             number_of_replicas
             number_of_shards
             routing information (if present)
+
+        Everything but routing is provided by the ``_cat/indices`` API, so the
+        index settings API is only called for indices where ``_cat`` was unable to
+        provide a value. Routing information is populated whenever the settings API
+        is called.
         """
         self.loggit.debug('Getting index settings -- BEGIN')
         self.empty_list_check()
-        fields = ['age', 'number_of_replicas', 'number_of_shards', 'routing']
-        for lst in chunk_index_list(self.indices):
+        fields = ['age', 'number_of_replicas', 'number_of_shards']
+
+        def cat_chunk(lst):
             # This portion here is to ensure that we're not polling for data
             # unless we must
             needful = self.needs_data(lst, fields)
             if not needful:
                 # All indices are populated with some data, so we can skip
                 # data collection
-                continue
-            # Now we only need to run on the 'needful'
-            for sii, wli, _ in self.data_getter(needful, self._get_indices_settings):
-                sii['age']['creation_date'] = fix_epoch(
-                    wli['settings']['index']['creation_date']
-                )
-                sii['number_of_replicas'] = wli['settings']['index'][
-                    'number_of_replicas'
-                ]
-                sii['number_of_shards'] = wli['settings']['index']['number_of_shards']
-                if 'routing' in wli['settings']['index']:
-                    sii['routing'] = wli['settings']['index']['routing']
+                return needful, {}
+            rows = self.indices_exist(needful, self._get_indices_cat)
+            # indices_exist may have dropped missing indices or resolved aliases
+            return list(rows), rows
+
+        remaining = []
+        for needful, rows in self._chunk_map(
+            cat_chunk, self.chunker.chunks(self.indices)
+        ):
+            for entry in rows.values():
+                self._populate_from_cat(entry)
+            # Only use the settings API for what _cat could not provide
+            needful = [
+                idx
+                for idx in needful
+                if not any(self.population_check(idx, fld) for fld in fields)
+            ]
+            if needful:
+                remaining.append(needful)
+
+        def settings_chunk(lst):
+            return list(self.data_getter(lst, self._get_indices_settings))
+
+        results = self._chunk_map(settings_chunk, remaining)
+        for sii, wli, _ in itertools.chain.from_iterable(results):
+            self._populate_from_settings(sii, wli)
         self.loggit.debug('Getting index settings -- END')
 
+    def _populate_from_settings(self, sii, wli):
+        """
+        Populate the ``index_info`` record ``sii`` from ``wli``, the response of
+        the index settings API for that index. Any caller that fetches index
+        settings passes them through here, so they are never fetched twice.
+        """
+        idx_settings = wli['settings']['index']
+        if 'creation_date' in idx_settings:
+            sii['age']['creation_date'] = fix_epoch(idx_settings['creation_date'])
+        for field in ['number_of_replicas', 'number_of_shards']:
+            if field in idx_settings:
+                sii[field] = idx_settings[field]
+        # An empty dict marks routing as populated, even if there is none
+        sii['routing'] = idx_settings.get('routing', {})
+
+    def get_index_routing(self):
+        """
+        For each index in self.indices, populate ``index_info`` with routing
+        information from the index settings API, which is the only source for it.
+        The settings API is only called for indices where routing is not yet
+        populated, and the rest of the response is used to populate
+        ``index_info`` as well.
+        """
+        self.loggit.debug('Getting index routing -- BEGIN')
+        self.empty_list_check()
+        if self.metadata_cache:
+            # The cache is keyed by index UUID, which comes with the index state
+            self.get_index_state()
+
+        def settings_chunk(lst):
+            needful = self.needs_data(lst, ['routing'])
+            if not needful:
+                return []
+            return list(self.data_getter(needful, self._get_indices_settings))
+
+        results = self._chunk_map(settings_chunk, self.chunker.chunks(self.indices))
+        for sii, wli, _ in itertools.chain.from_iterable(results):
+            self._populate_from_settings(sii, wli)
+        self.loggit.debug('Getting index routing -- END')
+
     def get_index_state(self):
         """
         For each index in self.indices, populate ``index_info`` with:
 
             state (open or closed)
 
-        from the cat API
+        from the cat API. As the same call returns them, doc counts, sizes, shard
+        and replica counts, and creation dates are populated as well.
         """
         self.loggit.debug('Getting index state -- BEGIN')
         self.empty_list_check()
-        fields = ['state']
-        for lst in chunk_index_list(self.indices):
-            # This portion here is to ensure that we're not polling for data
-            # unless we must
-            needful = self.needs_data(lst, fields)
+        if self._state_is_fresh or self.session:
+            # State collected in this filter chain, or since the last action that
+            # could have changed it, is still current
+            todo = [
+                idx for idx in self.indices if not self.population_check(idx, 'state')
+            ]
+            if not todo:
+                self.loggit.debug('Index state already collected')
+                return
+        else:
             # Checking state is _always_ needful.
-            resp = self.client.cat.indices(
-                index=to_csv(needful), format='json', h='index,status'
-            )
-            for entry in resp:
-                try:
-                    self.index_info[entry['index']]['state'] = entry['status']
-                except KeyError:
-                    self.loggit.warning(
-                        'Index %s was not present at IndexList initialization, '
-                        'and may be behind an alias',
-                        entry['index'],
-                    )
-                    self.mitigate_alias(entry['index'])
-                    self.index_info[entry['index']]['state'] = entry['status']
+            todo = self.needs_data(self.indices, ['state'])
+
+        def cat_chunk(lst):
+            return self.indices_exist(lst, self._get_indices_cat)
+
+        for rows in self._chunk_map(cat_chunk, self.chunker.chunks(todo)):
+            for entry in rows.values():
+                self._populate_from_cat(entry)
+        if self.metadata_cache:
+            self.load_metadata_cache()
         # self.loggit.debug('Getting index state -- END')
 
     def get_index_stats(self):
         """
         Populate ``index_info`` with index ``size_in_bytes``,
         ``primary_size_in_bytes`` and doc count information for each index.
+
+        These values are collected from the ``_cat/indices`` API call made by
+        :py:meth:`get_index_state`. The index stats API is only called for open
+        indices where ``_cat`` was unable to provide them.
         """
         self.loggit.debug('Getting index stats -- BEGIN')
         self.empty_list_check()
@@ -395,55 +733,70 @@ class IndexList:
         self.get_index_state()
         # Don't populate working_list until after the get_index state as it
         # can and will remove missing indices
-        working_list = self.working_list()
-        for index in self.working_list():
-            if self.index_info[index]['state'] == 'close':
-                working_list.remove(index)
+        working_list = [
+            index
+            for index in self.working_list()
+            if self.index_info[index]['state'] != 'close'
+        ]
         if working_list:
-            index_lists = chunk_index_list(working_list)
-            for lst in index_lists:
+
+            def stats_chunk(lst):
                 # This portion here is to ensure that we're not polling for data
                 # unless we must
                 needful = self.needs_data(lst, fields)
                 if not needful:
                     # All indices are populated with some data, so we can skip
                     # data collection
-                    continue
+                    return []
                 # Now we only need to run on the 'needful'
-                for sii, wli, index in self.data_getter(
-                    needful, self._get_indices_stats
-                ):
-                    try:
-                        size = wli['total']['store']['size_in_bytes']
-                        docs = wli['total']['docs']['count']
-                        primary_size = wli['primaries']['store']['size_in_bytes']
-                        msg = (
-                            f'Index: {index}  Size: {byte_size(size)}  Docs: {docs} '
-                            f'PrimarySize: {byte_size(primary_size)}'
-                        )
-                        self.loggit.debug(msg)
-                        sii['size_in_bytes'] = size
-                        sii['docs'] = docs
-                        sii['primary_size_in_bytes'] = primary_size
-                    except KeyError:
-                        msg = f'Index stats missing for "{index}" -- might be closed'
-                        self.loggit.warning(msg)
+                return list(self.data_getter(needful, self._get_indices_stats))
+
+            results = self._chunk_map(stats_chunk, self.chunker.chunks(working_list))
+            for sii, wli, index in itertools.chain.from_iterable(results):
+                try:
+                    size = wli['total']['store']['size_in_bytes']
+                    # Primaries only, as counted by _cat/indices
+                    docs = wli['primaries']['docs']['count']
+                    primary_size = wli['primaries']['store']['size_in_bytes']
+                    msg = (
+                        f'Index: {index}  Size: {byte_size(size)}  Docs: {docs} '
+                        f'PrimarySize: {byte_size(primary_size)}'
+                    )
+                    self.loggit.debug(msg)
+                    sii['size_in_bytes'] = size
+                    sii['docs'] = docs
+                    sii['primary_size_in_bytes'] = primary_size
+                except KeyError:
+                    msg = f'Index stats missing for "{index}" -- might be closed'
+                    self.loggit.warning(msg)
         # self.loggit.debug('Getting index stats -- END')
 
     def get_segment_counts(self):
         """
-        Populate ``index_info`` with segment information for each index.
+        Populate ``index_info`` with the segment count of each index, from the
+        segments metric of the index stats API.
         """
         self.loggit.debug('Getting index segment counts')
         self.empty_list_check()
-        for lst in chunk_index_list(self.indices):
-            for sii, wli, _ in self.data_getter(lst, self._get_indices_segments):
-                shards = wli['shards']
-                segmentcount = 0
-                for shardnum in shards:
-                    for shard in range(0, len(shards[shardnum])):
-                        segmentcount += shards[shardnum][shard]['num_search_segments']
-                sii['segments'] = segmentcount
+
+        def segments_chunk(lst):
+            # Closed indices have no segments to count
+            needful = [
+                idx
+                for idx in self.needs_data(lst, ['segments'])
+                if self.index_info[idx]['state'] != 'close'
+            ]
+            if not needful:
+                return []
+            return list(self.data_getter(needful, self._get_indices_segments))
+
+        results = self._chunk_map(segments_chunk, self.chunker.chunks(self.indices))
+        for sii, wli, index in itertools.chain.from_iterable(results):
+            try:
+                # The sum over all shards, primaries and replicas alike
+                sii['segments'] = wli['total']['segments']['count']
+            except KeyError:
+                self.loggit.warning('Segment count missing for "%s"', index)
 
     def empty_list_check(self):
         """Raise :py:exc:`~.curator.exceptions.NoIndices` if ``indices`` is empty"""
@@ -482,15 +835,22 @@ class IndexList:
                     f'Removing from actionable list'
                 )
                 self.loggit.debug(msg)
-                self.indices.remove(index)
+                self.__exclude(index)
 
-    def _get_field_stats_dates(self, field='@timestamp'):
+    def _get_field_stats_dates(self, field='@timestamp', time_series_bounds=False):
         """
         Add indices to ``index_info`` based on the values the queries return, as
         determined by the min and max aggregated values of ``field``
 
+        The queries are sent in multi-search requests of up to
+        ``MSEARCH_BATCH_SIZE`` indices each, with up to
+        :py:attr:`max_concurrent_requests` requests in flight at the same time.
+
         :param field: The field with the date value.  The field must be mapped in
             elasticsearch as a date datatype. Default: ``@timestamp``
+        :param time_series_bounds: Use the ``index.time_series.start_time`` and
+            ``index.time_series.end_time`` settings of time series indices as their
+            min and max values, rather than querying them. Default: ``False``
         """
         self.loggit.debug('Cannot query closed indices. Omitting any closed indices.')
         self.filter_closed()
@@ -503,30 +863,94 @@ class IndexList:
             field,
         )
         self.empty_list_check()
-        index_lists = chunk_index_list(self.indices)
-        for lst in index_lists:
-            for index in lst:
-                aggs = {
-                    'min': {'min': {'field': field}},
-                    'max': {'max': {'field': field}},
-                }
-                response = self.client.search(index=index, size=0, aggs=aggs)
+        todo = self.working_list()
+        if time_series_bounds:
+            todo = self._get_time_series_dates(todo)
+        aggs = {
+            'min': {'min': {'field': field}},
+            'max': {'max': {'field': field}},
+        }
+
+        def search_batch(batch):
+            searches = []
+            for index in batch:
+                searches.extend([{'index': index}, {'size': 0, 'aggs': aggs}])
+            return self.client.msearch(searches=searches)['responses']
+
+        batches = [
+            todo[pos : pos + MSEARCH_BATCH_SIZE]
+            for pos in range(0, len(todo), MSEARCH_BATCH_SIZE)
+        ]
+        for batch, responses in zip(batches, self._chunk_map(search_batch, batches)):
+            for index, response in zip(batch, responses):
                 self.loggit.debug('RESPONSE: %s', response)
-                if response:
-                    try:
-                        res = response['aggregations']
-                        self.loggit.debug('res: %s', res)
-                        data = self.index_info[index]['age']
-                        data['min_value'] = fix_epoch(res['min']['value'])
-                        data['max_value'] = fix_epoch(res['max']['value'])
-                        self.loggit.debug('data: %s', data)
-                    except KeyError as exc:
-                        raise ActionError(
-                            f'Field "{field}" not found in index "{index}"'
-                        ) from exc
+                if not response:
+                    continue
+                if 'error' in response:
+                    raise ActionError(
+                        f'Unable to query field "{field}" in index "{index}": '
+                        f'{response["error"]}'
+                    )
+                try:
+                    res = response['aggregations']
+                    self.loggit.debug('res: %s', res)
+                    data = self.index_info[index]['age']
+                    data['min_value'] = fix_epoch(res['min']['value'])
+                    data['max_value'] = fix_epoch(res['max']['value'])
+                    self.loggit.debug('data: %s', data)
+                except KeyError as exc:
+                    raise ActionError(
+                        f'Field "{field}" not found in index "{index}"'
+                    ) from exc
+
+    def _get_time_series_dates(self, indices):
+        """
+        Add the ``index.time_series.start_time`` and ``index.time_series.end_time``
+        settings of each time series index in ``indices`` to ``index_info`` as its
+        min and max values
+
+        :param indices: The index names
+        :type indices: list
+
+        :returns: The indices which are not time series indices, and must be queried
+        :rtype: list
+        """
+
+        def time_series_chunk(lst):
+            return self.indices_exist(lst, self._get_indices_time_series)
+
+        found = {}
+        for result in self._chunk_map(time_series_chunk, self.chunker.chunks(indices)):
+            found.update(result)
+        remaining = []
+        for index in indices:
+            bounds = (
+                found.get(index, {})
+                .get('settings', {})
+                .get('index', {})
+                .get('time_series', {})
+            )
+            try:
+                start = iso2epoch(bounds['start_time'])
+                end = iso2epoch(bounds['end_time'])
+            except (KeyError, ValueError):
+                remaining.append(index)
+                continue
+            self.loggit.debug(
+                'Index %s is a time series index from %s to %s', index, start, end
+            )
+            data = self.index_info[index]['age']
+            data['min_value'] = start
+            data['max_value'] = end
+        return remaining
 
     def _calculate_ages(
-        self, source=None, timestring=None, field=None, stats_result=None
+        self,
+        source=None,
+        timestring=None,
+        field=None,
+        stats_result=None,
+        time_series_bounds=False,
     ):
         """
         This method initiates index age calculation based on the given parameters.
@@ -543,13 +967,18 @@ class IndexList:
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used
             in conjunction with ``source=field_stats`` to choose whether to reference
             the min or max result value.
+        :param time_series_bounds: Only used for ``field_stats`` based calculations.
+            If ``True``, the start and end times of time series indices are used as
+            their min and max values, rather than querying them.
         """
         self.age_keyfield = source
+        self._age_source = None
         if source == 'name':
             if not timestring:
                 raise MissingArgument(
                     'source "name" requires the "timestring" keyword argument'
                 )
+            self._age_source = timestring
             self._get_name_based_ages(timestring)
         elif source == 'creation_date':
             # Nothing to do here as this comes from `get_settings` in __init__
@@ -562,28 +991,55 @@ class IndexList:
             if stats_result not in ['min_value', 'max_value']:
                 raise ValueError(f'Invalid value for "stats_result": {stats_result}')
             self.age_keyfield = stats_result
-            self._get_field_stats_dates(field=field)
+            self._age_source = (field, time_series_bounds)
+            self._get_field_stats_dates(
+                field=field, time_series_bounds=time_series_bounds
+            )
         else:
             raise ValueError(
                 f'Invalid source: {source}. Must be one of "name", "creation_date", '
                 f'"field_stats".'
             )
 
-    def _sort_by_age(self, index_list, reverse=True):
+    def _epoch_index(self, keyfield=None):
         """
-        Take a list of indices and sort them by date.
+        Get the sorted epoch index of the ``keyfield`` ages of ``indices``, as last
+        calculated by :py:meth:`_calculate_ages`. It is built on first use, and
+        shared by later filters for as long as it covers every index in
+        ``indices``.
 
-        By default, the youngest are first with ``reverse=True``, but the oldest
-        can be first by setting ``reverse=False``
+        :param keyfield: The age to index. Defaults to ``age_keyfield``
+        :type keyfield: str
+
+        :returns: The indices with a ``keyfield`` age, sorted by that age
+        :rtype: :py:class:`~.curator.helpers.date_ops.EpochIndex`
         """
-        # Do the age-based sorting here.
-        # Build an temporary dictionary with just index and age as the key and
-        # value, respectively
-        temp = {}
+        key = (keyfield or self.age_keyfield, self._age_source)
+        epochs = self._epoch_indices.get(key)
+        if epochs is not None and all(index in epochs for index in self.indices):
+            return epochs
+        ages = {}
+        for index in self.indices:
+            age = self.index_info[index]['age'].get(key[0])
+            if age is not None:
+                ages[index] = int(age)
+        epochs = EpochIndex(ages)
+        self._epoch_indices[key] = epochs
+        return epochs
+
+    def _get_age_keys(self, index_list):
+        """
+        Get the ``age_keyfield`` age of each index in ``index_list``. Indices with
+        no age are excluded.
+
+        :returns: The age of each index with one
+        :rtype: dict
+        """
+        ages = {}
         for index in index_list:
             try:
                 if self.index_info[index]['age'][self.age_keyfield]:
-                    temp[index] = self.index_info[index]['age'][self.age_keyfield]
+                    ages[index] = self.index_info[index]['age'][self.age_keyfield]
                 else:
                     msg = (
                         f'No date for "{index}" in IndexList metadata. '
@@ -596,14 +1052,19 @@ class IndexList:
                     f'metadata'
                 )
                 self.__excludify(True, True, index, msg)
-        # Sort alphabetically prior to age sort to keep sorting consistent
-        temp_tuple = sorted(temp.items(), key=lambda k: k[0], reverse=reverse)
-        # If reverse is True, this will sort so the youngest indices are first.
-        # However, if you want oldest first, set reverse to False.
-        # Effectively, this should set us up to act on everything older than
-        # meets the other set criteria. It starts as a tuple, but then becomes a list.
-        sorted_tuple = sorted(temp_tuple, key=lambda k: k[1], reverse=reverse)
-        return [x[0] for x in sorted_tuple]
+        return ages
+
+    def _sort_by_age(self, index_list, reverse=True):
+        """
+        Take a list of indices and sort them by date.
+
+        By default, the youngest are first with ``reverse=True``, but the oldest
+        can be first by setting ``reverse=False``
+        """
+        ages = self._get_age_keys(index_list)
+        # Indices of the same age are sorted by name, in the same direction, to keep
+        # sorting consistent
+        return self._epoch_index().ordered(ages, reverse=reverse)
 
     def filter_by_regex(self, kind=None, value=None, exclude=False):
         """
@@ -655,6 +1116,7 @@ class IndexList:
         epoch=None,
         exclude=False,
         unit_count_pattern=False,
+        time_series_bounds=False,
     ):
         """
         Match indices by relative age calculations.
@@ -675,6 +1137,11 @@ class IndexList:
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used
             in conjunction with ``source=field_stats`` to choose whether to reference
             the minimum or maximum result value.
+        :param time_series_bounds: Only used for ``field_stats`` based calculations.
+            If ``True``, the ``index.time_series.start_time`` and
+            ``index.time_series.end_time`` settings of time series indices are used
+            as their minimum and maximum values, rather than querying them.
+            Default is ``False``
         :param epoch: An epoch timestamp used in conjunction with ``unit`` and
             ``unit_count`` to establish a point of reference for calculations.
             If not provided, the current time will be used.
@@ -692,7 +1159,11 @@ class IndexList:
         # This filter requires index settings.
         self.get_index_settings()
         self._calculate_ages(
-            source=source, timestring=timestring, field=field, stats_result=stats_result
+            source=source,
+            timestring=timestring,
+            field=field,
+            stats_result=stats_result,
+            time_series_bounds=time_series_bounds,
         )
         if unit_count_pattern:
             try:
@@ -705,82 +1176,90 @@ class IndexList:
                     exc,
                 )
                 unit_count_matcher = None
+        epochs = self._epoch_index()
+        indices = []
         for index in self.working_list():
-            try:
-                remove_this_index = False
-                age = int(self.index_info[index]['age'][self.age_keyfield])
-                # if age == 0:
-                #     msg = (
-                #         f'Evaluating {index} resulted in an epoch timestamp of '
-                #         f'0, meaning there is no associated date. Removing from '
-                #         f'the actionable list.'
-                #     )
-                #     self.loggit.debug(msg)
-                #     self.indices.remove(index)
-                #     continue
-                msg = (
-                    f'Index "{index}" age ({age}), direction: "{direction}", point of '
-                    f'reference, ({por})'
+            if index in epochs:
+                indices.append(index)
+            else:
+                self.loggit.debug(
+                    'Index "%s" does not meet provided criteria. Removing from list.',
+                    index,
                 )
-                # Because time adds to epoch, smaller numbers are actually older
-                # timestamps.
-                if unit_count_pattern:
-                    msg = (
-                        f'unit_count_pattern is set, trying to match pattern to '
-                        f'index "{index}"'
-                    )
-                    self.loggit.debug(msg)
-                    unit_count_from_index = get_unit_count_from_name(
-                        index, unit_count_matcher
-                    )
-                    if unit_count_from_index:
-                        self.loggit.debug(
-                            'Pattern matched, applying unit_count of  "%s"',
-                            unit_count_from_index,
-                        )
-                        adjustedpor = get_point_of_reference(
-                            unit, unit_count_from_index, epoch
-                        )
-                        msg = (
-                            f'Adjusting point of reference from {por} to {adjustedpor} '
-                            f'based on unit_count of {unit_count_from_index} from '
-                            f'index name'
-                        )
-                        self.loggit.debug(msg)
-                    elif unit_count == -1:
-                        # Unable to match pattern and unit_count is -1, meaning no
-                        # fallback, so this index is removed from the list
-                        msg = (
-                            f'Unable to match pattern and no fallback value set. '
-                            f'Removing index "{index}" from actionable list'
-                        )
-                        self.loggit.debug(msg)
-                        remove_this_index = True
-                        adjustedpor = por
-                        # necessary to avoid exception if the first index is excluded
-                    else:
-                        # Unable to match the pattern and unit_count is set, so
-                        # fall back to using unit_count for determining whether
-                        # to keep this index in the list
-                        self.loggit.debug(
-                            'Unable to match pattern using fallback value of "%s"',
-                            unit_count,
-                        )
-                        adjustedpor = por
-                else:
-                    adjustedpor = por
-                if direction == 'older':
-                    agetest = age < adjustedpor
-                else:
-                    agetest = age > adjustedpor
-                self.__excludify(agetest and not remove_this_index, exclude, index, msg)
-            except KeyError:
-                msg = (
-                    f'Index "{index}" does not meet provided criteria. '
-                    f'Removing from list.'
+                self.__exclude(index)
+        ages = [epochs.ages[index] for index in indices]
+        points = por
+        # Because time adds to epoch, smaller numbers are actually older timestamps.
+        if unit_count_pattern:
+            points, removals = self.__unit_count_points(
+                indices, por, unit, unit_count, unit_count_matcher, epoch
+            )
+            behavior = 'less_than' if direction == 'older' else 'greater_than'
+            conditions = [
+                cond and not removal
+                for cond, removal in zip(compare(ages, behavior, points), removals)
+            ]
+        else:
+            matched = epochs.older(por) if direction == 'older' else epochs.younger(por)
+            conditions = [index in matched for index in indices]
+
+        def reason(pos):
+            point = points[pos] if unit_count_pattern else points
+            return (
+                f'Index "{indices[pos]}" age ({ages[pos]}), direction: "{direction}", '
+                f'point of reference, ({point})'
+            )
+
+        self.__excludify_all(indices, conditions, exclude, reason)
+
+    def __unit_count_points(self, indices, por, unit, unit_count, matcher, epoch):
+        """
+        Get the point of reference of each of ``indices`` from the ``unit_count``
+        matched in its name by ``matcher``, and whether it must be removed because
+        nothing matched and there is no fallback ``unit_count``.
+        """
+        points = []
+        removals = []
+        for index in indices:
+            self.loggit.debug(
+                'unit_count_pattern is set, trying to match pattern to index "%s"',
+                index,
+            )
+            removal = False
+            adjustedpor = por
+            unit_count_from_index = get_unit_count_from_name(index, matcher)
+            if unit_count_from_index:
+                self.loggit.debug(
+                    'Pattern matched, applying unit_count of  "%s"',
+                    unit_count_from_index,
                 )
-                self.loggit.debug(msg)
-                self.indices.remove(index)
+                adjustedpor = get_point_of_reference(unit, unit_count_from_index, epoch)
+                self.loggit.debug(
+                    'Adjusting point of reference from %s to %s based on unit_count '
+                    'of %s from index name',
+                    por,
+                    adjustedpor,
+                    unit_count_from_index,
+                )
+            elif unit_count == -1:
+                # Unable to match pattern and unit_count is -1, meaning no
+                # fallback, so this index is removed from the list
+                self.loggit.debug(
+                    'Unable to match pattern and no fallback value set. Removing '
+                    'index "%s" from actionable list',
+                    index,
+                )
+                removal = True
+            else:
+                # Unable to match the pattern and unit_count is set, so
+                # fall back to using unit_count for determining whether
+                # to keep this index in the list
+                self.loggit.debug(
+                    'Unable to match pattern using fallback value of "%s"', unit_count
+                )
+            points.append(adjustedpor)
+            removals.append(removal)
+        return points, removals
 
     def filter_by_space(
         self,
@@ -793,6 +1272,7 @@ class IndexList:
         stats_result='min_value',
         exclude=False,
         threshold_behavior='greater_than',
+        time_series_bounds=False,
     ):
         """
         Remove indices from the actionable list based on space consumed, sorted
@@ -832,6 +1312,10 @@ class IndexList:
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used if
             ``source=field_stats`` is selected. It determines whether to reference
             the minimum or maximum value of `field` in each index.
+        :param time_series_bounds: Only used if ``source=field_stats``. If ``True``,
+            the ``index.time_series.start_time`` and ``index.time_series.end_time``
+            settings of time series indices are used as their minimum and maximum
+            values, rather than querying them. Default is ``False``
         :param exclude: If ``exclude=True``, this filter will remove matching
             indices from ``indices``. If ``exclude=False``, then only matching
             indices will be kept in ``indices``. Default is ``False``
@@ -848,7 +1332,6 @@ class IndexList:
         self.get_index_stats()
         self.get_index_settings()
         disk_space = float(disk_space)
-        disk_usage = 0.0
         disk_limit = disk_space * 2**30
         msg = (
             'Cannot get disk usage info from closed indices. Omitting any '
@@ -862,6 +1345,7 @@ class IndexList:
                 timestring=timestring,
                 field=field,
                 stats_result=stats_result,
+                time_series_bounds=time_series_bounds,
             )
             # Using default value of reverse=True in self._sort_by_age()
             self.loggit.debug('SORTING BY AGE')
@@ -869,16 +1353,19 @@ class IndexList:
         else:
             # Default to sorting by index name
             sorted_indices = sorted(self.working_list(), reverse=reverse)
-        for index in sorted_indices:
-            disk_usage += self.index_info[index]['size_in_bytes']
-            msg = (
-                f'{index}, summed disk usage is {byte_size(disk_usage)} and disk limit '
-                f'is {byte_size(disk_limit)}.'
+        disk_usage = running_total(
+            [self.index_info[index]['size_in_bytes'] for index in sorted_indices]
+        )
+        conditions = compare(disk_usage, threshold_behavior, disk_limit)
+
+        def reason(pos):
+            return (
+                f'{sorted_indices[pos]}, summed disk usage is '
+                f'{byte_size(disk_usage[pos])} and disk limit is '
+                f'{byte_size(disk_limit)}.'
             )
-            if threshold_behavior == 'greater_than':
-                self.__excludify((disk_usage > disk_limit), exclude, index, msg)
-            elif threshold_behavior == 'less_than':
-                self.__excludify((disk_usage < disk_limit), exclude, index, msg)
+
+        self.__excludify_all(sorted_indices, conditions, exclude, reason)
 
     def filter_kibana(self, exclude=True):
         """
@@ -1013,29 +1500,25 @@ class IndexList:
             raise MissingArgument('No value for "value" provided')
         if allocation_type not in ['include', 'exclude', 'require']:
             raise ValueError(f'Invalid "allocation_type": {allocation_type}')
-        # This filter requires index settings
-        self.get_index_settings()
-        self.get_index_state()
         self.empty_list_check()
-        for lst in chunk_index_list(self.indices):
-            working_list = self._get_indices_settings(lst)
-            if working_list:
-                for index in list(working_list.keys()):
-                    try:
-                        has_routing = (
-                            working_list[index]['settings']['index']['routing'][
-                                'allocation'
-                            ][allocation_type][key]
-                            == value
-                        )
-                    except KeyError:
-                        has_routing = False
-                    # if has_routing:
-                    msg = (
-                        f'{index}: Routing (mis)match: '
-                        f'index.routing.allocation.{allocation_type}.{key}={value}.'
-                    )
-                    self.__excludify(has_routing, exclude, index, msg)
+        # This filter requires the routing settings, which _cat does not provide
+        self.get_index_routing()
+        for index in self.working_list():
+            try:
+                has_routing = (
+                    self.index_info[index]['routing']['allocation'][allocation_type][
+                        key
+                    ]
+                    == value
+                )
+            except KeyError:
+                has_routing = False
+            # if has_routing:
+            msg = (
+                f'{index}: Routing (mis)match: '
+                f'index.routing.allocation.{allocation_type}.{key}={value}.'
+            )
+            self.__excludify(has_routing, exclude, index, msg)
 
     def filter_none(self):
         """The legendary NULL filter"""
@@ -1058,7 +1541,8 @@ class IndexList:
             raise MissingArgument('No value for "aliases" provided')
         aliases = ensure_list(aliases)
         self.empty_list_check()
-        for lst in chunk_index_list(self.indices):
+
+        def alias_chunk(lst):
             try:
                 # get_alias will either return {} or a NotFoundError.
                 has_alias = list(
@@ -1070,6 +1554,10 @@ class IndexList:
             except NotFoundError:
                 # if we see the NotFoundError, we need to set working_list to {}
                 has_alias = []
+            return lst, has_alias
+
+        chunks = self.chunker.chunks(self.indices)
+        for lst, has_alias in self._chunk_map(alias_chunk, chunks):
             for index in lst:
                 if index in has_alias:
                     isness = 'is'
@@ -1091,6 +1579,7 @@ class IndexList:
         field=None,
         stats_result='min_value',
         exclude=True,
+        time_series_bounds=False,
     ):
         """
         Remove indices from the actionable list beyond the number ``count``, sorted
@@ -1131,6 +1620,10 @@ class IndexList:
         :param stats_result: Either ``min_value`` or ``max_value``.  Only used if
             ``source=field_stats``. It determines whether to reference the minimum
             or maximum value of ``field`` in each index.
+        :param time_series_bounds: Only used if ``source=field_stats``. If ``True``,
+            the ``index.time_series.start_time`` and ``index.time_series.end_time``
+            settings of time series indices are used as their minimum and maximum
+            values, rather than querying them. Default is ``False``
         :param exclude: If ``exclude=True``, this filter will remove matching indices
             from ``indices``. If ``exclude=False``, then only matching indices
             will be kept in ``indices``. Default is ``True``
@@ -1154,64 +1647,59 @@ class IndexList:
                     raise ConfigurationError(
                         f'More than 1 regular expression group found in {pattern}'
                     )
-                # Prune indices not matching the regular expression the object
-                # (And filtered_indices) We do not want to act on them by accident.
-                prune_these = list(
-                    filter(lambda x: regex.match(x) is None, working_list)
-                )
-                filtered_indices = working_list
-                for index in prune_these:
-                    msg = '{index} does not match regular expression {pattern}.'
-                    condition = True
-                    exclude = True
-                    self.__excludify(condition, exclude, index, msg)
-                    # also remove it from filtered_indices
-                    filtered_indices.remove(index)
-                # Presort these filtered_indices using the lambda
-                presorted = sorted(
-                    filtered_indices, key=lambda x: regex.match(x).group(1)
-                )
             except Exception as exc:
                 raise ActionError(
                     f'Unable to process pattern: "{pattern}". Error: {exc}'
                 ) from exc
-            # Initialize groups here
-            groups = []
-            # We have to pull keys k this way, but we don't need to keep them
-            # We only need g for groups
-            for _, g in itertools.groupby(
-                presorted, key=lambda x: regex.match(x).group(1)
-            ):
-                groups.append(list(g))
+            # Match each index once, grouping by the capture group. Prune indices
+            # not matching the regular expression. We do not want to act on them by
+            # accident.
+            grouped = {}
+            for index in working_list:
+                match = regex.match(index)
+                if match is None:
+                    msg = f'{index} does not match regular expression {pattern}.'
+                    self.__excludify(True, True, index, msg)
+                else:
+                    grouped.setdefault(match.group(1), []).append(index)
+            groups = list(grouped.values())
         else:
             # Since pattern will create a list of lists, and we iterate over that,
             # we need to put our single list inside a list
             groups = [working_list]
+        if use_age and groups:
+            if source != 'name':
+                self.loggit.warning(
+                    'Cannot get age information from closed indices unless '
+                    'source="name".  Omitting any closed indices.'
+                )
+                self.filter_closed()
+            self._calculate_ages(
+                source=source,
+                timestring=timestring,
+                field=field,
+                stats_result=stats_result,
+                time_series_bounds=time_series_bounds,
+            )
         for group in groups:
             if use_age:
-                if source != 'name':
-                    self.loggit.warning(
-                        'Cannot get age information from closed indices unless '
-                        'source="name".  Omitting any closed indices.'
-                    )
-                    self.filter_closed()
-                self._calculate_ages(
-                    source=source,
-                    timestring=timestring,
-                    field=field,
-                    stats_result=stats_result,
-                )
-                # Using default value of reverse=True in self._sort_by_age()
-                sorted_indices = self._sort_by_age(group, reverse=reverse)
+                ages = self._get_age_keys(group)
+                keys = {index: (ages[index], index) for index in ages}
             else:
-                # Default to sorting by index name
-                sorted_indices = sorted(group, reverse=reverse)
-            idx = 1
-            for index in sorted_indices:
-                msg = f'{index} is {idx} of specified count of {count}.'
-                condition = True if idx <= count else False
-                self.__excludify(condition, exclude, index, msg)
-                idx += 1
+                # Default to ranking by index name
+                keys = {index: index for index in group}
+            # Only the first count indices matter, so select them rather than sort
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            top = set(select(count, keys, key=keys.get))
+            ranked = list(keys)
+            conditions = [index in top for index in ranked]
+
+            def reason(pos, ranked=ranked, top=top):
+                if ranked[pos] in top:
+                    return f'{ranked[pos]} is within the specified count of {count}.'
+                return f'{ranked[pos]} is beyond the specified count of {count}.'
+
+            self.__excludify_all(ranked, conditions, exclude, reason)
 
     def filter_by_shards(
         self, number_of_shards=None, shard_filter_behavior='greater_than', exclude=False
@@ -1255,29 +1743,17 @@ class IndexList:
         # This filter requires index_settings to count shards
         self.get_index_settings()
         self.empty_list_check()
-        for index in self.working_list():
-            self.loggit.debug('Filter by number of shards: Index: %s', index)
-            if shard_filter_behavior == 'greater_than':
-                condition = (
-                    int(self.index_info[index]['number_of_shards']) > number_of_shards
-                )
-            elif shard_filter_behavior == 'less_than':
-                condition = (
-                    int(self.index_info[index]['number_of_shards']) < number_of_shards
-                )
-            elif shard_filter_behavior == 'greater_than_or_equal':
-                condition = (
-                    int(self.index_info[index]['number_of_shards']) >= number_of_shards
-                )
-            elif shard_filter_behavior == 'less_than_or_equal':
-                condition = (
-                    int(self.index_info[index]['number_of_shards']) <= number_of_shards
-                )
-            else:
-                condition = (
-                    int(self.index_info[index]['number_of_shards']) == number_of_shards
-                )
-            self.__excludify(condition, exclude, index)
+        indices = self.working_list()
+        shards = [int(self.index_info[index]['number_of_shards']) for index in indices]
+        conditions = compare(shards, shard_filter_behavior, number_of_shards)
+
+        def reason(pos):
+            return (
+                f'Index "{indices[pos]}" has {shards[pos]} shards, '
+                f'{shard_filter_behavior} {number_of_shards}'
+            )
+
+        self.__excludify_all(indices, conditions, exclude, reason)
 
     def filter_period(
         self,
@@ -1297,6 +1773,7 @@ class IndexList:
         week_starts_on='sunday',
         epoch=None,
         exclude=False,
+        time_series_bounds=False,
     ):
         """
         Match ``indices`` with ages within a given period.
@@ -1331,6 +1808,11 @@ class IndexList:
             only indices where both ``min_value`` and ``max_value`` are within the
             period will be selected. If ``False``, it will use whichever you specified.
             Default is ``False`` to preserve expected behavior.
+        :param time_series_bounds: Only used for ``field_stats`` based calculations.
+            If ``True``, the ``index.time_series.start_time`` and
+            ``index.time_series.end_time`` settings of time series indices are used
+            as their minimum and maximum values, rather than querying them.
+            Default is ``False``
         :param week_starts_on: Either ``sunday`` or ``monday``. Default is ``sunday``
         :param epoch: An epoch timestamp used to establish a point of reference for
             calculations. If not provided, the current time will be used.
@@ -1373,37 +1855,50 @@ class IndexList:
         except Exception as exc:
             report_failure(exc)
         self._calculate_ages(
-            source=source, timestring=timestring, field=field, stats_result=stats_result
+            source=source,
+            timestring=timestring,
+            field=field,
+            stats_result=stats_result,
+            time_series_bounds=time_series_bounds,
         )
+        both = source == 'field_stats' and intersect
+        keys = ['min_value', 'max_value'] if both else [self.age_keyfield]
+        epochs = {key: self._epoch_index(key) for key in keys}
+        indices = []
         for index in self.working_list():
-            try:
-                if source == 'field_stats' and intersect:
-                    min_age = int(self.index_info[index]['age']['min_value'])
-                    max_age = int(self.index_info[index]['age']['max_value'])
-                    msg = (
-                        f'Index "{index}", timestamp field "{field}", min_value '
-                        f'({min_age}), max_value ({max_age}), period start: '
-                        f'"{start}", period end, "{end}"'
-                    )
-                    # Because time adds to epoch, smaller numbers are actually older
-                    # timestamps.
-                    inrange = (min_age >= start) and (max_age <= end)
-                else:
-                    age = int(self.index_info[index]['age'][self.age_keyfield])
-                    msg = (
-                        f'Index "{index}" age ({age}), period start: "{start}", period '
-                        f'end, "{end}"'
-                    )
-                    # Because time adds to epoch, smaller numbers are actually older
-                    # timestamps.
-                    inrange = (age >= start) and (age <= end)
-                self.__excludify(inrange, exclude, index, msg)
-            except KeyError:
+            if all(index in epochs[key] for key in keys):
+                indices.append(index)
+            else:
                 self.loggit.debug(
                     'Index "%s" does not meet provided criteria. Removing from list.',
                     index,
                 )
-                self.indices.remove(index)
+                self.__exclude(index)
+        ages = {key: [epochs[key].ages[index] for index in indices] for key in keys}
+        # Because time adds to epoch, smaller numbers are actually older timestamps.
+        if both:
+            # The whole of the index is in range: neither older than start, nor
+            # younger than end
+            matched = set(indices).difference(
+                epochs['min_value'].older(start), epochs['max_value'].younger(end)
+            )
+        else:
+            matched = epochs[self.age_keyfield].between(start, end)
+        conditions = [index in matched for index in indices]
+
+        def reason(pos):
+            if both:
+                return (
+                    f'Index "{indices[pos]}", timestamp field "{field}", min_value '
+                    f'({ages["min_value"][pos]}), max_value ({ages["max_value"][pos]}), '
+                    f'period start: "{start}", period end, "{end}"'
+                )
+            return (
+                f'Index "{indices[pos]}" age ({ages[self.age_keyfield][pos]}), period '
+                f'start: "{start}", period end, "{end}"'
+            )
+
+        self.__excludify_all(indices, conditions, exclude, reason)
 
     def filter_ilm(self, exclude=True):
         """
@@ -1414,22 +1909,221 @@ class IndexList:
             kept in ``indices``. Default is ``True``
         """
         self.loggit.debug('Filtering indices with index.lifecycle.name')
-        index_lists = chunk_index_list(self.indices)
-        if index_lists == [['']]:
+        index_lists = self.chunker.chunks(self.indices)
+        if not index_lists:
             self.loggit.debug('Empty working list. No ILM indices to filter.')
             return
-        for lst in index_lists:
-            working_list = self._get_indices_settings(lst)
-            if working_list:
-                for index in list(working_list.keys()):
-                    try:
-                        subvalue = working_list[index]['settings']['index']['lifecycle']
-                        has_ilm = 'name' in subvalue
-                        msg = f"{index} has index.lifecycle.name {subvalue['name']}"
-                    except KeyError:
-                        has_ilm = False
-                        msg = f'index.lifecycle.name is not set for index {index}'
-                    self.__excludify(has_ilm, exclude, index, msg)
+
+        def settings_chunk(lst):
+            return list(self.data_getter(lst, self._get_indices_settings))
+
+        results = self._chunk_map(settings_chunk, index_lists)
+        for sii, wli, index in itertools.chain.from_iterable(results):
+            # The same settings also fill in index_info for any later filter
+            self._populate_from_settings(sii, wli)
+            try:
+                subvalue = wli['settings']['index']['lifecycle']
+                has_ilm = 'name' in subvalue
+                msg = f"{index} has index.lifecycle.name {subvalue['name']}"
+            except KeyError:
+                has_ilm = False
+                msg = f'index.lifecycle.name is not set for index {index}'
+            self.__excludify(has_ilm, exclude, index, msg)
+
+    def load_metadata_cache(self):
+        """
+        Populate ``index_info`` with fresh values from :py:attr:`metadata_cache`
+        for each index in self.indices whose UUID is known. Values which are
+        already populated are left alone, and a cached segment count is only used
+        if the doc count it was cached with still matches.
+        """
+        uuids = {}
+        for idx in self.indices:
+            if self.index_info.populated(idx, 'uuid'):
+                uuid = self.index_info[idx]['uuid']
+                if uuid not in self.index_info.cached:
+                    uuids[uuid] = idx
+        if not uuids:
+            return
+        cached = self.metadata_cache.load(list(uuids))
+        for uuid, idx in uuids.items():
+            fields = cached.get(uuid, {})
+            loaded = self.index_info.cached.setdefault(uuid, set())
+            sii = self.index_info[idx]
+            if 'segments' in fields:
+                # Segment counts are cached with the doc count at the time
+                segments, docs = fields.pop('segments')
+                if docs == sii['docs']:
+                    fields['segments'] = segments
+            for field, value in fields.items():
+                if field == 'creation_date':
+                    if not sii.populated('age'):
+                        sii['age']['creation_date'] = value
+                        loaded.add(field)
+                elif not sii.populated(field):
+                    sii[field] = value
+                    loaded.add(field)
+        self.loggit.debug('Checked the metadata cache for %s indices', len(uuids))
+
+    def save_metadata_cache(self):
+        """
+        Save the values in ``index_info`` that were fetched from Elasticsearch,
+        rather than loaded from :py:attr:`metadata_cache` or already saved to it,
+        to the cache. ``index_info`` may be shared with the other actions in a
+        ``session``, so a value saved or loaded by an earlier action is not saved
+        again as though it were freshly fetched.
+        """
+        if not self.metadata_cache:
+            return
+        records = {}
+        for sii in self.index_info.values():
+            if not sii.populated('uuid'):
+                continue
+            skip = self.index_info.cached.get(sii['uuid'], set())
+            fields = {
+                field: sii[field]
+                for field in FIELD_CLASSES
+                if field != 'creation_date'
+                and field not in skip
+                and sii.populated(field)
+            }
+            if 'creation_date' not in skip and sii.populated('age'):
+                fields['creation_date'] = sii['age']['creation_date']
+            if 'segments' in fields:
+                # A segment count is only valid while the doc count is unchanged
+                fields['segments'] = [fields['segments'], sii['docs']]
+            if fields:
+                records[sii['uuid']] = fields
+        self.metadata_cache.store(records)
+        for uuid, fields in records.items():
+            self.index_info.cached.setdefault(uuid, set()).update(fields)
+
+    def invalidate_metadata(self, indices):
+        """
+        Forget any metadata about ``indices`` which may have been changed by an
+        action, both in ``index_info`` and in :py:attr:`metadata_cache`. The
+        creation date and shard count of an index cannot change, and are kept.
+
+        :param indices: The index names
+        :type indices: list
+        """
+        uuids = []
+        for idx in indices:
+            if idx not in self.index_info:
+                continue
+            sii = self.index_info[idx]
+            if sii.populated('uuid'):
+                uuids.append(sii['uuid'])
+            self.index_info.forget_mutable(idx)
+        # Ages queried from the documents may have changed too
+        self._epoch_indices.clear()
+        if self.metadata_cache:
+            self.metadata_cache.invalidate(uuids)
+
+    def pushdown_pattern(self, filters):
+        """
+        Turn the leading ``pattern`` filters in ``filters`` into an Elasticsearch
+        multi-target expression, so that the cluster lists only the indices those
+        filters could keep.
+
+        Only ``prefix`` and ``suffix`` filters with plain values, and the first
+        ``timestring`` filter that keeps matches, are used. Pushdown stops at the
+        first filter that cannot be expressed this way. Every filter still runs
+        afterwards, so the expression only needs to match a superset of the indices
+        the filters keep.
+
+        :param filters: A list of filter dictionaries, as found in the ``filters``
+            key of the ``filter_dict`` passed to :py:meth:`iterate_filters`
+        :type filters: list
+
+        :returns: The narrowed search pattern, or ``None`` if no filter could be
+            pushed down, or the search pattern is not ``*``
+        :rtype: str
+        """
+        if self._search_pattern != '*':
+            return None
+        include = None
+        excludes = []
+        for fil in filters:
+            if fil.get('filtertype') != 'pattern':
+                break
+            exclude = fil.get('exclude', False)
+            wildcard = _pattern_wildcard(fil.get('kind'), fil.get('value'))
+            if wildcard is None or exclude not in (True, False):
+                break
+            if exclude:
+                if fil['kind'] == 'timestring':
+                    # The wildcard matches more than the timestring does
+                    break
+                excludes.append(f'-{wildcard}')
+            elif include is None:
+                include = wildcard
+            else:
+                # Multi-target expressions can't intersect two wildcards
+                break
+        if include is None and not excludes:
+            return None
+        return ','.join([include or '*', *excludes])
+
+    def plan_metadata(self, filters):
+        """
+        Work out which ``index_info`` fields the whole chain of ``filters`` needs,
+        and which API calls will be made to collect them.
+
+        :param filters: A list of filter dictionaries, as found in the ``filters``
+            key of the ``filter_dict`` passed to :py:meth:`iterate_filters`
+        :type filters: list
+
+        :returns: A dictionary with the metadata ``groups`` (``state``,
+            ``settings``, ``stats``, ``segments``), the individual ``index_info``
+            ``fields`` in those groups, and the expected API ``calls`` per chunk
+            of indices.
+        :rtype: dict
+        """
+        fieldmap = {
+            'state': ['state'],
+            'settings': ['age', 'number_of_replicas', 'number_of_shards'],
+            'stats': ['docs', 'primary_size_in_bytes', 'size_in_bytes'],
+            'segments': ['segments'],
+        }
+        groups = set()
+        extra_calls = []
+        for fil in filters:
+            needed, calls = self.__metadata_needs(fil)
+            groups.update(needed)
+            extra_calls += [call for call in calls if call not in extra_calls]
+        calls = []
+        if groups & {'state', 'settings', 'stats'}:
+            # A single _cat/indices call covers all three groups, with the settings
+            # and stats APIs only used as a fallback.
+            calls.append('cat.indices')
+        if 'segments' in groups:
+            calls.append('indices.stats')
+        calls += [call for call in extra_calls if call not in calls]
+        fields = sorted(fld for group in groups for fld in fieldmap[group])
+        return {'groups': sorted(groups), 'fields': fields, 'calls': calls}
+
+    def prefetch_metadata(self, plan):
+        """
+        Collect all of the metadata in ``plan`` for every index in ``indices`` in
+        batched calls, so that no filter in the chain needs to collect it again.
+
+        :param plan: A metadata plan, as returned by :py:meth:`plan_metadata`
+        :type plan: dict
+        """
+        groups = plan.get('groups', [])
+        if not groups or not self.indices:
+            return
+        self.loggit.debug('Prefetching metadata: %s', plan)
+        if set(groups) & {'state', 'settings', 'stats'}:
+            self.get_index_state()
+            self._state_is_fresh = True
+        if 'settings' in groups:
+            self.get_index_settings()
+        if 'stats' in groups:
+            self.get_index_stats()
+        if 'segments' in groups:
+            self.get_segment_counts()
 
     def iterate_filters(self, filter_dict):
         """
@@ -1457,27 +2151,48 @@ class IndexList:
             self.loggit.info('No filters in config.  Returning unaltered object.')
             return
         self.loggit.debug('All filters: %s', filter_dict['filters'])
-        for fil in filter_dict['filters']:
-            self.loggit.debug('Top of the loop: %s', self.indices)
-            self.loggit.debug('Un-parsed filter args: %s', fil)
-            # Make sure we got at least this much in the configuration
-            chk = SchemaCheck(
-                fil, filterstructure(), 'filter', 'IndexList.iterate_filters'
-            ).result()
-            msg = f'Parsed filter args: {chk}'
-            self.loggit.debug(msg)
-            method = self.__map_method(fil['filtertype'])
-            del fil['filtertype']
-            # If it's a filtertype with arguments, update the defaults with the
-            # provided settings.
-            if fil:
-                self.loggit.debug('Filter args: %s', fil)
-                self.loggit.debug('Pre-instance: %s', self.indices)
-                method(**fil)
-                self.loggit.debug('Post-instance: %s', self.indices)
-            else:
-                # Otherwise, it's a settingless filter.
-                method()
+        if self._all_indices is None:
+            # Let the cluster apply the leading pattern filters while listing
+            pattern = self.pushdown_pattern(filter_dict['filters'])
+            if pattern:
+                self.loggit.debug('Search pattern narrowed to "%s"', pattern)
+                with self._lock:
+                    self.__get_indices(pattern, self._include_hidden)
+        # Plan the metadata for the whole chain up front, so that it is collected
+        # only once, rather than piecemeal by each filter.
+        self.metadata_plan = self.plan_metadata(filter_dict['filters'])
+        self.loggit.debug('Metadata plan: %s', self.metadata_plan)
+        prefetched = False
+        try:
+            for fil in filter_dict['filters']:
+                self.loggit.debug('Top of the loop: %s', self.indices)
+                self.loggit.debug('Un-parsed filter args: %s', fil)
+                # Make sure we got at least this much in the configuration
+                chk = SchemaCheck(
+                    fil, filterstructure(), 'filter', 'IndexList.iterate_filters'
+                ).result()
+                msg = f'Parsed filter args: {chk}'
+                self.loggit.debug(msg)
+                # Leading filters which need no metadata (e.g. pattern) run first,
+                # so the prefetch only covers the indices they leave behind.
+                if not prefetched and self.__metadata_needs(fil)[0]:
+                    self.prefetch_metadata(self.metadata_plan)
+                    prefetched = True
+                method = self.__map_method(fil['filtertype'])
+                del fil['filtertype']
+                # If it's a filtertype with arguments, update the defaults with the
+                # provided settings.
+                if fil:
+                    self.loggit.debug('Filter args: %s', fil)
+                    self.loggit.debug('Pre-instance: %s', self.indices)
+                    method(**fil)
+                    self.loggit.debug('Post-instance: %s', self.indices)
+                else:
+                    # Otherwise, it's a settingless filter.
+                    method()
+        finally:
+            self._state_is_fresh = False
+            self.save_metadata_cache()
 
     def filter_by_size(
         self,
@@ -1525,16 +2240,41 @@ class IndexList:
         self.filter_closed()
         # Create a copy-by-value working list
         working_list = self.working_list()
-        for index in working_list:
-            if size_behavior == 'primary':
-                index_size = self.index_info[index]['primary_size_in_bytes']
-            else:
-                index_size = self.index_info[index]['size_in_bytes']
-            msg = (
-                f'{index}, index size is {byte_size(index_size)} and '
+        key = 'primary_size_in_bytes' if size_behavior == 'primary' else 'size_in_bytes'
+        sizes = [self.index_info[index][key] for index in working_list]
+        conditions = compare(sizes, threshold_behavior, index_size_limit)
+
+        def reason(pos):
+            return (
+                f'{working_list[pos]}, index size is {byte_size(sizes[pos])} and '
                 f'size limit is {byte_size(index_size_limit)}.'
             )
-            if threshold_behavior == 'greater_than':
-                self.__excludify((index_size > index_size_limit), exclude, index, msg)
-            elif threshold_behavior == 'less_than':
-                self.__excludify((index_size < index_size_limit), exclude, index, msg)
+
+        self.__excludify_all(working_list, conditions, exclude, reason)
+
+
+def _pattern_wildcard(kind, value):
+    """
+    :returns: A wildcard expression matching every index a ``pattern`` filter of
+        ``kind`` with ``value`` matches, or ``None`` if there isn't one
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    if kind in ['prefix', 'suffix']:
+        # Only plain values match exactly the same names as a wildcard
+        if not PLAIN_VALUE.match(value):
+            return None
+        return f'{value}*' if kind == 'prefix' else f'*{value}'
+    if kind == 'timestring':
+        parts = re.split(r'%(.)', value)
+        # Literal text is at even positions, strftime directives at odd positions
+        if any(part not in settings.date_regex() for part in parts[1::2]):
+            return None
+        # Dots are escaped in the timestring regular expression, so are literal
+        if not all(
+            PLAIN_VALUE.match(part.replace('.', '_')) for part in parts[::2] if part
+        ):
+            return None
+        wildcard = '*'.join(parts[::2])
+        return re.sub(r'\*+', '*', f'*{wildcard}*')
+    return None
@@ -0,0 +1,217 @@
+"""On-disk index metadata cache
+
+Index metadata collected by :py:class:`~.curator.indexlist.IndexList` can be kept
+in a local SQLite database, one per cluster, so that the next run against the same
+cluster can skip requests for values that are still fresh.
+
+Values are keyed by index UUID, so an index that is deleted and recreated with the
+same name never picks up the metadata of its predecessor. Each field belongs to a
+class with its own time to live. Fields that cannot change for the life of an index,
+such as ``creation_date`` and ``number_of_shards``, never expire.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from copy import copy
+
+from curator.defaults.settings import default_cache_dir, metadata_cache_ttl
+
+#: The TTL class of each cacheable :py:class:`~.curator.indexinfo.IndexInfo` field
+FIELD_CLASSES = {
+    'creation_date': 'immutable',
+    'number_of_shards': 'immutable',
+    'number_of_replicas': 'settings',
+    'routing': 'settings',
+    'segments': 'segments',
+    'state': 'state',
+    'docs': 'stats',
+    'size_in_bytes': 'stats',
+    'primary_size_in_bytes': 'stats',
+}
+
+#: Cached values that have not been read or written for this many seconds are
+#: removed, so that the metadata of deleted indices does not pile up.
+PRUNE_AFTER = 30 * 86400
+
+SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS index_metadata ('
+    'uuid TEXT NOT NULL, field TEXT NOT NULL, value TEXT NOT NULL, '
+    'fetched REAL NOT NULL, seen REAL NOT NULL, PRIMARY KEY (uuid, field))'
+)
+
+
+class MetadataCache:
+    """
+    A per-cluster cache of index metadata, stored in ``<cluster_uuid>.db`` in
+    ``cache_dir``
+
+    :param cluster_uuid: The UUID of the cluster
+    :param cache_dir: The directory for cache files. Default is
+        :py:func:`~.curator.defaults.settings.default_cache_dir`
+    :param ttl: The number of seconds each class of fields in
+        :py:data:`FIELD_CLASSES` stays fresh, overriding
+        :py:func:`~.curator.defaults.settings.metadata_cache_ttl`
+
+    :type cluster_uuid: str
+    :type cache_dir: str
+    :type ttl: dict
+    """
+
+    def __init__(self, cluster_uuid, cache_dir=None, ttl=None):
+        self.loggit = logging.getLogger('curator.metadata_cache')
+        #: The TTL in seconds of each field class. **Type:** :py:class:`dict`
+        self.ttl = metadata_cache_ttl()
+        if ttl:
+            self.ttl.update(ttl)
+        #: The path of the SQLite database file. **Type:** :py:class:`str`
+        self.path = os.path.join(cache_dir or default_cache_dir(), f'{cluster_uuid}.db')
+        #: Whether the cache is usable. Any error reading or writing the cache
+        #: file disables it for the life of this object. **Type:** :py:class:`bool`
+        self.enabled = True
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute(SCHEMA)
+                conn.execute(
+                    'DELETE FROM index_metadata WHERE seen < ?',
+                    (time.time() - PRUNE_AFTER,),
+                )
+        except (OSError, sqlite3.Error) as err:
+            self.__disable(err)
+
+    @classmethod
+    def from_client(cls, client, cache_dir=None, ttl=None):
+        """
+        :param client: A client connection object
+        :param cache_dir: The directory for cache files
+        :param ttl: The number of seconds each class of fields stays fresh
+
+        :type client: :py:class:`~.elasticsearch.Elasticsearch`
+        :type cache_dir: str
+        :type ttl: dict
+
+        :returns: The cache for the cluster ``client`` is connected to
+        :rtype: :py:class:`MetadataCache`
+        """
+        return cls(client.info()['cluster_uuid'], cache_dir=cache_dir, ttl=ttl)
+
+    def with_ttl(self, ttl):
+        """
+        :param ttl: The number of seconds each class of fields stays fresh
+        :type ttl: dict
+
+        :returns: This cache, or if ``ttl`` is set, a copy of it using the same
+            file, with ``ttl`` overriding :py:attr:`ttl`
+        :rtype: :py:class:`MetadataCache`
+        """
+        if not ttl:
+            return self
+        other = copy(self)
+        other.ttl = dict(self.ttl, **ttl)
+        return other
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __disable(self, err):
+        self.loggit.warning('Index metadata cache disabled: %s: %s', self.path, err)
+        self.enabled = False
+
+    def __fresh(self, field, fetched, now):
+        ttl = self.ttl.get(FIELD_CLASSES[field])
+        return ttl is None or now - fetched < ttl
+
+    def load(self, uuids):
+        """
+        :param uuids: The index UUIDs to look up
+        :type uuids: list
+
+        :returns: The fresh cached fields of each index UUID found in the cache
+        :rtype: dict
+        """
+        if not self.enabled or not uuids:
+            return {}
+        now = time.time()
+        result = {}
+        try:
+            with self._connect() as conn:
+                # SQLite limits the number of query parameters, so look up in batches
+                for start in range(0, len(uuids), 500):
+                    batch = list(uuids[start : start + 500])
+                    marks = ','.join('?' * len(batch))
+                    rows = conn.execute(
+                        'SELECT uuid, field, value, fetched FROM index_metadata '
+                        f'WHERE uuid IN ({marks})',
+                        batch,
+                    ).fetchall()
+                    for uuid, field, value, fetched in rows:
+                        if field in FIELD_CLASSES and self.__fresh(field, fetched, now):
+                            result.setdefault(uuid, {})[field] = json.loads(value)
+                    conn.execute(
+                        f'UPDATE index_metadata SET seen = ? WHERE uuid IN ({marks})',
+                        [now, *batch],
+                    )
+        except sqlite3.Error as err:
+            self.__disable(err)
+            return {}
+        self.loggit.debug('Loaded cached metadata for %s indices', len(result))
+        return result
+
+    def store(self, records):
+        """
+        Save freshly fetched values. Fields not in :py:data:`FIELD_CLASSES` are
+        ignored.
+
+        :param records: The fields to save, keyed by index UUID
+        :type records: dict
+        """
+        if not self.enabled or not records:
+            return
+        now = time.time()
+        rows = [
+            (uuid, field, json.dumps(value), now, now)
+            for uuid, fields in records.items()
+            for field, value in fields.items()
+            if field in FIELD_CLASSES
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO index_metadata '
+                    '(uuid, field, value, fetched, seen) VALUES (?, ?, ?, ?, ?)',
+                    rows,
+                )
+        except sqlite3.Error as err:
+            self.__disable(err)
+            return
+        self.loggit.debug('Cached metadata for %s indices', len(records))
+
+    def invalidate(self, uuids):
+        """
+        Remove every cached value of each index UUID in ``uuids``, except for the
+        values in the ``immutable`` class, which cannot have changed.
+
+        :param uuids: The index UUIDs to invalidate
+        :type uuids: list
+        """
+        if not self.enabled or not uuids:
+            return
+        fields = [fld for fld, cls in FIELD_CLASSES.items() if cls != 'immutable']
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    'DELETE FROM index_metadata WHERE uuid = ? AND field = ?',
+                    [(uuid, field) for uuid in uuids for field in fields],
+                )
+        except sqlite3.Error as err:
+            self.__disable(err)
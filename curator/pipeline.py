@@ -0,0 +1,200 @@
+"""Concurrent requests with adaptive backpressure
+
+Every request that changes the cluster state, such as deleting indices, is queued
+on the elected master node, which applies them one at a time. Sending such requests
+one after another leaves the master idle while each acknowledgement travels back
+and the next request is built. Sending many at once can swamp its queue, so that
+requests time out or are rejected.
+
+A :py:class:`RequestPipeline` keeps a bounded number of requests in flight and
+adjusts that bound as it goes. It adds a request while acknowledgements come back
+quickly, and halves the number when they slow down or when the cluster answers
+``429 Too Many Requests`` or ``503 Service Unavailable``. Rejected requests are
+retried after a pause. The number of indices in each request is also lowered, so
+that a request is expected to be acknowledged well within its ``master_timeout``.
+"""
+
+import logging
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from elasticsearch8.exceptions import ApiError, TransportError
+
+#: The HTTP status codes with which a busy cluster rejects requests
+OVERLOADED_STATUS = (429, 503)
+
+#: Retry a chunk this many times after the cluster rejects it as overloaded
+MAX_OVERLOADED_RETRIES = 5
+
+#: The longest pause, in seconds, before retrying a rejected chunk
+MAX_BACKOFF = 30
+
+
+def overloaded(err):
+    """
+    :param err: An exception raised by a client request
+    :type err: :py:exc:`Exception`
+
+    :returns: ``True`` if the request was rejected because the cluster is busy
+    :rtype: bool
+    """
+    if getattr(err, 'status_code', None) in OVERLOADED_STATUS:
+        return True
+    # A timeout waiting for the master node to process the request
+    return 'process_cluster_event_timeout' in str(err)
+
+
+class RequestPipeline:
+    """
+    Call a function with chunks of index names, with a bounded and adaptive
+    number of calls in flight at the same time
+
+    :param func: The function to call with each list of index names. It returns
+        once the request is acknowledged.
+    :param max_in_flight: The most calls in flight at the same time
+    :param timeout: The seconds a request may wait for the master node, e.g. its
+        ``master_timeout``. Requests are sized to be acknowledged well within it.
+
+    :type func: function
+    :type max_in_flight: int
+    :type timeout: float
+    """
+
+    def __init__(self, func, max_in_flight=1, timeout=30):
+        self.loggit = logging.getLogger('curator.pipeline')
+        self.func = func
+        #: The most calls in flight at the same time. **Type:** :py:class:`int`
+        self.max_in_flight = max(1, int(max_in_flight))
+        #: The calls currently allowed in flight at the same time, between ``1``
+        #: and :py:attr:`max_in_flight`. **Type:** :py:class:`int`
+        self.limit = 1
+        #: Acknowledgements slower than this many seconds halve :py:attr:`limit`.
+        #: Faster than a quarter of it raise it by one. **Type:** :py:class:`float`
+        self.target = timeout / 2
+        self.per_index = None
+        self.started = None
+        self.indices = 0
+        self.requests = 0
+        self.throttled = 0
+        self.latencies = []
+
+    def _size(self, chunk):
+        """
+        :param chunk: The index names of the next request
+        :type chunk: list
+
+        :returns: How many of ``chunk`` to send, so that the request is expected to
+            be acknowledged within :py:attr:`target` seconds
+        :rtype: int
+        """
+        if not self.per_index:
+            return len(chunk)
+        return max(1, min(len(chunk), int(self.target / self.per_index)))
+
+    def _timed(self, chunk):
+        """
+        :param chunk: The index names to call :py:attr:`func` with
+        :type chunk: list
+
+        :returns: The seconds the call took
+        :rtype: float
+        """
+        start = time.monotonic()
+        self.func(chunk)
+        return time.monotonic() - start
+
+    def _acknowledged(self, chunk, elapsed):
+        """
+        Record the latency of a call, and adjust :py:attr:`limit` to it
+
+        :param chunk: The index names of the call
+        :param elapsed: The seconds the call took
+
+        :type chunk: list
+        :type elapsed: float
+        """
+        self.indices += len(chunk)
+        self.requests += 1
+        self.latencies.append(elapsed)
+        self.per_index = elapsed / max(1, len(chunk))
+        if elapsed > self.target and self.limit > 1:
+            self.limit = max(1, self.limit // 2)
+            self.loggit.debug(
+                'Acknowledged after %.2fs. Lowered to %s in flight', elapsed, self.limit
+            )
+        elif elapsed < self.target / 4 and self.limit < self.max_in_flight:
+            self.limit += 1
+            self.loggit.debug(
+                'Acknowledged after %.2fs. Raised to %s in flight', elapsed, self.limit
+            )
+
+    def run(self, chunks):
+        """
+        Call :py:attr:`func` with every chunk in ``chunks``, splitting any chunk
+        too large to be acknowledged within :py:attr:`target` seconds
+
+        :param chunks: Lists of index names, each small enough for a request URL
+        :type chunks: list
+
+        :raises: The exception raised by a call, unless the cluster rejected it as
+            overloaded fewer than :py:data:`MAX_OVERLOADED_RETRIES` times in a row
+        """
+        pending = deque(chunk for chunk in chunks if chunk)
+        in_flight = {}
+        retries = 0
+        self.started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.limit:
+                    chunk = pending.popleft()
+                    size = self._size(chunk)
+                    if size < len(chunk):
+                        pending.appendleft(chunk[size:])
+                        chunk = chunk[:size]
+                    in_flight[executor.submit(self._timed, chunk)] = chunk
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    chunk = in_flight.pop(future)
+                    try:
+                        elapsed = future.result()
+                    except (ApiError, TransportError) as err:
+                        if not overloaded(err) or retries >= MAX_OVERLOADED_RETRIES:
+                            raise
+                        retries += 1
+                        self.throttled += 1
+                        self.limit = max(1, self.limit // 2)
+                        pause = min(MAX_BACKOFF, 2**retries)
+                        self.loggit.warning(
+                            'Cluster overloaded (%s). Retrying %s indices in %ss with '
+                            '%s in flight',
+                            err,
+                            len(chunk),
+                            pause,
+                            self.limit,
+                        )
+                        time.sleep(pause)
+                        pending.appendleft(chunk)
+                        continue
+                    retries = 0
+                    self._acknowledged(chunk, elapsed)
+
+    def report(self):
+        """
+        :returns: The number of ``indices`` and ``requests`` acknowledged, the
+            ``seconds`` taken, ``indices_per_second``, the ``mean_latency`` and
+            ``max_latency`` in seconds of the acknowledgements, and the number of
+            requests ``throttled`` by an overloaded cluster
+        :rtype: dict
+        """
+        seconds = time.monotonic() - self.started if self.started else 0.0
+        latencies = self.latencies or [0.0]
+        return {
+            'indices': self.indices,
+            'requests': self.requests,
+            'seconds': seconds,
+            'indices_per_second': self.indices / seconds if seconds else 0.0,
+            'mean_latency': sum(latencies) / len(latencies),
+            'max_latency': max(latencies),
+            'throttled': self.throttled,
+        }
@@ -0,0 +1,124 @@
+"""Index metadata shared by the actions in a single run of an action file"""
+
+import logging
+
+from curator.helpers.getters import get_indices
+from curator.indexinfo import IndexInfoStore
+
+#: Actions that may change the metadata of the indices they act on
+MODIFYING_ACTIONS = [
+    'allocation',
+    'close',
+    'forcemerge',
+    'index_settings',
+    'open',
+    'replicas',
+]
+
+#: Actions that may delete the indices they act on
+REMOVING_ACTIONS = ['cold2frozen', 'delete_indices', 'shrink']
+
+#: Actions that may create indices, so that any index listing may be out of date
+CREATING_ACTIONS = [
+    'cold2frozen',
+    'create_index',
+    'reindex',
+    'rollover',
+    'shrink',
+]
+
+#: Actions that may change indices other than the ones they act on, such as the
+#: destination index of a reindex, or replace an index with a new index of the same
+#: name, such as a restore
+UNTARGETED_ACTIONS = ['reindex', 'restore']
+
+
+class MetadataSession:
+    """
+    A snapshot of cluster index metadata, shared by every
+    :py:class:`~.curator.indexlist.IndexList` created during one run of an action
+    file.
+
+    Index listings, ``index_info`` and the alias map are collected once, and then
+    reused by each action that follows. After each action, :py:meth:`action_done`
+    forgets only what that action may have changed.
+    """
+
+    def __init__(self):
+        self.loggit = logging.getLogger('curator.session')
+        #: The metadata of every index seen so far in this run.
+        #: **Type:** :py:class:`~.curator.indexinfo.IndexInfoStore`
+        self.index_info = IndexInfoStore()
+        #: The alias map of the cluster, or ``None`` if not yet collected.
+        #: **Type:** :py:class:`dict`
+        self.alias_map = None
+        self._listings = {}
+
+    def get_indices(self, client, search_pattern='*', include_hidden=False):
+        """
+        :param client: A client connection object
+        :param search_pattern: The index search pattern
+        :param include_hidden: Whether to include hidden indices
+
+        :type client: :py:class:`~.elasticsearch.Elasticsearch`
+        :type search_pattern: str
+        :type include_hidden: bool
+
+        :returns: The result of :py:func:`~.curator.helpers.getters.get_indices` for
+            ``search_pattern`` and ``include_hidden``, which is only requested the
+            first time this combination is seen
+        :rtype: list
+        """
+        key = (search_pattern, include_hidden)
+        if key not in self._listings:
+            self._listings[key] = get_indices(
+                client, search_pattern=search_pattern, include_hidden=include_hidden
+            )
+        else:
+            self.loggit.debug('Reusing the index listing for "%s"', search_pattern)
+        return list(self._listings[key])
+
+    def reset(self):
+        """Forget everything"""
+        self.loggit.debug('Discarding all shared index metadata')
+        self.index_info = IndexInfoStore()
+        self.alias_map = None
+        self._listings = {}
+
+    def action_done(self, action, indices=None, failed=False):
+        """
+        Forget what ``action`` may have changed when it acted on ``indices``
+
+        :param action: The name of the action
+        :param indices: The indices the action acted on
+        :param failed: Whether the action raised an exception, in which case it is
+            not known which indices were changed, or how far, so everything is
+            forgotten
+
+        :type action: str
+        :type indices: list
+        :type failed: bool
+        """
+        indices = indices or []
+        if failed or action in UNTARGETED_ACTIONS:
+            self.reset()
+            return
+        if action in REMOVING_ACTIONS:
+            self.loggit.debug('Forgetting removed indices: %s', indices)
+            removed = set(indices)
+            for idx in removed:
+                self.index_info.pop(idx, None)
+            for listing in self._listings.values():
+                listing[:] = [idx for idx in listing if idx not in removed]
+        if action in MODIFYING_ACTIONS:
+            self.loggit.debug('Forgetting changed metadata of indices: %s', indices)
+            for idx in indices:
+                if idx in self.index_info:
+                    self.index_info.forget_mutable(idx)
+        if action in CREATING_ACTIONS:
+            # New indices have names nobody has seen yet
+            self.loggit.debug('Discarding index listings')
+            self._listings = {}
+        if action not in ['cluster_routing', 'delete_snapshots', 'snapshot']:
+            # Aliases may have been added, removed or moved
+            self.alias_map = None
@@ -10,6 +10,7 @@ from curator.exceptions import (
     NoSnapshots,
 )
 from curator.helpers.date_ops import (
+    EpochIndex,
     absolute_date_range,
     date_range,
     fix_epoch,
@@ -53,6 +54,10 @@ class SnapshotList:
         #: time.  **Type:** :py:class:`list` of :py:class:`dict` data.
         self.__get_snapshots()
         self.age_keyfield = None
+        # What the ages under age_keyfield were calculated from, and the sorted
+        # epoch index of each, shared by the filters in a chain
+        self._age_source = None
+        self._epoch_indices = {}
 
     def __actionable(self, snap):
         self.loggit.debug('Snapshot %s is actionable and remains in the list.', snap)
@@ -151,14 +156,39 @@ class SnapshotList:
                 raise MissingArgument(
                     'source "name" requires the "timestring" keyword argument'
                 )
+            self._age_source = timestring
             self._get_name_based_ages(timestring)
         elif source == 'creation_date':
             self.age_keyfield = 'start_time_in_millis'
+            self._age_source = None
         else:
             raise ValueError(
                 f'Invalid source: {source}. Must be "name", or "creation_date".'
             )
 
+    def _epoch_index(self):
+        """
+        Get the sorted epoch index of the ``age_keyfield`` ages of ``snapshots``, as
+        last calculated by :py:meth:`_calculate_ages`. It is built on first use, and
+        shared by later filters for as long as it covers every snapshot in
+        ``snapshots``.
+
+        :returns: The snapshots with an age, sorted by that age
+        :rtype: :py:class:`~.curator.helpers.date_ops.EpochIndex`
+        """
+        key = (self.age_keyfield, self._age_source)
+        epochs = self._epoch_indices.get(key)
+        if epochs is not None and all(snap in epochs for snap in self.snapshots):
+            return epochs
+        ages = {}
+        for snap in self.snapshots:
+            # This fixes #1366. Catch None is a potential age value.
+            if self.snapshot_info[snap].get(self.age_keyfield):
+                ages[snap] = fix_epoch(self.snapshot_info[snap][self.age_keyfield])
+        epochs = EpochIndex(ages)
+        self._epoch_indices[key] = epochs
+        return epochs
+
     def _sort_by_age(self, snapshot_list, reverse=True):
         """
         Take a list of snapshots and sort them by date.
@@ -189,9 +219,7 @@ class SnapshotList:
         # first.  However, if you want oldest first, set reverse to False.
         # Effectively, this should set us up to act on everything older than
         # meets the other set criteria.
-        # It starts as a tuple, but then becomes a list.
-        sorted_tuple = sorted(temp.items(), key=lambda k: k[1], reverse=reverse)
-        return [x[0] for x in sorted_tuple]
+        return self._epoch_index().ordered(temp, reverse=reverse)
 
     def most_recent(self):
         """
@@ -288,24 +316,23 @@ class SnapshotList:
         if direction not in ['older', 'younger']:
             raise ValueError(f'Invalid value for "direction": {direction}')
         self._calculate_ages(source=source, timestring=timestring)
+        epochs = self._epoch_index()
+        # Because time adds to epoch, smaller numbers are actually older
+        # timestamps.
+        if direction == 'older':
+            matched = epochs.older(por)
+        else:  # 'younger'
+            matched = epochs.younger(por)
         for snapshot in self.working_list():
-            if not self.snapshot_info[snapshot][self.age_keyfield]:
+            if snapshot not in epochs:
                 self.loggit.debug('Removing snapshot %s for having no age', snapshot)
                 self.snapshots.remove(snapshot)
                 continue
-            age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
             msg = (
-                f'Snapshot "{snapshot}" age ({age}), direction: "{direction}", '
-                f'point of reference, ({por})'
+                f'Snapshot "{snapshot}" age ({epochs.ages[snapshot]}), direction: '
+                f'"{direction}", point of reference, ({por})'
             )
-            # Because time adds to epoch, smaller numbers are actually older
-            # timestamps.
-            snapshot_age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
-            if direction == 'older':
-                agetest = snapshot_age < por
-            else:  # 'younger'
-                agetest = snapshot_age > por
-            self.__excludify(agetest, exclude, snapshot, msg)
+            self.__excludify(snapshot in matched, exclude, snapshot, msg)
 
     def filter_by_state(self, state=None, exclude=False):
         """
@@ -473,20 +500,18 @@ class SnapshotList:
         except Exception as err:
             report_failure(err)
         self._calculate_ages(source=source, timestring=timestring)
+        epochs = self._epoch_index()
+        inrange = epochs.between(start, end)
         for snapshot in self.working_list():
-            if not self.snapshot_info[snapshot][self.age_keyfield]:
-                self.loggit.debug('Removing snapshot {0} for having no age')
+            if snapshot not in epochs:
+                self.loggit.debug('Removing snapshot %s for having no age', snapshot)
                 self.snapshots.remove(snapshot)
                 continue
-            age = fix_epoch(self.snapshot_info[snapshot][self.age_keyfield])
             msg = (
-                f'Snapshot "{snapshot}" age ({age}), period start: "{start}", period '
-                f'end, ({end})'
+                f'Snapshot "{snapshot}" age ({epochs.ages[snapshot]}), period start: '
+                f'"{start}", period end, ({end})'
             )
-            # Because time adds to epoch, smaller numbers are actually older
-            # timestamps.
-            inrange = (age >= start) and (age <= end)
-            self.__excludify(inrange, exclude, snapshot, msg)
+            self.__excludify(snapshot in inrange, exclude, snapshot, msg)
 
     def iterate_filters(self, config):
         """
@@ -68,6 +68,9 @@ def action_specific(action):
             option_defaults.search_pattern(),
             option_defaults.delay(),
             option_defaults.max_num_segments(),
+            option_defaults.max_merges_per_node(),
+            option_defaults.wait_interval(action),
+            option_defaults.max_wait(action),
         ],
         'index_settings': [
             option_defaults.search_pattern(),
@@ -140,6 +143,7 @@ def action_specific(action):
         'shrink': [
             option_defaults.search_pattern(),
             option_defaults.shrink_node(),
+            option_defaults.max_shrink_nodes(),
             option_defaults.node_filters(),
             option_defaults.number_of_shards(),
             option_defaults.number_of_replicas(),
@@ -178,6 +182,9 @@ def get_schema(action):
         option_defaults.disable_action(),
         option_defaults.ignore_empty_list(),
         option_defaults.include_hidden(),
+        option_defaults.max_concurrent_requests(),
+        option_defaults.metadata_cache(),
+        option_defaults.metadata_cache_ttl(),
         option_defaults.timeout_override(action),
     ]
     for each in defaults:
@@ -15,7 +15,7 @@ class TestActionAlias(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
     def builder2(self):
         self.client = Mock()
@@ -23,7 +23,7 @@ class TestActionAlias(TestCase):
         self.client.cat.indices.return_value = testvars.state_two
         self.client.indices.get_settings.return_value = testvars.settings_two
         self.client.indices.stats.return_value = testvars.stats_two
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
     def test_init_raise(self):
         self.assertRaises(MissingArgument, Alias)
@@ -16,7 +16,7 @@ class TestActionClose(TestCase):
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
         self.client.indices.flush_synced.return_value = testvars.synced_pass
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.client.indices.close.return_value = None
         self.ilo = IndexList(self.client)
     def test_init_raise(self):
@@ -1,7 +1,9 @@
 """test_action_delete_indices"""
 # pylint: disable=missing-function-docstring, missing-class-docstring, protected-access, attribute-defined-outside-init
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from elastic_transport import ApiResponseMeta
+from elasticsearch8 import ApiError
 from curator.actions import DeleteIndices
 from curator.exceptions import FailedExecution
 from curator import IndexList
@@ -16,7 +18,7 @@ class TestActionDeleteIndices(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
     def builder4(self):
         self.client = Mock()
@@ -24,7 +26,7 @@ class TestActionDeleteIndices(TestCase):
         self.client.cat.indices.return_value = testvars.state_four
         self.client.indices.get_settings.return_value = testvars.settings_four
         self.client.indices.stats.return_value = testvars.stats_four
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.client.indices.delete.return_value = None
         self.ilo = IndexList(self.client)
     def test_init_raise(self):
@@ -44,11 +46,17 @@ class TestActionDeleteIndices(TestCase):
     def test_do_action(self):
         self.builder4()
         dio = DeleteIndices(self.ilo)
+        self.assertEqual(4, len(self.ilo.indices))
+        self.client.indices.get_settings.return_value = {}
+        self.client.cat.indices.return_value = []
         self.assertIsNone(dio.do_action())
     def test_do_action_not_successful(self):
         self.builder4()
         dio = DeleteIndices(self.ilo)
-        self.assertIsNone(dio.do_action())
+        # Every index is still present after each try
+        with self.assertRaises(FailedExecution) as err:
+            dio.do_action()
+        self.assertIn('still present', str(err.exception))
     def test_do_action_raises_exception(self):
         self.builder4()
         self.client.indices.delete.side_effect = testvars.fake_fail
@@ -58,3 +66,55 @@ class TestActionDeleteIndices(TestCase):
         self.builder4()
         dio = DeleteIndices(self.ilo)
         self.assertTrue(dio._verify_result([],2))
+    def test_acknowledged_skips_probe(self):
+        self.builder4()
+        dio = DeleteIndices(self.ilo)
+        self.assertEqual(4, len(self.ilo.indices))
+        self.client.indices.delete.return_value = {'acknowledged': True}
+        self.client.cat.indices.return_value = []
+        self.client.indices.get_settings.reset_mock()
+        self.client.cat.indices.reset_mock()
+        dio.do_action()
+        self.client.indices.get_settings.assert_not_called()
+        # Only the final reconciliation lists the cluster
+        self.assertEqual(1, self.client.cat.indices.call_count)
+    def test_probe_only_deleted_indices(self):
+        self.builder4()
+        dio = DeleteIndices(self.ilo)
+        self.assertEqual(4, len(self.ilo.indices))
+        self.client.indices.get_settings.return_value = {}
+        self.client.cat.indices.return_value = []
+        self.client.cat.indices.reset_mock()
+        dio.do_action()
+        kwargs = self.client.indices.get_settings.call_args.kwargs
+        self.assertEqual(sorted(self.ilo.indices), sorted(kwargs['index'].split(',')))
+        self.assertTrue(kwargs['ignore_unavailable'])
+        self.assertEqual(1, self.client.cat.indices.call_count)
+        self.assertEqual(1, self.client.indices.delete.call_count)
+    @patch('curator.pipeline.time.sleep')
+    def test_retry_ignores_deleted(self, _):
+        self.builder4()
+        dio = DeleteIndices(self.ilo)
+        self.assertEqual(4, len(self.ilo.indices))
+        busy = ApiError('busy', ApiResponseMeta(503, '1.1', {}, 0.01, None), {})
+        self.client.indices.delete.side_effect = [busy, {'acknowledged': True}]
+        self.client.cat.indices.return_value = []
+        dio.do_action()
+        self.assertEqual(2, self.client.indices.delete.call_count)
+        kwargs = self.client.indices.delete.call_args.kwargs
+        self.assertTrue(kwargs['ignore_unavailable'])
+        self.assertTrue(kwargs['allow_no_indices'])
+    def test_still_present(self):
+        self.builder4()
+        self.client.indices.get_settings.return_value = {'index-2017.03.03': {}}
+        dio = DeleteIndices(self.ilo)
+        self.assertEqual(
+            ['index-2017.03.03'],
+            dio._still_present(['index-2017.03.01', 'index-2017.03.03'])
+        )
+    def test_pipeline_in_flight(self):
+        self.builder4()
+        self.ilo.max_concurrent_requests = 4
+        dio = DeleteIndices(self.ilo, master_timeout=60)
+        self.assertEqual(4, dio.pipeline.max_in_flight)
+        self.assertEqual(30, dio.pipeline.target)
@@ -1,6 +1,8 @@
 """test_action_delete_snapshots"""
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+from elastic_transport import ApiResponseMeta
+from elasticsearch8 import ApiError
 from curator.actions import DeleteSnapshots
 from curator.exceptions import FailedExecution
 from curator import SnapshotList
@@ -46,6 +48,51 @@ class TestActionDeleteSnapshots(TestCase):
         slo = SnapshotList(client, repository=testvars.repo_name)
         do = DeleteSnapshots(slo)
         self.assertRaises(FailedExecution, do.do_action)
+    def builder(self):
+        self.client = Mock()
+        self.client.snapshot.get.return_value = testvars.snapshots
+        self.client.snapshot.get_repository.return_value = testvars.test_repo
+        self.client.snapshot.delete.return_value = None
+        self.slo = SnapshotList(self.client, repository=testvars.repo_name)
+    def test_do_action_batched(self):
+        self.builder()
+        do = DeleteSnapshots(self.slo)
+        do.do_action()
+        self.client.snapshot.delete.assert_called_once_with(
+            repository=testvars.repo_name, snapshot=','.join(self.slo.snapshots))
+    def test_batch_size_by_repository_type(self):
+        self.builder()
+        do = DeleteSnapshots(self.slo)
+        self.assertEqual(500, do._batch_size())
+        self.client.snapshot.get_repository.return_value = {
+            testvars.repo_name: {'type': 's3'}}
+        self.assertEqual(100, do._batch_size())
+        with patch.dict('curator.actions.snapshot.SNAPSHOT_DELETE_BATCH', {'s3': 1}):
+            do.do_action()
+        self.assertEqual(
+            len(self.slo.snapshots), self.client.snapshot.delete.call_count)
+    @patch('curator.actions.snapshot.sleep')
+    def test_concurrent_execution_retried(self, mock_sleep):
+        self.builder()
+        busy = ApiError(
+            'concurrent_snapshot_execution_exception',
+            ApiResponseMeta(503, '1.1', {}, 0.01, None), {})
+        self.client.snapshot.delete.side_effect = [busy, None]
+        do = DeleteSnapshots(self.slo, retry_interval=7, retry_count=2)
+        do.do_action()
+        self.assertEqual(2, self.client.snapshot.delete.call_count)
+        mock_sleep.assert_called_once_with(7)
+    @patch('curator.actions.snapshot.sleep')
+    def test_concurrent_execution_retries_exhausted(self, mock_sleep):
+        self.builder()
+        busy = ApiError(
+            'concurrent_snapshot_execution_exception',
+            ApiResponseMeta(503, '1.1', {}, 0.01, None), {})
+        self.client.snapshot.delete.side_effect = busy
+        do = DeleteSnapshots(self.slo, retry_interval=0, retry_count=2)
+        self.assertRaises(FailedExecution, do.do_action)
+        self.assertEqual(3, self.client.snapshot.delete.call_count)
+        self.assertEqual(2, mock_sleep.call_count)
     ### This check is not necessary after ES 7.16 as it is possible to have
     ### up to 1000 concurrent snapshots
     ###
@@ -3,7 +3,7 @@
 from unittest import TestCase
 from unittest.mock import Mock
 from curator.actions import ForceMerge
-from curator.exceptions import FailedExecution, MissingArgument
+from curator.exceptions import ActionTimeout, FailedExecution, MissingArgument
 from curator import IndexList
 # Get test variables and constants from a single source
 from . import testvars
@@ -16,8 +16,8 @@ class TestActionForceMerge(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
-        self.client.indices.segments.return_value = testvars.shards
+        self.client.cat.aliases.return_value = []
+        self.client.indices.stats.return_value = testvars.shards
         self.ilo = IndexList(self.client)
     def test_init_raise_bad_client(self):
         self.assertRaises(
@@ -54,3 +54,89 @@ class TestActionForceMerge(TestCase):
         self.client.indices.optimize.side_effect = testvars.fake_fail
         fmo = ForceMerge(self.ilo, max_num_segments=2)
         self.assertRaises(FailedExecution, fmo.do_action)
+    def scheduled(self, shards, merges=1):
+        self.builder()
+        self.client.cat.shards.return_value = shards
+        self.client.indices.forcemerge.side_effect = lambda index, **_: {'task': index}
+        fmo = ForceMerge(
+            self.ilo, max_num_segments=2, max_merges_per_node=merges, wait_interval=0)
+        return fmo
+    def test_shard_nodes(self):
+        shards = [
+            {'index': testvars.named_index, 'node': 'n1', 'state': 'STARTED'},
+            {'index': testvars.named_index, 'node': 'n2', 'state': 'STARTED'},
+            {'index': testvars.named_index, 'node': None, 'state': 'UNASSIGNED'},
+            {'index': 'other', 'node': 'n3', 'state': 'STARTED'},
+        ]
+        fmo = self.scheduled(shards)
+        loads = fmo._shard_nodes([testvars.named_index])
+        self.assertEqual({'n1': 1, 'n2': 1}, dict(loads[testvars.named_index]))
+        self.assertEqual(
+            testvars.named_index, self.client.cat.shards.call_args.kwargs['index'])
+    def test_fits(self):
+        fmo = self.scheduled([], merges=2)
+        self.assertTrue(fmo._fits({'n1': 1}, {'n1': 1}))
+        self.assertFalse(fmo._fits({'n1': 2}, {'n1': 1}))
+        # Too many shards for the limit, but the node is idle
+        self.assertTrue(fmo._fits({'n1': 3}, {'n1': 0}))
+    def test_scheduled(self):
+        shards = [{'index': testvars.named_index, 'node': 'n1', 'state': 'STARTED'}]
+        fmo = self.scheduled(shards)
+        self.client.tasks.get.return_value = {'completed': True}
+        self.assertIsNone(fmo.do_action())
+        self.client.indices.forcemerge.assert_called_once_with(
+            index=testvars.named_index, max_num_segments=2, wait_for_completion=False)
+        self.client.tasks.get.assert_called_once_with(task_id=testvars.named_index)
+    def test_scheduled_waits_for_task(self):
+        shards = [{'index': testvars.named_index, 'node': 'n1', 'state': 'STARTED'}]
+        fmo = self.scheduled(shards)
+        self.client.tasks.get.side_effect = [{'completed': False}, {'completed': True}]
+        self.assertIsNone(fmo.do_action())
+        self.assertEqual(2, self.client.tasks.get.call_count)
+    def test_scheduled_task_error(self):
+        shards = [{'index': testvars.named_index, 'node': 'n1', 'state': 'STARTED'}]
+        fmo = self.scheduled(shards)
+        self.client.tasks.get.return_value = {'completed': True, 'error': 'oops'}
+        self.assertRaises(FailedExecution, fmo.do_action)
+    def test_scheduled_max_wait(self):
+        shards = [{'index': testvars.named_index, 'node': 'n1', 'state': 'STARTED'}]
+        fmo = self.scheduled(shards)
+        fmo.max_wait = 0
+        self.client.tasks.get.return_value = {'completed': False}
+        with self.assertRaises(ActionTimeout) as err:
+            fmo._scheduled()
+        self.assertIn(testvars.named_index, str(err.exception))
+        self.assertEqual(1, self.client.tasks.get.call_count)
+    def test_scheduled_no_started_shards(self):
+        shards = [
+            {'index': 'a', 'node': 'n1', 'state': 'STARTED'},
+            {'index': 'b', 'node': None, 'state': 'UNASSIGNED'},
+        ]
+        fmo = self.scheduled(shards)
+        fmo.index_list.indices = ['a', 'b']
+        self.client.tasks.get.return_value = {'completed': True}
+        fmo._scheduled()
+        self.client.indices.forcemerge.assert_called_once_with(
+            index='a', max_num_segments=2, wait_for_completion=False)
+    def test_wait_interval_none(self):
+        self.builder()
+        fmo = ForceMerge(
+            self.ilo, max_num_segments=2, wait_interval=None, max_wait=None)
+        self.assertEqual(3, fmo.wait_interval)
+        self.assertEqual(-1, fmo.max_wait)
+    def test_scheduled_per_node(self):
+        shards = [
+            {'index': 'a', 'node': 'n1', 'state': 'STARTED'},
+            {'index': 'b', 'node': 'n2', 'state': 'STARTED'},
+            {'index': 'c', 'node': 'n1', 'state': 'STARTED'},
+        ]
+        fmo = self.scheduled(shards)
+        fmo.index_list.indices = ['a', 'b', 'c']
+        calls = []
+        self.client.indices.forcemerge.side_effect = (
+            lambda index, **_: calls.append(index) or {'task': index})
+        self.client.tasks.get.side_effect = (
+            lambda task_id: calls.append(f'done {task_id}') or {'completed': True})
+        fmo._scheduled()
+        # a and b are on different nodes, but c waits for a to finish on n1
+        self.assertEqual(['a', 'b', 'done a', 'done b', 'c', 'done c'], calls)
@@ -16,7 +16,7 @@ class TestActionOpen(TestCase):
         self.client.cat.indices.return_value = testvars.state_four
         self.client.indices.get_settings.return_value = testvars.settings_four
         self.client.indices.stats.return_value = testvars.stats_four
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.client.indices.open.return_value = None
         self.ilo = IndexList(self.client)
     def test_init_raise(self):
@@ -17,6 +17,7 @@ class TestActionReindex(TestCase):
         self.client.indices.get_settings.return_value = testvars.settings_four
         self.client.indices.stats.return_value = testvars.stats_four
         self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
     def test_init_bad_ilo(self):
         self.assertRaises(TypeError, Reindex, 'foo', 'invalid')
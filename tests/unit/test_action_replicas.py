@@ -16,7 +16,7 @@ class TestActionReplicas(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.client.indices.put_settings.return_value = None
         self.ilo = IndexList(self.client)
     def test_init_raise_bad_client(self):
@@ -44,7 +44,7 @@ class TestActionReplicas(TestCase):
         self.assertIsNone(rpo.do_action())
     def test_do_action_raises_exception(self):
         self.builder()
-        self.client.indices.segments.return_value = testvars.shards
+        self.client.indices.stats.return_value = testvars.shards
         self.client.indices.put_settings.side_effect = testvars.fake_fail
         rpo = Replicas(self.ilo, count=2)
         self.assertRaises(FailedExecution, rpo.do_action)
@@ -2,7 +2,7 @@
 
 # pylint: disable=C0103,C0115,C0116,W0201,W0212
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 from curator.actions import Shrink
 from curator.exceptions import ActionError, ConfigurationError
 from curator import IndexList
@@ -23,7 +23,7 @@ class TestActionShrink_extra_settings(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_extra_settings_1(self):
@@ -49,7 +49,7 @@ class TestActionShrink_data_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.client.nodes.info.return_value = {
@@ -80,7 +80,7 @@ class TestActionShrink_exclude_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.node_name = 'node_name'
         self.ilo = IndexList(self.client)
 
@@ -104,7 +104,7 @@ class TestActionShrink_qualify_single_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.client.nodes.info.return_value = {
@@ -160,7 +160,7 @@ class TestActionShrink_most_available_node(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.byte_count = 123456
@@ -198,7 +198,7 @@ class TestActionShrink_route_index(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
         self.shrink = Shrink(self.ilo)
 
@@ -222,7 +222,7 @@ class TestActionShrink_dry_run(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.byte_count = 123456
@@ -275,7 +275,7 @@ class TestActionShrink_various(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.node_name = 'node_name'
         self.node_id = 'my_node'
         self.byte_count = 1239132959
@@ -351,3 +351,122 @@ class TestActionShrink_various(TestCase):
         shrink = Shrink(self.ilo, shrink_node=self.node_name)
         shrink.shrink_node_id = self.node_id
         self.assertRaises(ActionError, shrink._check_all_shards, testvars.named_index)
+
+
+class TestActionShrink_pipelined(TestCase):
+    def builder(self):
+        self.client = Mock()
+        self.client.info.return_value = {'version': {'number': '8.0.0'}}
+        self.client.cat.indices.return_value = testvars.state_one
+        self.client.indices.get_settings.return_value = testvars.settings_one
+        self.client.indices.stats.return_value = testvars.stats_one
+        self.client.cat.aliases.return_value = []
+        self.client.nodes.info.return_value = {
+            'nodes': {
+                node_id: {'roles': ['data'], 'name': node_id}
+                for node_id in ['n1', 'n2', 'n3']
+            }
+        }
+        self.client.nodes.stats.return_value = {
+            'nodes': {
+                node_id: {
+                    'fs': {'total': {'available_in_bytes': avail}},
+                    'name': node_id,
+                }
+                for node_id, avail in [('n1', 1000000), ('n2', 650000), ('n3', 10)]
+            }
+        }
+        self.ilo = IndexList(self.client)
+        self.sizes = {'a': 500000, 'b': 400000, 'c': 300000, 'd': 100000}
+        self.shrink = Shrink(self.ilo, wait_for_rebalance=False, max_shrink_nodes=2)
+        self.shrink._padded_size = self.sizes.get
+
+    def test_init_wait_for_rebalance(self):
+        self.builder()
+        self.assertRaises(ConfigurationError, Shrink, self.ilo, max_shrink_nodes=2)
+        # A single node, or a named node, may still wait for rebalance
+        Shrink(self.ilo, max_shrink_nodes=1)
+        Shrink(self.ilo, shrink_node='n1', max_shrink_nodes=2)
+
+    def test_assign_nodes(self):
+        self.builder()
+        assigned = self.shrink._assign_nodes(['d', 'c', 'b', 'a'])
+        # Largest first, each to the node with the most space left
+        self.assertEqual({'n1': ['a', 'c'], 'n2': ['b', 'd']}, assigned)
+
+    def test_assign_nodes_no_space(self):
+        self.builder()
+        self.sizes['a'] = 2000000
+        self.assertRaises(ActionError, self.shrink._assign_nodes, ['a'])
+        self.assertEqual({}, self.shrink._assign_nodes(['a'], dry_run=True))
+
+    def test_assign_nodes_remaining_space(self):
+        self.builder()
+        # Each fits on n1 alone, but not both, and neither fits on n2
+        self.sizes.update({'a': 700000, 'b': 690000})
+        self.assertRaises(ActionError, self.shrink._assign_nodes, ['a', 'b'])
+        self.assertEqual(
+            {'n1': ['a']}, self.shrink._assign_nodes(['a', 'b'], dry_run=True)
+        )
+
+    def health_checked(self, shrink):
+        steps = [
+            'pre_shrink_check',
+            'route_index',
+            '_check_all_shards',
+            '_block_writes',
+        ]
+        with patch.multiple(Shrink, **{step: Mock() for step in steps}):
+            with patch(
+                'curator.actions.shrink.health_check', return_value=False
+            ) as mock:
+                self.assertRaises(ActionError, shrink._shrink_index, 'a')
+        return mock.call_args
+
+    def test_health_check_cluster(self):
+        self.builder()
+        shrink = Shrink(self.ilo)
+        call = self.health_checked(shrink)
+        # One shrink node keeps the cluster wide check
+        self.assertNotIn('index', call.kwargs)
+
+    def test_health_check_index(self):
+        self.builder()
+        call = self.health_checked(self.shrink)
+        self.assertEqual('a', call.kwargs['index'])
+
+    def test_pipelined(self):
+        self.builder()
+        self.shrink._assign_nodes = Mock(
+            return_value={'n1': ['a', 'c'], 'n2': ['b', 'd']}
+        )
+        shrunk = []
+
+        def shrink_index(worker):
+            return lambda idx: shrunk.append(
+                (worker.shrink_node, idx, worker.wait_for_rebalance)
+            )
+
+        with patch.object(Shrink, '_shrink_index', autospec=True) as mock:
+            mock.side_effect = lambda worker, idx: shrink_index(worker)(idx)
+            self.shrink._pipelined()
+        self.assertEqual(
+            [
+                ('n1', 'a', False),
+                ('n1', 'c', False),
+                ('n2', 'b', False),
+                ('n2', 'd', False),
+            ],
+            sorted(shrunk),
+        )
+        # The action itself is unchanged
+        self.assertEqual('DETERMINISTIC', self.shrink.shrink_node)
+
+    def test_pipelined_failure(self):
+        self.builder()
+        self.shrink._assign_nodes = Mock(return_value={'n1': ['a', 'c']})
+        with patch.object(Shrink, '_shrink_index', autospec=True) as mock:
+            mock.side_effect = ActionError('failed')
+            self.assertRaises(ActionError, self.shrink._pipelined)
+        # The node stops after its first failure
+        self.assertEqual(1, mock.call_count)
@@ -0,0 +1,95 @@
+"""Test the IndexInfo metadata records"""
+
+# pylint: disable=C0115, C0116, invalid-name
+from unittest import TestCase
+
+from curator.indexinfo import ActionableList, IndexInfo, IndexInfoStore
+
+
+class TestIndexInfo(TestCase):
+    def test_zero_values(self):
+        info = IndexInfo()
+        assert 0 == info['docs']
+        assert '' == info['state']
+        assert {} == info['routing']
+        assert not dict(info['age'])
+
+    def test_populated_zero(self):
+        info = IndexInfo()
+        assert not info.populated('docs')
+        info['docs'] = 0
+        assert info.populated('docs')
+        assert 0 == info['docs']
+
+    def test_delete_unpopulates(self):
+        info = IndexInfo({'docs': 5, 'age': {'creation_date': 1456963200}})
+        del info['docs']
+        assert not info.populated('docs')
+        assert 0 == info['docs']
+        info['age'].pop('creation_date')
+        assert not info.populated('age')
+        with self.assertRaises(KeyError):
+            _ = info['age']['creation_date']
+
+    def test_unknown_key(self):
+        info = IndexInfo()
+        with self.assertRaises(KeyError):
+            info['foo'] = 'bar'
+        with self.assertRaises(KeyError):
+            info['age']['foo'] = 'bar'
+
+    def test_routing_not_shared(self):
+        first = IndexInfo()
+        first['routing']['allocation'] = {}
+        assert {} == IndexInfo()['routing']
+
+
+class TestIndexInfoStore(TestCase):
+    def test_add(self):
+        store = IndexInfoStore()
+        record = store.add('index1')
+        assert record is store.add('index1')
+        assert ['index1'] == list(store)
+        assert not store.populated('index1', 'state')
+        assert not store.populated('index2', 'state')
+
+    def test_dict_assignment(self):
+        store = IndexInfoStore()
+        store['index1'] = {'state': 'open', 'age': {'name': 1456963200}}
+        assert isinstance(store['index1'], IndexInfo)
+        assert store.populated('index1', 'state')
+        assert 1456963200 == store['index1']['age']['name']
+        del store['index1']
+        assert 'index1' not in store
+
+    def test_forget_mutable(self):
+        store = IndexInfoStore()
+        store['index1'] = {'uuid': 'abc123', 'segments': 5, 'number_of_shards': 2}
+        store.cached['abc123'] = {'segments', 'number_of_shards'}
+        store.forget_mutable('index1')
+        assert not store.populated('index1', 'segments')
+        assert store.populated('index1', 'number_of_shards')
+        # Only the values that are still populated came from the cache
+        assert {'number_of_shards'} == store.cached['abc123']
+
+
+class TestActionableList(TestCase):
+    def test_list_api(self):
+        alo = ActionableList(['a', 'b'])
+        alo.append('c')
+        alo.extend(['d', 'a'])
+        assert ['a', 'b', 'c', 'd', 'a'] == alo
+        assert 'c' in alo
+        alo.remove('c')
+        assert 'c' not in alo
+        alo.remove('a')
+        assert 'a' in alo
+        assert 'a' == alo.pop()
+        assert 'a' not in alo
+
+    def test_slice_assignment(self):
+        alo = ActionableList(['a', 'b', 'c'])
+        alo[:] = ['c']
+        assert ['c'] == alo
+        assert 'a' not in alo
+        assert 'c' in alo
@@ -5,6 +5,8 @@ from copy import deepcopy
 from unittest import TestCase
 from unittest.mock import Mock
 import yaml
+from elastic_transport import ApiResponseMeta
+from elasticsearch8 import NotFoundError
 from es_client.exceptions import FailedValidation
 from curator.exceptions import (
     ActionError,
@@ -14,6 +16,7 @@ from curator.exceptions import (
     NoIndices,
 )
 from curator.helpers.date_ops import fix_epoch
+from curator.indexinfo import ActionableList
 from curator import IndexList
 
 # Get test variables and constants from a single source
@@ -56,7 +59,7 @@ class TestIndexListClientAndInit(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_init_bad_client(self):
@@ -66,7 +69,10 @@ class TestIndexListClientAndInit(TestCase):
     def test_init_get_indices_exception(self):
         self.builder()
         self.client.cat.indices.side_effect = testvars.fake_fail
-        self.assertRaises(FailedExecution, IndexList, self.client)
+        # Indices are listed on first use
+        ilo = IndexList(self.client)
+        with self.assertRaises(FailedExecution):
+            _ = ilo.indices
 
     def test_init(self):
         self.builder()
@@ -95,6 +101,205 @@ class TestIndexListClientAndInit(TestCase):
         self.assertEqual('close', ilo2.index_info['index-2016.03.03']['state'])
 
 
+class TestIndexListCatMetadata(TestCase):
+    def builder(self):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = testvars.cat_two
+        self.client.indices.get_settings.return_value = testvars.settings_two
+        self.client.indices.stats.return_value = testvars.stats_two
+        self.client.cat.aliases.return_value = []
+        self.ilo = IndexList(self.client)
+
+    def test_stats_from_cat(self):
+        self.builder()
+        self.ilo.get_index_stats()
+        self.client.indices.stats.assert_not_called()
+        info = self.ilo.index_info['index-2016.03.03']
+        self.assertEqual('open', info['state'])
+        self.assertEqual(3187481, info['docs'])
+        self.assertEqual(1115219663, info['size_in_bytes'])
+        self.assertEqual(557951789, info['primary_size_in_bytes'])
+
+    def test_docs_match_stats(self):
+        self.builder()
+        self.ilo.get_index_stats()
+        self.client.cat.indices.return_value = testvars.state_two
+        ilo = IndexList(self.client)
+        ilo.get_index_stats()
+        self.client.indices.stats.assert_called()
+        # Both count the documents in primary shards only
+        for index in ['index-2016.03.03', 'index-2016.03.04']:
+            self.assertEqual(
+                self.ilo.index_info[index]['docs'], ilo.index_info[index]['docs']
+            )
+
+    def test_settings_from_cat(self):
+        self.builder()
+        self.ilo.get_index_settings()
+        info = self.ilo.index_info['index-2016.03.04']
+        self.assertEqual('5', info['number_of_shards'])
+        self.assertEqual('1', info['number_of_replicas'])
+        self.assertEqual(1457049600, info['age']['creation_date'])
+        # Routing is not available from _cat, so it is left unpopulated
+        self.assertEqual({}, info['routing'])
+
+    def test_cat_request_columns(self):
+        self.builder()
+        self.ilo.get_index_state()
+        kwargs = self.client.cat.indices.call_args.kwargs
+        self.assertEqual('b', kwargs['bytes'])
+        self.assertIn('pri.store.size', kwargs['h'])
+        self.assertIn('creation.date', kwargs['h'])
+
+
+class TestIndexListMetadataPlan(TestCase):
+    def builder(self):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = testvars.cat_two
+        self.client.indices.get_settings.return_value = testvars.settings_two
+        self.client.indices.stats.return_value = testvars.stats_two
+        self.client.cat.aliases.return_value = []
+        self.ilo = IndexList(self.client)
+
+    def test_plan(self):
+        self.builder()
+        filters = [
+            {'filtertype': 'pattern', 'kind': 'prefix', 'value': 'index'},
+            {'filtertype': 'size', 'size_threshold': 0.52},
+            {'filtertype': 'forcemerged', 'max_num_segments': 1},
+            {'filtertype': 'ilm'},
+        ]
+        plan = self.ilo.plan_metadata(filters)
+        self.assertEqual(['segments', 'settings', 'state', 'stats'], plan['groups'])
+        self.assertIn('number_of_shards', plan['fields'])
+        self.assertIn('primary_size_in_bytes', plan['fields'])
+        self.assertEqual(
+            ['cat.indices', 'indices.stats', 'indices.get_settings'], plan['calls']
+        )
+
+    def test_plan_no_metadata(self):
+        self.builder()
+        plan = self.ilo.plan_metadata([{'filtertype': 'kibana'}])
+        self.assertEqual({'groups': [], 'fields': [], 'calls': []}, plan)
+
+    def test_chain_fetches_state_once(self):
+        self.builder()
+        _ = self.ilo.indices
+        self.client.cat.indices.reset_mock()
+        config = {
+            'filters': [
+                {'filtertype': 'size', 'size_threshold': 0.52},
+                {'filtertype': 'closed'},
+                {'filtertype': 'empty'},
+            ]
+        }
+        self.ilo.iterate_filters(config)
+        self.assertEqual(['index-2016.03.04'], self.ilo.indices)
+        self.assertEqual(1, self.client.cat.indices.call_count)
+        self.client.indices.stats.assert_not_called()
+        self.client.indices.get_settings.assert_not_called()
+        self.assertEqual(['state', 'stats'], self.ilo.metadata_plan['groups'])
+
+
+class TestIndexListPushdown(TestCase):
+    def builder(self, search_pattern='*'):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = testvars.state_two
+        self.client.cat.aliases.return_value = []
+        self.ilo = IndexList(self.client, search_pattern=search_pattern)
+
+    def pattern(self, kind, value, exclude=False):
+        return {
+            'filtertype': 'pattern',
+            'kind': kind,
+            'value': value,
+            'exclude': exclude,
+        }
+
+    def test_prefix(self):
+        self.builder()
+        filters = [
+            self.pattern('prefix', 'index-'),
+            self.pattern('suffix', '-old', True),
+        ]
+        self.assertEqual('index-*,-*-old', self.ilo.pushdown_pattern(filters))
+
+    def test_timestring(self):
+        self.builder()
+        filters = [self.pattern('timestring', '%Y.%m.%d')]
+        self.assertEqual('*.*.*', self.ilo.pushdown_pattern(filters))
+
+    def test_not_pushed_down(self):
+        self.builder()
+        self.assertIsNone(self.ilo.pushdown_pattern([self.pattern('regex', '^i')]))
+        self.assertIsNone(self.ilo.pushdown_pattern([self.pattern('prefix', 'in.')]))
+        self.assertIsNone(
+            self.ilo.pushdown_pattern(
+                [{'filtertype': 'kibana'}, self.pattern('prefix', 'index-')]
+            )
+        )
+        self.builder(search_pattern='index-*')
+        self.assertIsNone(self.ilo.pushdown_pattern([self.pattern('prefix', 'i')]))
+
+    def test_second_include_stops(self):
+        self.builder()
+        filters = [self.pattern('prefix', 'index-'), self.pattern('suffix', '.04')]
+        self.assertEqual('index-*', self.ilo.pushdown_pattern(filters))
+
+    def test_listing_narrowed(self):
+        self.builder()
+        self.ilo.iterate_filters({'filters': [self.pattern('prefix', 'index-')]})
+        target = self.client.cat.indices.call_args_list[0].kwargs['index']
+        self.assertTrue(target.startswith('index-*,'))
+        self.assertEqual(['index-2016.03.03', 'index-2016.03.04'], self.ilo.indices)
+
+
+class TestIndexListConcurrentChunks(TestCase):
+    def builder(self, max_concurrent_requests):
+        self.names = [f'index-{num:05d}' for num in range(1000)]
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.side_effect = self.cat_indices
+        self.client.cat.aliases.return_value = []
+        self.ilo = IndexList(
+            self.client, max_concurrent_requests=max_concurrent_requests
+        )
+
+    def cat_indices(self, index=None, **kwargs):
+        if kwargs['h'] == 'index,status':
+            index = ','.join(self.names)
+        names = index.split(',')
+        if 'index-00500' in names and 'index-00500' not in self.names:
+            meta = ApiResponseMeta(404, '1.1', {}, 0.01, None)
+            body = {'error': {'index': 'index-00500'}}
+            raise NotFoundError('index_not_found_exception', meta, body)
+        return [
+            {'index': name, 'status': 'open', 'pri': '1', 'rep': '0', 'docs.count': '0'}
+            for name in names
+        ]
+
+    def test_concurrent_state(self):
+        self.builder(4)
+        self.client.cat.indices.reset_mock()
+        self.ilo.get_index_state()
+        self.assertGreater(self.client.cat.indices.call_count, 1)
+        for name in self.names:
+            self.assertEqual('open', self.ilo.index_info[name]['state'])
+            self.assertTrue(self.ilo.population_check(name, 'docs'))
+
+    def test_concurrent_missing_index(self):
+        self.builder(4)
+        self.names.remove('index-00500')
+        self.ilo.get_index_state()
+        self.assertEqual(999, len(self.ilo.indices))
+        self.assertNotIn('index-00500', self.ilo.indices)
+        self.assertEqual(4, self.ilo.max_concurrent_requests)
+        self.client.indices.get_settings.assert_not_called()
+
+
 class TestIndexListOtherMethods(TestCase):
     def builder(self, key='2'):
         self.client = Mock()
@@ -102,24 +307,77 @@ class TestIndexListOtherMethods(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_empty_list(self):
         self.builder()
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.assertEqual(2, len(self.ilo.indices))
         self.ilo.indices = []
         self.assertRaises(NoIndices, self.ilo.empty_list_check)
 
     def test_get_segmentcount(self):
         self.builder(key='1')
-        self.client.indices.segments.return_value = testvars.shards
+        self.client.indices.stats.return_value = testvars.shards
         # Ordinarily get_index_state is run before get_segment_counts, so we do
         # so manually here.
         self.ilo.get_index_state()
         self.ilo.get_segment_counts()
         self.assertEqual(71, self.ilo.index_info[testvars.named_index]['segments'])
+        kwargs = self.client.indices.stats.call_args.kwargs
+        self.assertEqual('segments', kwargs['metric'])
+        self.assertEqual('indices.*.total.segments.count', kwargs['filter_path'])
+
+    def test_assigned_list(self):
+        self.builder()
+        indices = ['index-1', 'index-2']
+        self.ilo.indices = indices
+        # A plain list is copied, so that membership tests stay constant time
+        self.assertIsInstance(self.ilo.indices, ActionableList)
+        self.assertEqual(indices, self.ilo.indices)
+        self.ilo.indices.append('index-3')
+        self.assertIn('index-3', self.ilo.indices)
+        self.assertEqual(['index-1', 'index-2'], indices)
+
+    def test_batched_exclusion(self):
+        self.builder()
+        indices = ActionableList(f'index-{num}' for num in range(1000))
+        self.ilo.indices = indices
+        self.ilo.filter_by_regex(kind='suffix', value='7', exclude=True)
+        # Rebuilt in place, so the reference stays valid
+        self.assertIs(indices, self.ilo.indices)
+        self.assertEqual(900, len(self.ilo.indices))
+        self.assertNotIn('index-17', self.ilo.indices)
+        self.ilo.filter_by_regex(kind='suffix', value='7', exclude=True)
+        self.assertEqual(900, len(self.ilo.indices))
+
+
+class TestIndexListAliasCheck(TestCase):
+    def builder(self):
+        self.client = Mock()
+        self.client.info.return_value = get_es_ver()
+        self.client.cat.indices.return_value = testvars.cat_two
+        self.client.cat.aliases.return_value = [
+            {'alias': 'my_alias', 'index': 'index-2016.03.03'}
+        ]
+        self.ilo = IndexList(self.client)
+
+    def test_alias_resolved_locally(self):
+        self.builder()
+        self.ilo.indices = ['my_alias', 'index-2016.03.04']
+        data = self.ilo.alias_index_check(['my_alias', 'index-2016.03.04'])
+        self.assertEqual(['index-2016.03.04', 'index-2016.03.03'], data)
+        self.assertEqual(['index-2016.03.04', 'index-2016.03.03'], self.ilo.indices)
+        self.assertIn('index-2016.03.03', self.ilo.index_info)
+        self.client.indices.exists_alias.assert_not_called()
+        self.client.indices.get.assert_not_called()
+
+    def test_alias_map_cached(self):
+        self.builder()
+        self.ilo.alias_index_check(['index-2016.03.03'])
+        self.ilo.alias_index_check(['index-2016.03.04'])
+        self.assertEqual(1, self.client.cat.aliases.call_count)
 
 
 class TestIndexListAgeFilterName(TestCase):
@@ -129,7 +387,7 @@ class TestIndexListAgeFilterName(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_get_name_based_ages_match(self):
@@ -162,23 +420,68 @@ class TestIndexListAgeFilterStatsAPI(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
+    def msearch(self, response):
+        def responses(searches):
+            return {'responses': [response] * (len(searches) // 2)}
+
+        self.client.msearch.side_effect = responses
+
     def test_get_field_stats_dates_negative(self):
         self.builder()
-        self.client.search.return_value = testvars.fieldstats_query
+        self.msearch(testvars.fieldstats_query)
         self.client.field_stats.return_value = testvars.fieldstats_two
         self.ilo._get_field_stats_dates(field='timestamp')
         self.assertNotIn('not_an_index_name', list(self.ilo.index_info.keys()))
 
     def test_get_field_stats_dates_field_not_found(self):
         self.builder()
-        self.client.search.return_value = {'aggregations': {'foo': 'bar'}}
+        self.msearch({'aggregations': {'foo': 'bar'}})
         self.assertRaises(
             ActionError, self.ilo._get_field_stats_dates, field='not_in_index'
         )
 
+    def test_get_field_stats_dates_search_error(self):
+        self.builder()
+        self.msearch({'error': {'type': 'search_phase_execution_exception'}})
+        self.assertRaises(
+            ActionError, self.ilo._get_field_stats_dates, field='timestamp'
+        )
+
+    def test_get_field_stats_dates_batched(self):
+        self.builder()
+        self.msearch(testvars.fieldstats_query)
+        self.ilo._get_field_stats_dates(field='timestamp')
+        self.client.search.assert_not_called()
+        self.assertEqual(1, self.client.msearch.call_count)
+        for index in self.ilo.indices:
+            self.assertEqual(1456963206, self.ilo.index_info[index]['age']['min_value'])
+
+    def test_get_field_stats_dates_time_series_bounds(self):
+        self.builder()
+        self.msearch(testvars.fieldstats_query)
+        self.client.indices.get_settings.return_value = {
+            'index-2016.03.03': {
+                'settings': {
+                    'index': {
+                        'time_series': {
+                            'start_time': '2016-03-03T00:00:00.000Z',
+                            'end_time': '2016-03-04T00:00:00.000Z',
+                        }
+                    }
+                }
+            }
+        }
+        self.ilo._get_field_stats_dates(field='timestamp', time_series_bounds=True)
+        age = self.ilo.index_info['index-2016.03.03']['age']
+        self.assertEqual(1456963200, age['min_value'])
+        self.assertEqual(1457049600, age['max_value'])
+        # Only the other index is searched
+        searches = self.client.msearch.call_args.kwargs['searches']
+        self.assertEqual([{'index': 'index-2016.03.04'}], searches[::2])
+
 
 class TestIndexListRegexFilters(TestCase):
     def builder(self, key='2'):
@@ -187,7 +490,7 @@ class TestIndexListRegexFilters(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_filter_by_regex_prefix(self):
@@ -267,7 +570,7 @@ class TestIndexListFilterByAge(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_missing_direction(self):
@@ -475,7 +778,7 @@ class TestIndexListFilterBySpace(TestCase):
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
         self.client.search.return_value = get_testvals(key, 'fieldstats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_missing_disk_space_value(self):
@@ -607,7 +910,7 @@ class TestIndexListFilterKibana(TestCase):
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
         self.client.search.return_value = get_testvals(key, 'fieldstats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_filter_kibana_positive(self):
@@ -631,7 +934,7 @@ class TestIndexListFilterKibana(TestCase):
         self.ilo.indices = kibana_indices
         self.ilo.indices.append('dummy')
         self.ilo.filter_kibana(exclude=True)
-        self.assertEqual(kibana_indices, self.ilo.indices)
+        self.assertEqual(['dummy'], self.ilo.indices)
 
     def test_filter_kibana_negative(self):
         self.builder()
@@ -659,8 +962,8 @@ class TestIndexListFilterForceMerged(TestCase):
         self.client.cat.indices.return_value = testvars.state_one
         self.client.indices.get_settings.return_value = testvars.settings_one
         self.client.indices.stats.return_value = testvars.stats_one
-        self.client.indices.segments.return_value = testvars.shards
-        self.client.indices.exists_alias.return_value = False
+        self.client.indices.stats.return_value = testvars.shards
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_filter_forcemerge_raise(self):
@@ -674,7 +977,7 @@ class TestIndexListFilterForceMerged(TestCase):
 
     def test_filter_forcemerge_negative(self):
         self.builder()
-        self.client.indices.segments.return_value = testvars.fm_shards
+        self.client.indices.stats.return_value = testvars.fm_shards
         self.ilo.filter_forceMerged(max_num_segments=2)
         self.assertEqual([], self.ilo.indices)
 
@@ -687,7 +990,7 @@ class TestIndexListFilterOpened(TestCase):
         client.indices.get_settings.return_value = testvars.settings_four
         client.indices.stats.return_value = testvars.stats_four
         client.field_stats.return_value = testvars.fieldstats_four
-        client.indices.exists_alias.return_value = False
+        client.cat.aliases.return_value = []
         ilo = IndexList(client)
         ilo.filter_opened()
         self.assertEqual(['c-2016.03.05'], ilo.indices)
@@ -700,7 +1003,7 @@ class TestIndexListFilterAllocated(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_missing_key(self):
@@ -743,6 +1046,18 @@ class TestIndexListFilterAllocated(TestCase):
             ['index-2016.03.03', 'index-2016.03.04'], sorted(self.ilo.indices)
         )
 
+    def test_settings_fetched_once(self):
+        self.builder()
+        self.ilo.filter_allocated(key='tag', value='foo', allocation_type='include')
+        self.ilo.get_index_settings()
+        self.assertEqual(1, self.client.indices.get_settings.call_count)
+        self.assertEqual(
+            testvars.settings_two['index-2016.03.04']['settings']['index'][
+                'number_of_shards'
+            ],
+            self.ilo.index_info['index-2016.03.04']['number_of_shards'],
+        )
+
 
 class TestIterateFiltersIndex(TestCase):
     def builder(self, key='2'):
@@ -751,7 +1066,7 @@ class TestIterateFiltersIndex(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_no_filters(self):
@@ -793,7 +1108,7 @@ class TestIterateFiltersIndex(TestCase):
 
     def test_forcemerge_filtertype(self):
         self.builder(key='1')
-        self.client.indices.segments.return_value = testvars.shards
+        self.client.indices.stats.return_value = testvars.shards
         config = yaml.load(testvars.forcemerge_ft, Loader=yaml.FullLoader)['actions'][1]
         self.ilo.iterate_filters(config)
         self.assertEqual([testvars.named_index], self.ilo.indices)
@@ -876,7 +1191,7 @@ class TestIndexListFilterAlias(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_raise(self):
@@ -912,7 +1227,7 @@ class TestIndexListFilterCount(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.client.indices.get_alias.return_value = testvars.settings_2_get_aliases
         self.ilo = IndexList(self.client)
 
@@ -949,6 +1264,22 @@ class TestIndexListFilterCount(TestCase):
         )
         self.assertEqual(['index-2016.03.04'], self.ilo.indices)
 
+    def test_pattern_group(self):
+        self.builder()
+        self.ilo.filter_by_count(
+            count=1,
+            use_age=True,
+            pattern=r'^(.*)-\d{4}\.\d{2}\.\d{2}$',
+            source='name',
+            timestring='%Y.%m.%d',
+        )
+        self.assertEqual(['index-2016.03.03'], self.ilo.indices)
+
+    def test_pattern_no_match_pruned(self):
+        self.builder()
+        self.ilo.filter_by_count(count=1, pattern=r'^(nomatch)-.*$', exclude=False)
+        self.assertEqual([], self.ilo.indices)
+
     def test_pattern_no_regex_group(self):
         self.builder()
         self.assertRaises(
@@ -981,7 +1312,7 @@ class TestIndexListFilterShards(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_filter_shards_raise(self):
@@ -1087,7 +1418,7 @@ class TestIndexListPeriodFilterName(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
         self.timestring = '%Y.%m.%d'
         self.epoch = 1456963201
@@ -1108,6 +1439,28 @@ class TestIndexListPeriodFilterName(TestCase):
         )
         self.assertEqual(expected, self.ilo.indices)
 
+    def test_epoch_index_shared_with_age_filter(self):
+        self.builder()
+        self.ilo.filter_by_age(
+            source='name',
+            direction='older',
+            timestring=self.timestring,
+            unit=self.unit,
+            unit_count=0,
+            epoch=self.epoch + 86400,
+        )
+        epochs = self.ilo._epoch_index()
+        self.ilo.filter_period(
+            unit=self.unit,
+            range_from=-1,
+            range_to=0,
+            source='name',
+            timestring=self.timestring,
+            epoch=self.epoch,
+        )
+        self.assertEqual(['index-2016.03.03'], self.ilo.indices)
+        self.assertIs(epochs, self.ilo._epoch_index())
+
     def test_get_name_based_age_not_in_range(self):
         range_from = -3
         range_to = -2
@@ -1170,7 +1523,7 @@ class TestPeriodFilterAbsolute(TestCase):
         self.client.cat.indices.return_value = get_testvals(key, 'state')
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_bad_period_type(self):
@@ -1214,7 +1567,7 @@ class TestIndexListFilterBySize(TestCase):
         self.client.indices.get_settings.return_value = get_testvals(key, 'settings')
         self.client.indices.stats.return_value = get_testvals(key, 'stats')
         self.client.field_stats.return_value = get_testvals(key, 'fieldstats')
-        self.client.indices.exists_alias.return_value = False
+        self.client.cat.aliases.return_value = []
         self.ilo = IndexList(self.client)
 
     def test_missing_size_value(self):
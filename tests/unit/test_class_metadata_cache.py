@@ -0,0 +1,135 @@
+"""Test the on-disk index metadata cache"""
+
+# pylint: disable=C0115, C0116, invalid-name
+import os
+import shutil
+import sqlite3
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from curator import IndexList
+from curator.metadata_cache import MetadataCache
+from curator.session import MetadataSession
+
+from . import testvars
+
+CAT_ROWS = [
+    {
+        'index': testvars.named_index,
+        'uuid': 'abc123',
+        'status': 'open',
+        'pri': '2',
+        'rep': '1',
+        'docs.count': '100',
+        'creation.date': '1456963200000',
+    }
+]
+
+
+class TestMetadataCache(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_path(self):
+        cache = MetadataCache('cluster1', cache_dir=self.cache_dir)
+        assert os.path.join(self.cache_dir, 'cluster1.db') == cache.path
+        assert os.path.isfile(cache.path)
+
+    def test_round_trip(self):
+        cache = MetadataCache('cluster1', cache_dir=self.cache_dir)
+        cache.store({'abc123': {'routing': {'allocation': {}}, 'name': 'skipped'}})
+        loaded = MetadataCache('cluster1', cache_dir=self.cache_dir).load(['abc123'])
+        assert {'abc123': {'routing': {'allocation': {}}}} == loaded
+
+    def test_ttl(self):
+        cache = MetadataCache('cluster1', cache_dir=self.cache_dir)
+        with patch('curator.metadata_cache.time.time', return_value=1000):
+            cache.store({'abc123': {'creation_date': 1456963200, 'docs': 5}})
+        with patch('curator.metadata_cache.time.time', return_value=1000 + 3600):
+            loaded = cache.load(['abc123'])
+        # creation_date never expires, but stats do
+        assert {'abc123': {'creation_date': 1456963200}} == loaded
+
+    def test_with_ttl(self):
+        cache = MetadataCache('cluster1', cache_dir=self.cache_dir)
+        assert cache is cache.with_ttl(None)
+        other = cache.with_ttl({'segments': 60})
+        assert cache.path == other.path
+        assert 60 == other.ttl['segments']
+        assert 900 == cache.ttl['segments']
+
+    def test_unusable_path(self):
+        path = os.path.join(self.cache_dir, 'file')
+        with open(path, 'w', encoding='utf-8') as fh:
+            fh.write('not a directory')
+        cache = MetadataCache('cluster1', cache_dir=path)
+        assert not cache.enabled
+        assert not cache.load(['abc123'])
+
+
+class TestIndexListMetadataCache(TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def builder(self, session=None):
+        self.client = Mock()
+        self.client.info.return_value = {
+            'version': {'number': '8.0.0'},
+            'cluster_uuid': 'cluster1',
+        }
+        self.client.cat.indices.return_value = CAT_ROWS
+        self.client.cat.aliases.return_value = []
+        self.client.indices.stats.return_value = testvars.shards
+        cache = MetadataCache.from_client(self.client, cache_dir=self.cache_dir)
+        return IndexList(self.client, metadata_cache=cache, session=session)
+
+    def config(self):
+        return {'filters': [{'filtertype': 'forcemerged', 'max_num_segments': 2}]}
+
+    def test_warm_start(self):
+        self.builder().iterate_filters(self.config())
+        ilo = self.builder()
+        ilo.iterate_filters(self.config())
+        self.client.indices.stats.assert_not_called()
+        assert 71 == ilo.index_info[testvars.named_index]['segments']
+
+    def test_changed_index(self):
+        self.builder().iterate_filters(self.config())
+        ilo = self.builder()
+        self.client.cat.indices.return_value = [
+            dict(CAT_ROWS[0], **{'docs.count': '5'})
+        ]
+        ilo.iterate_filters(self.config())
+        self.client.indices.stats.assert_called_once()
+
+    def test_session_keeps_fetched(self):
+        cache = MetadataCache('cluster1', cache_dir=self.cache_dir)
+        with patch('curator.metadata_cache.time.time', return_value=1000):
+            cache.store({'abc123': {'segments': [71, 100]}})
+        session = MetadataSession()
+        with patch('curator.metadata_cache.time.time', return_value=1800):
+            # Two actions in one run, sharing index_info through the session
+            self.builder(session).iterate_filters(self.config())
+            self.builder(session).iterate_filters(self.config())
+        self.client.indices.stats.assert_not_called()
+        with sqlite3.connect(cache.path) as conn:
+            fetched = conn.execute(
+                "SELECT fetched FROM index_metadata WHERE field = 'segments'"
+            ).fetchone()[0]
+        # Loaded from the cache, not fetched again, so it still expires on time
+        assert 1000 == fetched
+
+    def test_invalidate(self):
+        ilo = self.builder()
+        ilo.iterate_filters(self.config())
+        ilo.invalidate_metadata([testvars.named_index])
+        assert not ilo.population_check(testvars.named_index, 'segments')
+        self.builder().iterate_filters(self.config())
+        self.client.indices.stats.assert_called_once()
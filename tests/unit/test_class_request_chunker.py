@@ -0,0 +1,100 @@
+"""Test the request chunker"""
+
+# pylint: disable=C0115, C0116, invalid-name
+from unittest import TestCase
+from unittest.mock import Mock
+
+import pytest
+from elastic_transport import ApiResponseMeta
+from elasticsearch8 import ApiError, BadRequestError
+
+from curator import IndexList
+from curator.chunker import DEFAULT_MAX_BYTES, RequestChunker, encoded_size, too_long
+
+from . import testvars
+
+
+def too_large():
+    return ApiError(
+        'Request Entity Too Large', ApiResponseMeta(413, '1.1', {}, 0.01, None), {}
+    )
+
+
+class TestRequestChunker(TestCase):
+    def test_encoded_size(self):
+        assert 5 == encoded_size('index')
+        assert 11 == encoded_size('<index>')
+
+    def test_too_long(self):
+        assert too_long(too_large())
+        err = BadRequestError(
+            'too_long_http_line_exception',
+            ApiResponseMeta(400, '1.1', {}, 0.01, None),
+            {'error': {'type': 'too_long_http_line_exception'}},
+        )
+        assert too_long(err)
+        assert not too_long(Exception('other'))
+
+    def test_chunks_fit(self):
+        indices = [f'index-{i:04}' for i in range(100)]
+        chunker = RequestChunker(max_bytes=100)
+        chunks = chunker.chunks(indices)
+        # 10 bytes per name, plus a comma between each pair
+        assert [9] * 11 + [1] == [len(chunk) for chunk in chunks]
+        assert indices == [idx for chunk in chunks for idx in chunk]
+        for chunk in chunks:
+            assert len(','.join(chunk)) <= 100
+
+    def test_empty(self):
+        assert not RequestChunker().chunks([])
+
+    def test_call_splits_rejected(self):
+        indices = [f'index-{i:04}' for i in range(100)]
+
+        def func(chunk):
+            if len(','.join(chunk)) > 300:
+                raise too_large()
+            return chunk
+
+        client = Mock()
+        chunker = RequestChunker.for_client(client)
+        results = chunker.call(indices, func)
+        assert indices == [idx for chunk in results for idx in chunk]
+        assert chunker.max_bytes < DEFAULT_MAX_BYTES
+        # The lowered limit is remembered for the cluster
+        assert chunker.max_bytes == RequestChunker.for_client(client).max_bytes
+        assert DEFAULT_MAX_BYTES == RequestChunker.for_client(Mock()).max_bytes
+
+    def test_call_single_index_rejected(self):
+        def func(chunk):
+            raise too_large()
+
+        with pytest.raises(ApiError):
+            RequestChunker().call(['index'], func)
+
+    def test_call_other_error(self):
+        def func(chunk):
+            raise BadRequestError(
+                'bad', ApiResponseMeta(400, '1.1', {}, 0.01, None), {}
+            )
+
+        with pytest.raises(BadRequestError):
+            RequestChunker().call(['index1', 'index2'], func)
+
+
+class TestIndexListTooLong(TestCase):
+    def test_split_retry(self):
+        client = Mock()
+        client.info.return_value = {'version': {'number': '8.0.0'}}
+        client.cat.indices.return_value = testvars.state_two
+        client.cat.aliases.return_value = []
+        ilo = IndexList(client)
+        client.indices.stats.side_effect = [
+            too_large(),
+            testvars.stats_two,
+            testvars.stats_two,
+        ]
+        ilo.get_index_stats()
+        assert 3 == client.indices.stats.call_count
+        assert ilo.chunker.max_bytes < DEFAULT_MAX_BYTES
+        assert 2 == len(ilo.indices)
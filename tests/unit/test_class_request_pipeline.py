@@ -0,0 +1,98 @@
+"""Test the request pipeline"""
+
+# pylint: disable=C0115, C0116, invalid-name
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import pytest
+from elastic_transport import ApiResponseMeta
+from elasticsearch8 import ApiError, NotFoundError
+
+from curator.pipeline import MAX_OVERLOADED_RETRIES, RequestPipeline, overloaded
+
+
+def status(code):
+    return ApiError('busy', ApiResponseMeta(code, '1.1', {}, 0.01, None), {})
+
+
+class TestRequestPipeline(TestCase):
+    def test_overloaded(self):
+        assert overloaded(status(429))
+        assert overloaded(status(503))
+        assert overloaded(Exception('process_cluster_event_timeout_exception'))
+        assert not overloaded(
+            NotFoundError('missing', ApiResponseMeta(404, '1.1', {}, 0.01, None), {})
+        )
+
+    def test_all_chunks(self):
+        func = Mock()
+        pipeline = RequestPipeline(func, max_in_flight=4)
+        chunks = [['a', 'b'], ['c'], ['d', 'e', 'f']]
+        pipeline.run(chunks)
+        called = sorted(call.args[0] for call in func.call_args_list)
+        assert sorted(chunks) == called
+        report = pipeline.report()
+        assert 6 == report['indices']
+        assert 3 == report['requests']
+        assert 0 == report['throttled']
+
+    def test_grows_while_fast(self):
+        pipeline = RequestPipeline(Mock(), max_in_flight=3)
+        pipeline.run([['a'], ['b'], ['c'], ['d'], ['e']])
+        assert 3 == pipeline.limit
+
+    def test_bounded_in_flight(self):
+        lock = threading.Lock()
+        state = {'now': 0, 'most': 0}
+
+        def func(_):
+            with lock:
+                state['now'] += 1
+                state['most'] = max(state['most'], state['now'])
+            with lock:
+                state['now'] -= 1
+
+        pipeline = RequestPipeline(func, max_in_flight=2)
+        pipeline.run([[str(i)] for i in range(20)])
+        assert state['most'] <= 2
+        assert 20 == pipeline.report()['indices']
+
+    def test_shrinks_when_slow(self):
+        pipeline = RequestPipeline(Mock(), max_in_flight=8, timeout=2)
+        pipeline.limit = 8
+        pipeline._acknowledged(['a', 'b'], 1.5)
+        assert 4 == pipeline.limit
+        # Sized to be acknowledged within a second
+        assert 1 == pipeline._size(['a', 'b', 'c'])
+
+    def test_sized_by_latency(self):
+        func = Mock()
+        pipeline = RequestPipeline(func, timeout=2)
+        pipeline.per_index = 0.25
+        pipeline.run([['a', 'b', 'c', 'd', 'e', 'f']])
+        assert [4, 2] == [len(call.args[0]) for call in func.call_args_list]
+
+    @patch('curator.pipeline.time.sleep')
+    def test_overloaded_retried(self, sleep):
+        func = Mock(side_effect=[status(429), None])
+        pipeline = RequestPipeline(func, max_in_flight=4)
+        pipeline.limit = 4
+        pipeline.run([['a']])
+        assert 2 == func.call_count
+        assert 1 == pipeline.report()['throttled']
+        sleep.assert_called_once_with(2)
+
+    @patch('curator.pipeline.time.sleep')
+    def test_overloaded_gives_up(self, _):
+        func = Mock(side_effect=status(503))
+        pipeline = RequestPipeline(func)
+        with pytest.raises(ApiError):
+            pipeline.run([['a']])
+        assert MAX_OVERLOADED_RETRIES + 1 == func.call_count
+
+    def test_other_error_raised(self):
+        func = Mock(side_effect=status(400))
+        with pytest.raises(ApiError):
+            RequestPipeline(func).run([['a']])
+        assert 1 == func.call_count
@@ -0,0 +1,92 @@
+"""Test the index metadata shared by the actions in an action file"""
+
+# pylint: disable=C0115, C0116, invalid-name
+from unittest import TestCase
+from unittest.mock import Mock
+
+from curator import IndexList
+from curator.session import MetadataSession
+
+from . import testvars
+
+CAT_ROWS = [
+    {
+        'index': testvars.named_index,
+        'uuid': 'abc123',
+        'status': 'open',
+        'pri': '2',
+        'rep': '1',
+        'docs.count': '100',
+        'creation.date': '1456963200000',
+    }
+]
+
+
+class TestMetadataSession(TestCase):
+    def setUp(self):
+        self.client = Mock()
+        self.client.info.return_value = {'version': {'number': '8.0.0'}}
+        self.client.cat.indices.return_value = CAT_ROWS
+        self.client.cat.aliases.return_value = []
+        self.client.indices.stats.return_value = testvars.shards
+        self.session = MetadataSession()
+
+    def builder(self):
+        return IndexList(self.client, session=self.session)
+
+    def config(self):
+        return {'filters': [{'filtertype': 'forcemerged', 'max_num_segments': 2}]}
+
+    def test_shared_metadata(self):
+        self.builder().iterate_filters(self.config())
+        listings = self.client.cat.indices.call_count
+        ilo = self.builder()
+        ilo.iterate_filters(self.config())
+        assert listings == self.client.cat.indices.call_count
+        self.client.indices.stats.assert_called_once()
+        assert 71 == ilo.index_info[testvars.named_index]['segments']
+
+    def test_shared_alias_map(self):
+        self.builder().alias_index_check([testvars.named_index])
+        self.builder().alias_index_check([testvars.named_index])
+        self.client.cat.aliases.assert_called_once()
+
+    def test_modifying_action(self):
+        self.builder().iterate_filters(self.config())
+        self.session.action_done('forcemerge', [testvars.named_index])
+        sii = self.session.index_info[testvars.named_index]
+        assert not sii.populated('segments')
+        assert not sii.populated('state')
+        assert 1456963200 == sii['age']['creation_date']
+        self.builder().iterate_filters(self.config())
+        assert 2 == self.client.indices.stats.call_count
+
+    def test_removing_action(self):
+        _ = self.builder().indices
+        self.session.action_done('delete_indices', [testvars.named_index])
+        assert testvars.named_index not in self.session.index_info
+        assert not self.builder().indices
+
+    def test_creating_action(self):
+        _ = self.builder().indices
+        self.session.action_done('create_index')
+        _ = self.builder().indices
+        assert 2 == self.client.cat.indices.call_count
+
+    def test_failed_removing_action(self):
+        self.builder().iterate_filters(self.config())
+        self.session.action_done('delete_indices', failed=True)
+        assert not self.session.index_info
+        assert self.session.alias_map is None
+
+    def test_failed_modifying_action(self):
+        self.builder().iterate_filters(self.config())
+        self.session.action_done('close', failed=True)
+        assert not self.session.index_info
+        self.builder().iterate_filters(self.config())
+        assert 2 == self.client.indices.stats.call_count
+
+    def test_snapshot_action(self):
+        self.builder().alias_index_check([testvars.named_index])
+        self.session.action_done('snapshot', [testvars.named_index])
+        assert self.session.alias_map is not None
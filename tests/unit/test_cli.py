@@ -0,0 +1,57 @@
+"""Test the action-running helpers of the CLI"""
+
+# pylint: disable=C0115, C0116, invalid-name
+from unittest import TestCase
+from unittest.mock import Mock
+
+from curator.cli import invalidate_touched, process_action
+
+
+class TestInvalidateTouched(TestCase):
+    def action_def(self, action):
+        action_def = Mock()
+        action_def.action = action
+        action_def.list_obj.indices = ['index1', 'index2']
+        return action_def
+
+    def test_modifying_action(self):
+        action_def = self.action_def('allocation')
+        invalidate_touched(action_def)
+        action_def.list_obj.invalidate_metadata.assert_called_once_with(
+            ['index1', 'index2']
+        )
+
+    def test_other_action(self):
+        action_def = self.action_def('delete_indices')
+        invalidate_touched(action_def)
+        action_def.list_obj.invalidate_metadata.assert_not_called()
+
+
+class TestProcessAction(TestCase):
+    def action_def(self, options):
+        action_def = Mock()
+        action_def.action = 'open'
+        action_def.action_dict = {}
+        action_def.options = options
+        action_def.filters = []
+        return action_def
+
+    def test_shared_metadata_cache(self):
+        client = Mock()
+        cache = Mock()
+        ttl = {'segments': 60}
+        options = {'metadata_cache': True, 'metadata_cache_ttl': ttl}
+        action_def = self.action_def(options)
+        process_action(client, action_def, dry_run=True, metadata_cache=cache)
+        # The cache of the run is reused, rather than built again for the action
+        client.info.assert_not_called()
+        cache.with_ttl.assert_called_once_with(ttl)
+        kwargs = action_def.instantiate.call_args_list[0].kwargs
+        assert cache.with_ttl.return_value is kwargs['metadata_cache']
+
+    def test_metadata_cache_disabled(self):
+        cache = Mock()
+        action_def = self.action_def({'metadata_cache': False})
+        process_action(Mock(), action_def, dry_run=True, metadata_cache=cache)
+        cache.with_ttl.assert_not_called()
+        assert action_def.instantiate.call_args_list[0].kwargs['metadata_cache'] is None
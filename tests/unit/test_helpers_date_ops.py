@@ -8,7 +8,8 @@ from elastic_transport import ApiResponseMeta
 from curator.exceptions import ConfigurationError
 from curator.helpers.date_ops import (
     absolute_date_range, date_range, datetime_to_epoch, fix_epoch, get_date_regex, get_datemath,
-    get_point_of_reference, isdatemath
+    get_datetime, get_point_of_reference, isdatemath, iso2epoch, timestring_epoch, EpochIndex,
+    TimestringSearch
 )
 
 class TestGetDateRegex(TestCase):
@@ -649,3 +650,116 @@ class TestGetDateMath(TestCase):
         effect = NotFoundError(msg, meta, body)
         client.indices.get.side_effect = effect
         self.assertRaises(ConfigurationError, get_datemath, client, datemath)
+
+class TestTimestringEpoch(TestCase):
+    """TestTimestringEpoch
+
+    Test helpers.date_ops.timestring_epoch functionality.
+    """
+    def test_same_as_strptime(self):
+        """test_same_as_strptime
+
+        The fast path should agree with get_datetime for every supported form
+        """
+        for timestring, stamp in [
+            ('%Y.%m.%d', '2017.03.07'),
+            ('%Y-%m-%d', '2017-03-07'),
+            ('%Y.%m.%d.%H', '2017.03.07.13'),
+            ('%Y.%m', '2017.03'),
+            ('%y.%m.%d', '17.03.07'),
+            ('%y.%m.%d', '70.03.07'),
+            ('%G.%V', '2015.01'),
+            ('%G-%V', '2009-53'),
+            ('%Y.%W', '2017.00'),
+        ]:
+            expected = datetime_to_epoch(get_datetime(stamp, timestring))
+            assert expected == timestring_epoch(stamp, timestring)
+
+    def test_invalid_week(self):
+        """test_invalid_week
+
+        A week number the fast path rejects should fall back to get_datetime
+        """
+        expected = datetime_to_epoch(get_datetime('2015.53', '%G.%V'))
+        assert expected == timestring_epoch('2015.53', '%G.%V')
+
+    def test_invalid_date(self):
+        """test_invalid_date
+
+        Should raise ValueError, just as strptime does
+        """
+        with pytest.raises(ValueError):
+            timestring_epoch('2017.13.01', '%Y.%m.%d')
+
+    def test_cached(self):
+        """test_cached
+
+        Repeated date strings should be read only once
+        """
+        timestring_epoch.cache_clear()
+        tstr = TimestringSearch('%Y.%m.%d')
+        for name in ['a-2017.03.07', 'b-2017.03.07', 'c-2017.03.07']:
+            assert 1488844800 == tstr.get_epoch(name)
+        assert 2 == timestring_epoch.cache_info().hits
+
+class TestIso2Epoch(TestCase):
+    """TestIso2Epoch
+
+    Test helpers.date_ops.iso2epoch functionality.
+    """
+    def test_zulu(self):
+        """test_zulu
+
+        Should read an ISO8601 timestamp ending with Z as UTC
+        """
+        assert 1456963206 == iso2epoch('2016-03-03T00:00:06.189Z')
+
+    def test_epoch_millis(self):
+        """test_epoch_millis
+
+        Should read epoch milliseconds as epoch seconds
+        """
+        assert 1456963206 == iso2epoch('1456963206189')
+
+EPOCH_AGES = {'a': 100, 'b': 200, 'c': 200, 'd': 300}
+
+class TestEpochIndex(TestCase):
+    """TestEpochIndex
+
+    Test helpers.date_ops.EpochIndex functionality.
+    """
+    def test_older(self):
+        """test_older
+
+        Should return only the names before the epoch
+        """
+        epochs = EpochIndex(EPOCH_AGES)
+        assert {'a'} == epochs.older(200)
+        assert set() == epochs.older(100)
+
+    def test_younger(self):
+        """test_younger
+
+        Should return only the names after the epoch
+        """
+        epochs = EpochIndex(EPOCH_AGES)
+        assert {'d'} == epochs.younger(200)
+        assert set() == epochs.younger(300)
+
+    def test_between(self):
+        """test_between
+
+        Should include the names at both ends of the range
+        """
+        epochs = EpochIndex(EPOCH_AGES)
+        assert {'b', 'c', 'd'} == epochs.between(200, 300)
+        assert set() == epochs.between(101, 199)
+
+    def test_ordered(self):
+        """test_ordered
+
+        Should order by age, then by name, and only return the names asked for
+        """
+        epochs = EpochIndex(EPOCH_AGES)
+        assert ['a', 'b', 'c', 'd'] == epochs.ordered()
+        assert ['d', 'c', 'a'] == epochs.ordered(['a', 'c', 'd'], reverse=True)
@@ -13,6 +13,7 @@ from curator.helpers.utils import (
     to_csv,
     multitarget_fix,
     multitarget_match,
+    multitarget_regex,
 )
 from . import testvars
 
@@ -38,7 +39,7 @@ class TestShowDryRun(TestCase):
         client.cat.indices.return_value = testvars.state_two
         client.indices.get_settings.return_value = testvars.settings_two
         client.indices.stats.return_value = testvars.stats_two
-        client.indices.exists_alias.return_value = False
+        client.cat.aliases.return_value = []
         client.field_stats.return_value = testvars.fieldstats_two
         ilst = IndexList(client)
         assert None is show_dry_run(ilst, 'test_action')
@@ -196,3 +197,13 @@ class TestMultiTarget(TestCase):
         that contains a wildcard
         """
         assert ['index2', 'not-index2'] == multitarget_match('*2', self.COMPLEX)
+
+    def test_multitarget_match_compiled_once(self):
+        """test_multitarget_match_compiled_once
+
+        The same pattern should be compiled only once across calls
+        """
+        multitarget_regex.cache_clear()
+        multitarget_match('index*,-*3', self.SIMPLE)
+        assert ['index1', 'index2'] == multitarget_match('index*,-*3', self.SIMPLE)
+        assert 1 == multitarget_regex.cache_info().hits
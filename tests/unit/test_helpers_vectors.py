@@ -0,0 +1,70 @@
+"""Unit tests for vectorized comparisons"""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+import pytest
+
+from curator.helpers import vectors
+from curator.helpers.vectors import compare, running_total
+
+VALUES = [1, 5, 10, 15]
+
+
+class TestCompare(TestCase):
+    """TestCompare
+
+    Test helpers.vectors.compare functionality, without NumPy
+    """
+
+    def setUp(self):
+        patcher = patch.object(vectors, 'HAS_NUMPY', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_behaviors(self):
+        """test_behaviors
+
+        Each behavior should compare every value with the threshold
+        """
+        assert [False, False, False, True] == compare(VALUES, 'greater_than', 10)
+        assert [False, False, True, True] == compare(
+            VALUES, 'greater_than_or_equal', 10
+        )
+        assert [True, True, False, False] == compare(VALUES, 'less_than', 10)
+        assert [True, True, True, False] == compare(VALUES, 'less_than_or_equal', 10)
+        assert [False, False, True, False] == compare(VALUES, 'equal', 10)
+
+    def test_threshold_list(self):
+        """test_threshold_list
+
+        Should compare each value with its own threshold
+        """
+        assert [True, False, True, False] == compare(
+            VALUES, 'greater_than', [0, 5, 5, 20]
+        )
+
+    def test_invalid_behavior(self):
+        """test_invalid_behavior
+
+        Should raise ValueError for an unknown behavior
+        """
+        with pytest.raises(ValueError):
+            compare(VALUES, 'bigger', 10)
+
+    def test_running_total(self):
+        """test_running_total
+
+        Should sum each value with all of the values before it
+        """
+        assert [1, 6, 16, 31] == running_total(VALUES)
+
+
+class TestCompareNumpy(TestCompare):
+    """TestCompareNumpy
+
+    Test helpers.vectors.compare functionality, with NumPy
+    """
+
+    def setUp(self):
+        pytest.importorskip('numpy')
@@ -1,7 +1,7 @@
 """Unit tests for utils"""
 
 from unittest import TestCase
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import pytest
 from curator.exceptions import (
     ActionTimeout,
@@ -11,6 +11,7 @@ from curator.exceptions import (
 )
 from curator.helpers.waiters import (
     health_check,
+    relocate_check,
     restore_check,
     snapshot_check,
     task_check,
@@ -19,6 +20,16 @@ from curator.helpers.waiters import (
 
 FAKE_FAIL = Exception('Simulated Failure')
 
+RELOCATE_STATE = {
+    'routing_table': {
+        'indices': {
+            'index.1': {
+                'shards': {'0': [{'state': 'STARTED'}, {'state': 'RELOCATING'}]}
+            }
+        }
+    }
+}
+
 
 class TestHealthCheck(TestCase):
     """TestHealthCheck
@@ -85,6 +96,49 @@ class TestHealthCheck(TestCase):
         with pytest.raises(ConfigurationError, match=r'not in cluster health output'):
             health_check(client, foo='bar')
 
+    def test_index_scoped(self):
+        """test_index_scoped
+
+        Should check the health of only the given index.
+        """
+        client = Mock()
+        client.cluster.health.return_value = self.CLUSTER_HEALTH
+        assert health_check(client, index='my_index', status='green')
+        assert 'my_index' == client.cluster.health.call_args.kwargs['index']
+
+
+class TestRelocateCheck(TestCase):
+    """TestRelocateCheck
+
+    Test helpers.waiters.relocate_check functionality
+    """
+
+    def test_relocating(self):
+        """test_relocating
+
+        Should return ``False`` while a shard copy is relocating, having requested
+        only the shard states of the index
+        """
+        client = Mock()
+        client.cluster.state.return_value = RELOCATE_STATE
+        assert not relocate_check(client, 'index.1')
+        client.cluster.state.assert_called_once_with(
+            metric='routing_table',
+            index='index.1',
+            filter_path='routing_table.indices.index\\.1.shards.*.state',
+        )
+
+    def test_full_response(self):
+        """test_full_response
+
+        Should not filter the response when filter paths are disabled
+        """
+        client = Mock()
+        client.cluster.state.return_value = RELOCATE_STATE
+        with patch('curator.defaults.filter_paths.ENABLED', False):
+            relocate_check(client, 'index.1')
+        assert client.cluster.state.call_args.kwargs['filter_path'] is None
+
 
 class TestRestoreCheck(TestCase):
     """TestRestoreCheck
@@ -257,6 +257,19 @@ settings_two  = {
     }
 }
 
+cat_two = [
+    {
+        'index': 'index-2016.03.03', 'status': 'open', 'pri': '5', 'rep': '1',
+        'docs.count': '3187481', 'store.size': '1115219663',
+        'pri.store.size': '557951789', 'creation.date': '1456963200172',
+    },
+    {
+        'index': 'index-2016.03.04', 'status': 'open', 'pri': '5', 'rep': '1',
+        'docs.count': '3188772', 'store.size': '1120891046',
+        'pri.store.size': '560677114', 'creation.date': '1457049600812',
+    },
+]
+
 settings_2_get_aliases = {
     "index-2016.03.03": { "aliases" : { 'my_alias' : { } } },
     "index-2016.03.04": { "aliases" : { 'my_alias' : { } } },
@@ -552,12 +565,8 @@ fieldstats_query = {
     }
 }
 
-shards         = { 'indices': { named_index: { 'shards': {
-        '0': [ { 'num_search_segments' : 15 }, { 'num_search_segments' : 21 } ],
-        '1': [ { 'num_search_segments' : 19 }, { 'num_search_segments' : 16 } ] }}}}
-fm_shards      = { 'indices': { named_index: { 'shards': {
-        '0': [ { 'num_search_segments' : 1 }, { 'num_search_segments' : 1 } ],
-        '1': [ { 'num_search_segments' : 1 }, { 'num_search_segments' : 1 } ] }}}}
+shards         = { 'indices': { named_index: { 'total': { 'segments': { 'count': 71 } } } } }
+fm_shards      = { 'indices': { named_index: { 'total': { 'segments': { 'count': 4 } } } } }
 
 loginfo        =    {   "loglevel": "INFO",
                         "logfile": None,